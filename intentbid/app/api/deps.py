@@ -1,6 +1,9 @@
-from fastapi import Depends, Header, HTTPException, status
+from datetime import datetime
+
+from fastapi import Depends, Header, HTTPException, Query, status
 from sqlmodel import Session
 
+from intentbid.app.core.pagination import decode_cursor
 from intentbid.app.db.models import Buyer, Vendor
 from intentbid.app.db.session import get_session
 from intentbid.app.services.buyer_service import get_buyer_by_api_key
@@ -44,3 +47,12 @@ def optional_buyer(
     if not buyer:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
     return buyer
+
+
+def page_cursor(cursor: str | None = Query(None)) -> tuple[datetime, int] | None:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session
 
-from intentbid.app.api.deps import require_buyer
+from intentbid.app.api.deps import page_cursor, require_buyer
 from intentbid.app.core.schemas import (
     BestOffer,
     BuyerMeResponse,
@@ -81,10 +81,12 @@ def buyer_rfo_list(
     deadline_max: int | None = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor=Depends(page_cursor),
+    include_total: str = Query("exact", pattern="^(false|estimate|exact)$"),
     buyer=Depends(require_buyer),
     session: Session = Depends(get_session),
 ) -> RFOListResponse:
-    rfos, total = list_rfos(
+    rfos, total, next_cursor = list_rfos(
         session,
         status=status,
         category=category,
@@ -94,6 +96,8 @@ def buyer_rfo_list(
         buyer_id=buyer.id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     items = [
@@ -114,4 +118,6 @@ def buyer_rfo_list(
         for rfo in rfos
     ]
 
-    return RFOListResponse(items=items, total=total, limit=limit, offset=offset)
+    return RFOListResponse(
+        items=items, total=total, limit=limit, offset=offset, next_cursor=next_cursor
+    )
@@ -2,10 +2,21 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
 
 from intentbid.app.api.deps import require_vendor
-from intentbid.app.core.schemas import OfferCreate, OfferCreateResponse
+from intentbid.app.core.config import settings
+from intentbid.app.core.schemas import (
+    OfferBatchItemResult,
+    OfferBatchRequest,
+    OfferBatchResponse,
+    OfferCreate,
+    OfferCreateResponse,
+)
 from intentbid.app.db.models import RFO
 from intentbid.app.db.session import get_session
-from intentbid.app.services.offer_service import create_offer, validate_offer_submission
+from intentbid.app.services.offer_service import (
+    create_offer,
+    create_offers_batch,
+    validate_offer_submission,
+)
 
 router = APIRouter(prefix="/v1/offers", tags=["offers"])
 
@@ -28,3 +39,34 @@ def submit_offer(
 
     offer = create_offer(session, vendor.id, payload)
     return OfferCreateResponse(offer_id=offer.id)
+
+
+@router.post(":batch", response_model=OfferBatchResponse)
+def submit_offers_batch(
+    payload: OfferBatchRequest,
+    session: Session = Depends(get_session),
+    vendor=Depends(require_vendor),
+) -> OfferBatchResponse:
+    if len(payload.offers) > settings.offer_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch exceeds {settings.offer_batch_max_items} offers",
+        )
+
+    results = [
+        OfferBatchItemResult(
+            index=index,
+            offer_id=offer_id,
+            status_code=status_code,
+            detail=detail,
+        )
+        for index, (offer_id, status_code, detail) in enumerate(
+            create_offers_batch(session, vendor.id, payload.offers)
+        )
+    ]
+    accepted = sum(1 for result in results if result.offer_id is not None)
+    return OfferBatchResponse(
+        accepted=accepted,
+        rejected=len(results) - accepted,
+        results=results,
+    )
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlmodel import Session, select
 
-from intentbid.app.api.deps import optional_buyer, require_buyer
+from intentbid.app.api.deps import optional_buyer, page_cursor, require_buyer
 from intentbid.app.core.schemas import (
     BestOffer,
     BestOffersResponse,
@@ -21,7 +21,12 @@ from intentbid.app.core.schemas import (
 )
 from intentbid.app.db.models import Offer, RFO
 from intentbid.app.db.session import get_session
-from intentbid.app.services.ranking_service import get_best_offers, get_ranked_offers
+from intentbid.app.services.ranking_service import (
+    get_best_offers,
+    get_ranked_offers,
+    has_fresh_scores,
+    rescore_rfo_offers_job,
+)
 from intentbid.app.services.rfo_service import (
     award_rfo,
     close_rfo,
@@ -70,9 +75,11 @@ def list_rfos_route(
     deadline_max: int | None = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor=Depends(page_cursor),
+    include_total: str = Query("exact", pattern="^(false|estimate|exact)$"),
     session: Session = Depends(get_session),
 ) -> RFOListResponse:
-    rfos, total = list_rfos(
+    rfos, total, next_cursor = list_rfos(
         session,
         status=status,
         category=category,
@@ -81,6 +88,8 @@ def list_rfos_route(
         deadline_max=deadline_max,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     items = [
@@ -101,7 +110,9 @@ def list_rfos_route(
         for rfo in rfos
     ]
 
-    return RFOListResponse(items=items, total=total, limit=limit, offset=offset)
+    return RFOListResponse(
+        items=items, total=total, limit=limit, offset=offset, next_cursor=next_cursor
+    )
 
 
 @router.get("/{rfo_id}", response_model=RFODetailResponse)
@@ -136,6 +147,7 @@ def get_rfo_route(
 def update_rfo_route(
     rfo_id: int,
     payload: RFOUpdateRequest,
+    background_tasks: BackgroundTasks,
     buyer=Depends(require_buyer),
     session: Session = Depends(get_session),
 ) -> RFODetailResponse:
@@ -147,6 +159,8 @@ def update_rfo_route(
         raise HTTPException(status_code=403, detail="Buyer does not own this RFO")
     if error == "invalid":
         raise HTTPException(status_code=400, detail="RFO must be OPEN to update")
+    if not has_fresh_scores(rfo):
+        background_tasks.add_task(rescore_rfo_offers_job, session.get_bind(), rfo_id)
 
     rfo, offers_count = get_rfo_with_offers_count(session, rfo_id)
     if not rfo:
@@ -284,6 +298,7 @@ def get_rfo_ranking_explain(
 def update_rfo_scoring(
     rfo_id: int,
     payload: RFOScoringUpdateRequest,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
 ) -> RFOScoringUpdateResponse:
     rfo = update_rfo_scoring_config(
@@ -294,6 +309,8 @@ def update_rfo_scoring(
     )
     if not rfo:
         raise HTTPException(status_code=404, detail="RFO not found")
+    if not has_fresh_scores(rfo):
+        background_tasks.add_task(rescore_rfo_offers_job, session.get_bind(), rfo_id)
     return RFOScoringUpdateResponse(
         rfo_id=rfo.id,
         scoring_version=rfo.scoring_version,
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, select
 
-from intentbid.app.api.deps import require_vendor
+from intentbid.app.api.deps import page_cursor, require_vendor
 from intentbid.app.core.schemas import (
     RFOListItem,
     VendorKeyCreateResponse,
@@ -125,11 +125,17 @@ def create_vendor_webhook(
     vendor=Depends(require_vendor),
     session: Session = Depends(get_session),
 ) -> VendorWebhookCreateResponse:
-    webhook = register_vendor_webhook(session, vendor.id, payload.url)
+    webhook = register_vendor_webhook(
+        session,
+        vendor.id,
+        payload.url,
+        batch_max_events=payload.batch_max_events,
+    )
     return VendorWebhookCreateResponse(
         webhook_id=webhook.id,
         url=webhook.url,
         secret=webhook.secret,
+        batch_max_events=webhook.batch_max_events,
     )
 
 
@@ -164,10 +170,13 @@ def get_onboarding_status(
 def vendor_offers_list(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor=Depends(page_cursor),
     vendor=Depends(require_vendor),
     session: Session = Depends(get_session),
 ) -> VendorOfferListResponse:
-    rows, total = list_vendor_offers(session, vendor.id, limit=limit, offset=offset)
+    rows, total, next_cursor = list_vendor_offers(
+        session, vendor.id, limit=limit, offset=offset, cursor=cursor
+    )
     items = [
         VendorOfferListItem(
             offer_id=offer.id,
@@ -191,17 +200,22 @@ def vendor_offers_list(
         )
         for offer, rfo in rows
     ]
-    return VendorOfferListResponse(items=items, total=total, limit=limit, offset=offset)
+    return VendorOfferListResponse(
+        items=items, total=total, limit=limit, offset=offset, next_cursor=next_cursor
+    )
 
 
 @router.get("/me/matches", response_model=VendorMatchesResponse)
 def vendor_matches(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    sort: str = Query("recent", pattern="^(recent|match_score)$"),
     vendor=Depends(require_vendor),
     session: Session = Depends(get_session),
 ) -> VendorMatchesResponse:
-    matches, total = list_vendor_matches(session, vendor.id, limit=limit, offset=offset)
+    matches, total = list_vendor_matches(
+        session, vendor.id, limit=limit, offset=offset, sort=sort
+    )
     items = [
         VendorMatchItem(
             rfo=RFOListItem(
@@ -219,7 +233,8 @@ def vendor_matches(
                 created_at=rfo.created_at,
             ),
             reasons=reasons,
+            match_score=score,
         )
-        for rfo, reasons in matches
+        for rfo, reasons, score in matches
     ]
     return VendorMatchesResponse(items=items, total=total, limit=limit, offset=offset)
@@ -7,6 +7,37 @@ class Settings(BaseSettings):
     env: str = "dev"
     max_offers_per_vendor_rfo: int = 5
     offer_cooldown_seconds: int = 0
+    offer_batch_max_items: int = 500
+    ranking_backend: str = "python"
+    matching_backend: str = "sql"
+    match_index_refresh_seconds: float = 60.0
+    ranking_cache_enabled: bool = False
+    ranking_cache_ttl_seconds: int = 300
+    ranking_cache_max_entries: int = 1024
+    ranking_cache_fetch_batch: int = 200
+    auth_cache_enabled: bool = True
+    auth_cache_ttl_seconds: float = 30.0
+    auth_cache_max_entries: int = 10000
+    auth_negative_cache_max_entries: int = 10000
+    rfo_count_cache_ttl_seconds: float = 5.0
+    rfo_count_cache_max_entries: int = 1024
+    api_key_usage_flush_seconds: float = 5.0
+    rescore_batch_size: int = 1000
+    scorer_cache_size: int = 4096
+    webhook_timeout_seconds: float = 5.0
+    webhook_max_concurrency: int = 200
+    webhook_max_concurrency_per_host: int = 20
+    webhook_commit_batch_size: int = 500
+    webhook_retry_base_seconds: float = 60.0
+    webhook_retry_max_seconds: float = 900.0
+    webhook_circuit_failure_threshold: int = 5
+    webhook_circuit_open_seconds: float = 60.0
+    webhook_circuit_max_open_seconds: float = 3600.0
+    outbox_batch_size: int = 200
+    outbox_lease_seconds: int = 60
+    outbox_poll_interval_seconds: float = 1.0
+    outbox_retention_days: int = 30
+    outbox_retention_chunk_size: int = 1000
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -10,11 +10,15 @@ from fastapi import Request, Response
 class MetricsCollector:
     def __init__(self) -> None:
         self._counts: dict[str, int] = {}
+        self._readers: dict[str, tuple[str, Callable[[], float]]] = {}
 
     def record(self, method: str, path: str, status_code: int) -> None:
         key = f"{method}:{path}:{status_code}"
         self._counts[key] = self._counts.get(key, 0) + 1
 
+    def register(self, name: str, metric_type: str, read: Callable[[], float]) -> None:
+        self._readers[name] = (metric_type, read)
+
     def render(self) -> str:
         lines = ["# TYPE http_requests_total counter"]
         for key, value in sorted(self._counts.items()):
@@ -23,6 +27,9 @@ class MetricsCollector:
                 'http_requests_total{method="%s",path="%s",status="%s"} %d'
                 % (method, path, status, value)
             )
+        for name, (metric_type, read) in sorted(self._readers.items()):
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {read():g}")
         return "\n".join(lines) + "\n"
 
 
@@ -49,12 +49,14 @@ class BuyerMeResponse(BaseModel):
 
 class VendorWebhookCreateRequest(BaseModel):
     url: str
+    batch_max_events: int = Field(default=1, ge=1, le=500)
 
 
 class VendorWebhookCreateResponse(BaseModel):
     webhook_id: int
     url: str
     secret: str
+    batch_max_events: int
 
 
 class VendorOnboardingStatusResponse(BaseModel):
@@ -217,9 +219,10 @@ class RFOListItem(BaseModel):
 
 class RFOListResponse(BaseModel):
     items: list[RFOListItem]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class RFORequestSummary(BaseModel):
@@ -247,14 +250,16 @@ class VendorOfferListItem(BaseModel):
 
 class VendorOfferListResponse(BaseModel):
     items: list[VendorOfferListItem]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class VendorMatchItem(BaseModel):
     rfo: RFOListItem
     reasons: list[str]
+    match_score: float
 
 
 class VendorMatchesResponse(BaseModel):
@@ -279,6 +284,23 @@ class OfferCreateResponse(BaseModel):
     offer_id: int
 
 
+class OfferBatchRequest(BaseModel):
+    offers: list[OfferCreate] = Field(min_length=1)
+
+
+class OfferBatchItemResult(BaseModel):
+    index: int
+    offer_id: int | None = None
+    status_code: int
+    detail: str | None = None
+
+
+class OfferBatchResponse(BaseModel):
+    accepted: int
+    rejected: int
+    results: list[OfferBatchItemResult]
+
+
 class OfferPublic(BaseModel):
     id: int
     rfo_id: int
@@ -1,61 +1,212 @@
-from typing import Any, Dict
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Sequence
 
+from intentbid.app.core.config import settings
 from intentbid.app.db.models import Offer, RFO
 
+DEFAULT_SCORING_VERSION = "v1"
+
 
 def _clamp01(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
-def score_offer(offer: Offer, rfo: RFO) -> tuple[float, Dict[str, Any]]:
-    constraints = rfo.constraints or {}
-    preferences = rfo.preferences or {}
-    weights = rfo.weights or preferences
-    penalties = []
+def resolve_weights(rfo: RFO) -> tuple[float, float, float]:
+    weights = rfo.weights or rfo.preferences or {}
+    return (
+        float(weights.get("w_price", 0.5)),
+        float(weights.get("w_delivery", 0.3)),
+        float(weights.get("w_warranty", 0.2)),
+    )
 
-    budget_max = constraints.get("budget_max")
-    deadline = constraints.get("delivery_deadline_days")
 
-    if budget_max is not None and offer.price_amount > budget_max:
-        penalties.append("over_budget")
-    if offer.stock is False:
-        penalties.append("out_of_stock")
-    if deadline is not None and offer.delivery_eta_days > deadline:
-        penalties.append("late_delivery")
+def scoring_config_hash(rfo: RFO) -> str:
+    constraints = rfo.constraints or {}
+    config = {
+        "weights": resolve_weights(rfo),
+        "budget_max": constraints.get("budget_max"),
+        "delivery_deadline_days": constraints.get("delivery_deadline_days"),
+    }
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
-    if penalties:
-        return 0, {"penalties": penalties}
 
-    price_score = 0.0
-    if budget_max:
-        price_score = _clamp01(1 - (offer.price_amount / budget_max))
+def scoring_config_version(rfo: RFO) -> str:
+    return f"{rfo.scoring_version}:{scoring_config_hash(rfo)}"
 
-    delivery_score = 0.0
-    if deadline:
-        delivery_score = _clamp01(1 - (offer.delivery_eta_days / deadline))
 
-    warranty_score = _clamp01(offer.warranty_months / 24)
+@dataclass(frozen=True)
+class CompiledScorer:
+    version: str
+    budget_max: float | None
+    deadline: float | None
+    w_price: float
+    w_delivery: float
+    w_warranty: float
 
-    w_price = float(weights.get("w_price", 0.5))
-    w_delivery = float(weights.get("w_delivery", 0.3))
-    w_warranty = float(weights.get("w_warranty", 0.2))
+    def penalties(self, price: float, eta: int, stock: bool) -> list[str]:
+        penalties = []
+        if self.budget_max is not None and price > self.budget_max:
+            penalties.append("over_budget")
+        if stock is False:
+            penalties.append("out_of_stock")
+        if self.deadline is not None and eta > self.deadline:
+            penalties.append("late_delivery")
+        return penalties
 
-    score = (w_price * price_score) + (w_delivery * delivery_score) + (w_warranty * warranty_score)
+    def components(self, price: float, eta: int, warranty: int) -> tuple[float, float, float]:
+        price_score = _clamp01(1 - (price / self.budget_max)) if self.budget_max else 0.0
+        delivery_score = _clamp01(1 - (eta / self.deadline)) if self.deadline else 0.0
+        warranty_score = _clamp01(warranty / 24)
+        return price_score, delivery_score, warranty_score
 
-    explain = {
-        "price_score": price_score,
-        "delivery_score": delivery_score,
-        "warranty_score": warranty_score,
-        "components": {
+    def score(self, offer: Offer) -> tuple[float, Dict[str, Any]]:
+        penalties = self.penalties(offer.price_amount, offer.delivery_eta_days, offer.stock)
+        if penalties:
+            return 0, {"penalties": penalties}
+
+        price_score, delivery_score, warranty_score = self.components(
+            offer.price_amount, offer.delivery_eta_days, offer.warranty_months
+        )
+        score = (
+            (self.w_price * price_score)
+            + (self.w_delivery * delivery_score)
+            + (self.w_warranty * warranty_score)
+        )
+        explain = {
             "price_score": price_score,
             "delivery_score": delivery_score,
             "warranty_score": warranty_score,
-        },
-        "weights": {
-            "w_price": w_price,
-            "w_delivery": w_delivery,
-            "w_warranty": w_warranty,
-        },
-        "penalties": penalties,
-    }
-    return score, explain
+            "components": {
+                "price_score": price_score,
+                "delivery_score": delivery_score,
+                "warranty_score": warranty_score,
+            },
+            "weights": {
+                "w_price": self.w_price,
+                "w_delivery": self.w_delivery,
+                "w_warranty": self.w_warranty,
+            },
+            "penalties": penalties,
+        }
+        return score, explain
+
+    def score_batch(
+        self,
+        prices: Sequence[float],
+        etas: Sequence[int],
+        warranties: Sequence[int],
+        stocks: Sequence[bool],
+    ) -> list[float]:
+        budget_max = self.budget_max
+        deadline = self.deadline
+        w_price = self.w_price
+        w_delivery = self.w_delivery
+        w_warranty = self.w_warranty
+
+        scores: list[float] = []
+        append = scores.append
+        for price, eta, warranty, stock in zip(prices, etas, warranties, stocks):
+            if (
+                (budget_max is not None and price > budget_max)
+                or stock is False
+                or (deadline is not None and eta > deadline)
+            ):
+                append(0)
+                continue
+
+            price_score = _clamp01(1 - (price / budget_max)) if budget_max else 0.0
+            delivery_score = _clamp01(1 - (eta / deadline)) if deadline else 0.0
+            warranty_score = _clamp01(warranty / 24)
+            append(
+                (w_price * price_score)
+                + (w_delivery * delivery_score)
+                + (w_warranty * warranty_score)
+            )
+        return scores
+
+
+def compile_v1_scorer(rfo: RFO) -> CompiledScorer:
+    constraints = rfo.constraints or {}
+    w_price, w_delivery, w_warranty = resolve_weights(rfo)
+    return CompiledScorer(
+        version="v1",
+        budget_max=constraints.get("budget_max"),
+        deadline=constraints.get("delivery_deadline_days"),
+        w_price=w_price,
+        w_delivery=w_delivery,
+        w_warranty=w_warranty,
+    )
+
+
+SCORER_REGISTRY: Dict[str, Callable[[RFO], CompiledScorer]] = {
+    "v1": compile_v1_scorer,
+}
+
+
+def register_scorer(version: str, compiler: Callable[[RFO], CompiledScorer]) -> None:
+    SCORER_REGISTRY[version] = compiler
+    clear_scorer_cache()
+
+
+def compile_scorer(rfo: RFO) -> CompiledScorer:
+    compiler = SCORER_REGISTRY.get(rfo.scoring_version)
+    if compiler is None:
+        compiler = SCORER_REGISTRY[DEFAULT_SCORING_VERSION]
+    return compiler(rfo)
+
+
+ScorerKey = tuple[int | None, str, tuple[float, float, float], Any, Any]
+
+_scorer_cache: OrderedDict[ScorerKey, CompiledScorer] = OrderedDict()
+_scorer_cache_lock = threading.Lock()
+
+
+def _scorer_cache_key(rfo: RFO) -> ScorerKey:
+    constraints = rfo.constraints or {}
+    return (
+        rfo.id,
+        rfo.scoring_version,
+        resolve_weights(rfo),
+        constraints.get("budget_max"),
+        constraints.get("delivery_deadline_days"),
+    )
+
+
+def get_scorer(rfo: RFO) -> CompiledScorer:
+    key = _scorer_cache_key(rfo)
+    with _scorer_cache_lock:
+        scorer = _scorer_cache.get(key)
+        if scorer is not None:
+            _scorer_cache.move_to_end(key)
+            return scorer
+
+    scorer = compile_scorer(rfo)
+    with _scorer_cache_lock:
+        _scorer_cache[key] = scorer
+        while len(_scorer_cache) > settings.scorer_cache_size:
+            _scorer_cache.popitem(last=False)
+    return scorer
+
+
+def clear_scorer_cache() -> None:
+    with _scorer_cache_lock:
+        _scorer_cache.clear()
+
+
+def score_offer(offer: Offer, rfo: RFO) -> tuple[float, Dict[str, Any]]:
+    return get_scorer(rfo).score(offer)
+
+
+def score_offers_batch(
+    rfo: RFO,
+    prices: Sequence[float],
+    etas: Sequence[int],
+    warranties: Sequence[int],
+    stocks: Sequence[bool],
+) -> list[float]:
+    return get_scorer(rfo).score_batch(prices, etas, warranties, stocks)
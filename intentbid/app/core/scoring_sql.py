@@ -0,0 +1,43 @@
+from sqlalchemy import Float, case, cast, literal, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from intentbid.app.core.scoring import get_scorer
+from intentbid.app.db.models import Offer, RFO
+
+
+def _clamp01_expr(value: ColumnElement) -> ColumnElement:
+    return case((value < 0.0, 0.0), (value > 1.0, 1.0), else_=value)
+
+
+def _ratio_expr(column, divisor: float) -> ColumnElement:
+    return cast(column, Float) / literal(float(divisor), Float)
+
+
+def build_score_expression(rfo: RFO) -> ColumnElement:
+    scorer = get_scorer(rfo)
+    budget_max = scorer.budget_max
+    deadline = scorer.deadline
+    w_price, w_delivery, w_warranty = scorer.w_price, scorer.w_delivery, scorer.w_warranty
+
+    penalties = [Offer.stock.is_(False)]
+    if budget_max is not None:
+        penalties.append(Offer.price_amount > budget_max)
+    if deadline is not None:
+        penalties.append(Offer.delivery_eta_days > deadline)
+
+    price_score = literal(0.0, Float)
+    if budget_max:
+        price_score = _clamp01_expr(1.0 - _ratio_expr(Offer.price_amount, budget_max))
+
+    delivery_score = literal(0.0, Float)
+    if deadline:
+        delivery_score = _clamp01_expr(1.0 - _ratio_expr(Offer.delivery_eta_days, deadline))
+
+    warranty_score = _clamp01_expr(_ratio_expr(Offer.warranty_months, 24))
+
+    weighted = (
+        (literal(w_price, Float) * price_score)
+        + (literal(w_delivery, Float) * delivery_score)
+        + (literal(w_warranty, Float) * warranty_score)
+    )
+    return case((or_(*penalties), literal(0.0, Float)), else_=weighted)
@@ -0,0 +1,41 @@
+"""Persist offer scores
+
+Revision ID: 0013_offer_score
+Revises: 0012_vendor_profile
+Create Date: 2024-01-01 00:00:12.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0013_offer_score"
+down_revision = "0012_vendor_profile"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("offer") as batch_op:
+        batch_op.add_column(sa.Column("score", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("score_version", sa.String(), nullable=True))
+
+    with op.batch_alter_table("rfo") as batch_op:
+        batch_op.add_column(sa.Column("offer_score_version", sa.String(), nullable=True))
+
+    op.create_index(
+        "ix_offer_rfo_id_score",
+        "offer",
+        ["rfo_id", sa.text("score DESC"), "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_offer_rfo_id_score", table_name="offer")
+
+    with op.batch_alter_table("rfo") as batch_op:
+        batch_op.drop_column("offer_score_version")
+
+    with op.batch_alter_table("offer") as batch_op:
+        batch_op.drop_column("score_version")
+        batch_op.drop_column("score")
@@ -0,0 +1,87 @@
+"""Add vendor profile term index
+
+Revision ID: 0014_vendor_profile_term
+Revises: 0013_offer_score
+Create Date: 2024-01-01 00:00:13.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0014_vendor_profile_term"
+down_revision = "0013_offer_score"
+branch_labels = None
+depends_on = None
+
+
+def _backfill_postgres() -> None:
+    for kind, column in (("category", "categories"), ("region", "regions")):
+        op.execute(
+            f"""
+            INSERT INTO vendor_profile_term (vendor_id, kind, value)
+            SELECT DISTINCT vendor_id, '{kind}', json_array_elements_text({column})
+            FROM vendor_profile
+            """
+        )
+        op.execute(
+            f"""
+            INSERT INTO vendor_profile_term (vendor_id, kind, value)
+            SELECT vendor_id, '{kind}', '*'
+            FROM vendor_profile
+            WHERE json_array_length({column}) = 0
+            """
+        )
+
+
+def _backfill_sqlite() -> None:
+    for kind, column in (("category", "categories"), ("region", "regions")):
+        op.execute(
+            f"""
+            INSERT INTO vendor_profile_term (vendor_id, kind, value)
+            SELECT DISTINCT vendor_profile.vendor_id, '{kind}', terms.value
+            FROM vendor_profile, json_each(vendor_profile.{column}) AS terms
+            """
+        )
+        op.execute(
+            f"""
+            INSERT INTO vendor_profile_term (vendor_id, kind, value)
+            SELECT vendor_id, '{kind}', '*'
+            FROM vendor_profile
+            WHERE json_array_length({column}) = 0
+            """
+        )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vendor_profile_term",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("vendor_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["vendor_id"], ["vendor.id"]),
+    )
+    op.create_index(
+        "ix_vendor_profile_term_vendor_id",
+        "vendor_profile_term",
+        ["vendor_id"],
+    )
+    op.create_index(
+        "ix_vendor_profile_term_kind_value",
+        "vendor_profile_term",
+        ["kind", "value", "vendor_id"],
+    )
+
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+    if dialect == "postgresql":
+        _backfill_postgres()
+    elif dialect == "sqlite":
+        _backfill_sqlite()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vendor_profile_term_kind_value", table_name="vendor_profile_term")
+    op.drop_index("ix_vendor_profile_term_vendor_id", table_name="vendor_profile_term")
+    op.drop_table("vendor_profile_term")
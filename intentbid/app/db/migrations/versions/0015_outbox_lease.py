@@ -0,0 +1,27 @@
+"""Add event outbox lease columns
+
+Revision ID: 0015_outbox_lease
+Revises: 0014_vendor_profile_term
+Create Date: 2024-01-01 00:00:14.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0015_outbox_lease"
+down_revision = "0014_vendor_profile_term"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("event_outbox") as batch_op:
+        batch_op.add_column(sa.Column("locked_by", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("locked_until", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("event_outbox") as batch_op:
+        batch_op.drop_column("locked_until")
+        batch_op.drop_column("locked_by")
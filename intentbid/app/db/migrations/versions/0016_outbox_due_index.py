@@ -0,0 +1,33 @@
+"""Index event outbox by due time
+
+Revision ID: 0016_outbox_due_index
+Revises: 0015_outbox_lease
+Create Date: 2024-01-01 00:00:15.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0016_outbox_due_index"
+down_revision = "0015_outbox_lease"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE event_outbox
+        SET next_attempt_at = created_at
+        WHERE next_attempt_at IS NULL
+        """
+    )
+    op.create_index(
+        "ix_event_outbox_status_next_attempt_at",
+        "event_outbox",
+        ["status", "next_attempt_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_outbox_status_next_attempt_at", table_name="event_outbox")
@@ -0,0 +1,27 @@
+"""Add batched webhook delivery setting
+
+Revision ID: 0017_webhook_batching
+Revises: 0016_outbox_due_index
+Create Date: 2024-01-01 00:00:16.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0017_webhook_batching"
+down_revision = "0016_outbox_due_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("vendor_webhook") as batch_op:
+        batch_op.add_column(
+            sa.Column("batch_max_events", sa.Integer(), nullable=False, server_default="1")
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("vendor_webhook") as batch_op:
+        batch_op.drop_column("batch_max_events")
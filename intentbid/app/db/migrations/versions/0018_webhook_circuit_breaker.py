@@ -0,0 +1,29 @@
+"""Track webhook endpoint health for the circuit breaker
+
+Revision ID: 0018_webhook_circuit_breaker
+Revises: 0017_webhook_batching
+Create Date: 2024-01-01 00:00:17.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0018_webhook_circuit_breaker"
+down_revision = "0017_webhook_batching"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("vendor_webhook") as batch_op:
+        batch_op.add_column(
+            sa.Column("consecutive_failures", sa.Integer(), nullable=False, server_default="0")
+        )
+        batch_op.add_column(sa.Column("circuit_open_until", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("vendor_webhook") as batch_op:
+        batch_op.drop_column("circuit_open_until")
+        batch_op.drop_column("consecutive_failures")
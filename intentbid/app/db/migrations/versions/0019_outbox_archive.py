@@ -0,0 +1,47 @@
+"""Add event outbox archive table
+
+Revision ID: 0019_outbox_archive
+Revises: 0018_webhook_circuit_breaker
+Create Date: 2024-01-01 00:00:18.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0019_outbox_archive"
+down_revision = "0018_webhook_circuit_breaker"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("vendor_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_event_outbox_archive_vendor_id",
+        "event_outbox_archive",
+        ["vendor_id"],
+    )
+    op.create_index(
+        "ix_event_outbox_status_created_at",
+        "event_outbox",
+        ["status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_outbox_status_created_at", table_name="event_outbox")
+    op.drop_index("ix_event_outbox_archive_vendor_id", table_name="event_outbox_archive")
+    op.drop_table("event_outbox_archive")
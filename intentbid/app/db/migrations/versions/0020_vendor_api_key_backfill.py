@@ -0,0 +1,32 @@
+"""Backfill legacy vendor API key hashes
+
+Revision ID: 0020_vendor_api_key_backfill
+Revises: 0019_outbox_archive
+Create Date: 2024-01-01 00:00:19.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0020_vendor_api_key_backfill"
+down_revision = "0019_outbox_archive"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        INSERT INTO vendor_api_key (vendor_id, hashed_key, status, created_at)
+        SELECT MIN(vendor.id), vendor.api_key_hash, 'active', CURRENT_TIMESTAMP
+        FROM vendor
+        WHERE NOT EXISTS (
+            SELECT 1 FROM vendor_api_key WHERE vendor_api_key.hashed_key = vendor.api_key_hash
+        )
+        GROUP BY vendor.api_key_hash
+        """
+    )
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,26 @@
+"""Index open RFOs by category for vendor matching
+
+Revision ID: 0021_rfo_match_index
+Revises: 0020_vendor_api_key_backfill
+Create Date: 2024-01-01 00:00:20.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0021_rfo_match_index"
+down_revision = "0020_vendor_api_key_backfill"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_rfo_status_category_created_at",
+        "rfo",
+        ["status", "category", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rfo_status_category_created_at", table_name="rfo")
@@ -0,0 +1,31 @@
+"""Add keyset pagination indexes
+
+Revision ID: 0022_keyset_pagination_indexes
+Revises: 0021_rfo_match_index
+Create Date: 2024-01-01 00:00:21.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0022_keyset_pagination_indexes"
+down_revision = "0021_rfo_match_index"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_rfo_created_at_id", "rfo", ["created_at", "id"]),
+    ("ix_rfo_status_created_at_id", "rfo", ["status", "created_at", "id"]),
+    ("ix_rfo_buyer_id_created_at_id", "rfo", ["buyer_id", "created_at", "id"]),
+    ("ix_offer_vendor_id_created_at_id", "offer", ["vendor_id", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
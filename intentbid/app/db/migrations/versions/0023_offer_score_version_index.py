@@ -0,0 +1,26 @@
+"""Add offer score version index
+
+Revision ID: 0023_offer_score_version_index
+Revises: 0022_keyset_pagination_indexes
+Create Date: 2024-01-01 00:00:22.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0023_offer_score_version_index"
+down_revision = "0022_keyset_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_offer_rfo_id_score_version",
+        "offer",
+        ["rfo_id", "score_version"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_offer_rfo_id_score_version", table_name="offer")
@@ -1,11 +1,30 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, ForeignKey, Integer, JSON, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, JSON, String
 from sqlalchemy.types import DateTime, TypeDecorator
 from sqlmodel import Field, Relationship, SQLModel
 
 
+class UTCDateTime(TypeDecorator):
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+
 class Vendor(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
@@ -39,6 +58,9 @@ class VendorWebhook(SQLModel, table=True):
     url: str
     secret: str
     is_active: bool = Field(default=True, index=True)
+    batch_max_events: int = Field(default=1)
+    consecutive_failures: int = Field(default=0)
+    circuit_open_until: Optional[datetime] = Field(default=None, sa_column=Column(UTCDateTime()))
     last_delivery_at: Optional[datetime] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -56,23 +78,13 @@ class VendorProfile(SQLModel, table=True):
     vendor: Optional[Vendor] = Relationship(back_populates="profile")
 
 
-class UTCDateTime(TypeDecorator):
-    impl = DateTime
-    cache_ok = True
+class VendorProfileTerm(SQLModel, table=True):
+    __tablename__ = "vendor_profile_term"
 
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        if value.tzinfo is None:
-            return value
-        return value.astimezone(timezone.utc).replace(tzinfo=None)
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return None
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value
+    id: Optional[int] = Field(default=None, primary_key=True)
+    vendor_id: int = Field(foreign_key="vendor.id", index=True)
+    kind: str
+    value: str
 
 
 class EventOutbox(SQLModel, table=True):
@@ -87,9 +99,26 @@ class EventOutbox(SQLModel, table=True):
     last_error: Optional[str] = None
     next_attempt_at: Optional[datetime] = None
     delivered_at: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    locked_until: Optional[datetime] = Field(default=None, sa_column=Column(UTCDateTime()))
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class EventOutboxArchive(SQLModel, table=True):
+    __tablename__ = "event_outbox_archive"
+
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    vendor_id: int = Field(index=True)
+    event_type: str
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    status: str
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = None
+    delivered_at: Optional[datetime] = None
+    created_at: datetime
+    archived_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 class PlanLimit(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     plan_code: str = Field(index=True)
@@ -164,6 +193,7 @@ class RFO(SQLModel, table=True):
     )
     scoring_version: str = Field(default="v1")
     weights: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    offer_score_version: Optional[str] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     offers: List["Offer"] = Relationship(
@@ -199,6 +229,8 @@ class Offer(SQLModel, table=True):
     stock: bool
     status: str = Field(default="submitted", index=True)
     is_awarded: bool = Field(default=False, index=True)
+    score: Optional[float] = None
+    score_version: Optional[str] = None
     metadata_: Dict[str, Any] = Field(
         default_factory=dict,
         sa_column=Column("metadata", JSON),
@@ -210,3 +242,28 @@ class Offer(SQLModel, table=True):
         back_populates="offers",
         sa_relationship_kwargs={"foreign_keys": "Offer.rfo_id"},
     )
+
+
+Index("ix_offer_rfo_id_score", Offer.rfo_id, Offer.score.desc(), Offer.id)
+Index("ix_offer_rfo_id_score_version", Offer.rfo_id, Offer.score_version)
+Index("ix_rfo_status_category_created_at", RFO.status, RFO.category, RFO.created_at)
+Index("ix_rfo_created_at_id", RFO.created_at, RFO.id)
+Index("ix_rfo_status_created_at_id", RFO.status, RFO.created_at, RFO.id)
+Index("ix_rfo_buyer_id_created_at_id", RFO.buyer_id, RFO.created_at, RFO.id)
+Index("ix_offer_vendor_id_created_at_id", Offer.vendor_id, Offer.created_at, Offer.id)
+Index(
+    "ix_vendor_profile_term_kind_value",
+    VendorProfileTerm.kind,
+    VendorProfileTerm.value,
+    VendorProfileTerm.vendor_id,
+)
+Index(
+    "ix_event_outbox_status_next_attempt_at",
+    EventOutbox.status,
+    EventOutbox.next_attempt_at,
+)
+Index(
+    "ix_event_outbox_status_created_at",
+    EventOutbox.status,
+    EventOutbox.created_at,
+)
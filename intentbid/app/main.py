@@ -1,10 +1,14 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
+from sqlmodel import Session
 
+from intentbid.app.core.config import settings
 from intentbid.app.core.observability import MetricsCollector, request_middleware
 from intentbid.app.api.routes_buyer_dashboard import router as buyer_dashboard_router
 from intentbid.app.api.routes_buyers import router as buyers_router
@@ -13,10 +17,35 @@ from intentbid.app.api.routes_offers import router as offers_router
 from intentbid.app.api.routes_rfo import router as rfo_router
 from intentbid.app.api.routes_ru import router as ru_router
 from intentbid.app.api.routes_vendors import router as vendors_router
+from intentbid.app.db.session import engine
+from intentbid.app.services.count_cache import rfo_count_cache
+from intentbid.app.services.key_usage import flush_key_usage_periodically, key_usage_buffer
+from intentbid.app.services.match_index import open_rfo_index, refresh_match_index_periodically
 
-app = FastAPI(title="IntentBid API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    stop = asyncio.Event()
+    tasks = [asyncio.create_task(flush_key_usage_periodically(lambda: Session(engine), stop))]
+    if settings.matching_backend == "memory":
+        tasks.append(
+            asyncio.create_task(refresh_match_index_periodically(lambda: Session(engine), stop))
+        )
+    yield
+    stop.set()
+    await asyncio.gather(*tasks)
+
+
+app = FastAPI(title="IntentBid API", lifespan=lifespan)
 logger = logging.getLogger("intentbid")
 metrics = MetricsCollector()
+metrics.register("api_key_usage_buffer_size", "gauge", lambda: key_usage_buffer.size)
+metrics.register("api_key_usage_flushes_total", "counter", lambda: key_usage_buffer.flushes)
+metrics.register("api_key_usage_flushed_keys_total", "counter", lambda: key_usage_buffer.flushed_keys)
+metrics.register("api_key_usage_last_flush_seconds", "gauge", lambda: key_usage_buffer.last_flush_seconds)
+metrics.register("match_index_open_rfos", "gauge", lambda: len(open_rfo_index))
+metrics.register("rfo_count_cache_hits_total", "counter", lambda: rfo_count_cache.hits)
+metrics.register("rfo_count_cache_misses_total", "counter", lambda: rfo_count_cache.misses)
 app.middleware("http")(request_middleware(metrics, logger))
 
 TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
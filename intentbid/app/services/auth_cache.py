@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import Buyer, Vendor
+
+Principal = TypeVar("Principal", Vendor, Buyer)
+
+
+class PrincipalCache(Generic[Principal]):
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, int, Principal]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key_hash: str) -> tuple[int, Principal] | None:
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry is None:
+                return None
+            created_at, key_id, principal = entry
+            if time.monotonic() - created_at > self._ttl_seconds:
+                del self._entries[key_hash]
+                return None
+            self._entries.move_to_end(key_hash)
+            return key_id, principal
+
+    def store(self, key_hash: str, key_id: int, principal: Principal, generation: int) -> None:
+        snapshot = type(principal)(**principal.model_dump())
+        with self._lock:
+            if self._generation != generation:
+                return
+            self._entries[key_hash] = (time.monotonic(), key_id, snapshot)
+            self._entries.move_to_end(key_hash)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key_hash: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key_hash, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+class RejectedKeyCache:
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key_hash: str) -> bool:
+        with self._lock:
+            if key_hash not in self._entries:
+                return False
+            self._entries.move_to_end(key_hash)
+            return True
+
+    def add(self, key_hash: str) -> None:
+        with self._lock:
+            self._entries[key_hash] = None
+            self._entries.move_to_end(key_hash)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+vendor_principal_cache: PrincipalCache[Vendor] = PrincipalCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
+buyer_principal_cache: PrincipalCache[Buyer] = PrincipalCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
+rejected_vendor_keys = RejectedKeyCache(max_entries=settings.auth_negative_cache_max_entries)
+rejected_buyer_keys = RejectedKeyCache(max_entries=settings.auth_negative_cache_max_entries)
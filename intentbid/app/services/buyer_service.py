@@ -1,9 +1,10 @@
-from datetime import datetime, timezone
-
 from sqlmodel import Session, select
 
+from intentbid.app.core.config import settings
 from intentbid.app.core.security import generate_api_key, hash_api_key
 from intentbid.app.db.models import Buyer, BuyerApiKey
+from intentbid.app.services.auth_cache import buyer_principal_cache, rejected_buyer_keys
+from intentbid.app.services.key_usage import key_usage_buffer
 
 
 def register_buyer(session: Session, name: str) -> tuple[Buyer, str]:
@@ -22,6 +23,28 @@ def register_buyer(session: Session, name: str) -> tuple[Buyer, str]:
 
 def get_buyer_by_api_key(session: Session, api_key: str) -> Buyer | None:
     api_key_hash = hash_api_key(api_key)
+    if settings.auth_cache_enabled:
+        cached = buyer_principal_cache.get(api_key_hash)
+        if cached is not None:
+            key_id, buyer = cached
+            key_usage_buffer.record(BuyerApiKey, key_id)
+            return buyer
+        if api_key_hash in rejected_buyer_keys:
+            return None
+    generation = buyer_principal_cache.generation()
+    resolved = _load_buyer_by_key_hash(session, api_key_hash)
+    if resolved is None:
+        if settings.auth_cache_enabled:
+            rejected_buyer_keys.add(api_key_hash)
+        return None
+    key_id, buyer = resolved
+    key_usage_buffer.record(BuyerApiKey, key_id)
+    if settings.auth_cache_enabled:
+        buyer_principal_cache.store(api_key_hash, key_id, buyer, generation)
+    return buyer
+
+
+def _load_buyer_by_key_hash(session: Session, api_key_hash: str) -> tuple[int, Buyer] | None:
     key = session.exec(
         select(BuyerApiKey).where(BuyerApiKey.hashed_key == api_key_hash)
     ).first()
@@ -30,7 +53,5 @@ def get_buyer_by_api_key(session: Session, api_key: str) -> Buyer | None:
     if key.status != "active":
         return None
 
-    key.last_used_at = datetime.now(timezone.utc)
-    session.add(key)
-    session.commit()
-    return session.get(Buyer, key.buyer_id)
+    buyer = session.get(Buyer, key.buyer_id)
+    return (key.id, buyer) if buyer else None
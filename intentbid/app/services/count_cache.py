@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+
+from intentbid.app.core.config import settings
+
+CountKey = tuple[str | None, str | None, float | None, float | None, int | None, int | None]
+
+
+def rfo_count_key(
+    status: str | None,
+    category: str | None,
+    budget_min: float | None,
+    budget_max: float | None,
+    deadline_max: int | None,
+    buyer_id: int | None,
+) -> CountKey:
+    return (
+        status or None,
+        category or None,
+        None if budget_min is None else float(budget_min),
+        None if budget_max is None else float(budget_max),
+        deadline_max,
+        buyer_id,
+    )
+
+
+class CountCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CountKey, tuple[float, int]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: CountKey) -> int | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self._ttl_seconds:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def store(self, key: CountKey, total: int, generation: int) -> None:
+        with self._lock:
+            if self._generation != generation:
+                return
+            self._entries[key] = (time.monotonic(), total)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+rfo_count_cache = CountCache(
+    max_entries=settings.rfo_count_cache_max_entries,
+    ttl_seconds=settings.rfo_count_cache_ttl_seconds,
+)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import bindparam, or_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import BuyerApiKey, VendorApiKey
+
+logger = logging.getLogger("intentbid.key_usage")
+
+KeyModel = type[VendorApiKey] | type[BuyerApiKey]
+
+
+class KeyUsageBuffer:
+    def __init__(self) -> None:
+        self._pending: dict[KeyModel, dict[int, datetime]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.flushes = 0
+        self.flushed_keys = 0
+        self.last_flush_seconds = 0.0
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(len(pending) for pending in self._pending.values())
+
+    def record(self, model: KeyModel, key_id: int, used_at: datetime | None = None) -> None:
+        used_at = used_at or datetime.now(timezone.utc)
+        with self._lock:
+            pending = self._pending.setdefault(model, {})
+            if key_id not in pending or pending[key_id] < used_at:
+                pending[key_id] = used_at
+
+    def flush(self, session: Session) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batches, self._pending = self._pending, {}
+            if not batches:
+                return 0
+            started = time.perf_counter()
+            flushed = 0
+            try:
+                for model, pending in batches.items():
+                    if not pending:
+                        continue
+                    table = model.__table__
+                    session.connection().execute(
+                        update(table)
+                        .where(
+                            table.c.id == bindparam("key_id"),
+                            or_(
+                                table.c.last_used_at.is_(None),
+                                table.c.last_used_at < bindparam("used_at"),
+                            ),
+                        )
+                        .values(last_used_at=bindparam("used_at")),
+                        [
+                            {"key_id": key_id, "used_at": used_at}
+                            for key_id, used_at in pending.items()
+                        ],
+                    )
+                    flushed += len(pending)
+                session.commit()
+            except Exception:
+                session.rollback()
+                for model, pending in batches.items():
+                    for key_id, used_at in pending.items():
+                        self.record(model, key_id, used_at)
+                raise
+            self.flushes += 1
+            self.flushed_keys += flushed
+            self.last_flush_seconds = time.perf_counter() - started
+            return flushed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+
+
+key_usage_buffer = KeyUsageBuffer()
+
+
+def flush_key_usage(session_factory: Callable[[], Session]) -> int:
+    with session_factory() as session:
+        return key_usage_buffer.flush(session)
+
+
+async def flush_key_usage_periodically(
+    session_factory: Callable[[], Session],
+    stop: asyncio.Event,
+    interval: float | None = None,
+) -> None:
+    interval = interval or settings.api_key_usage_flush_seconds
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await asyncio.to_thread(flush_key_usage, session_factory)
+        except SQLAlchemyError:
+            logger.exception("api key usage flush failed")
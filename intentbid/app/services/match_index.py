@@ -0,0 +1,244 @@
+import asyncio
+import heapq
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import RFO
+
+logger = logging.getLogger("intentbid.match_index")
+
+IndexEntry = tuple[str, str | None, int | None, float | None, tuple[float, int]]
+
+
+def _sort_key(created_at: datetime, rfo_id: int) -> tuple[float, int]:
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at.timestamp(), rfo_id
+
+
+def _entry(
+    rfo_id: int,
+    category: str,
+    location: str | None,
+    delivery_deadline_days: int | None,
+    budget_max: float | None,
+    created_at: datetime,
+) -> IndexEntry:
+    return category, location, delivery_deadline_days, budget_max, _sort_key(created_at, rfo_id)
+
+
+def _fits(entry: IndexEntry, lead_time_days: int | None, min_order_value: float | None) -> bool:
+    delivery_deadline_days, budget_max = entry[2:4]
+    if lead_time_days is not None and delivery_deadline_days is not None:
+        if delivery_deadline_days < lead_time_days:
+            return False
+    if min_order_value is not None and budget_max is not None:
+        if budget_max < min_order_value:
+            return False
+    return True
+
+
+@dataclass
+class IndexDrift:
+    missing: int = 0
+    stale: int = 0
+    extra: int = 0
+
+    @property
+    def consistent(self) -> bool:
+        return not (self.missing or self.stale or self.extra)
+
+
+class OpenRFOIndex:
+    def __init__(self) -> None:
+        self._entries: dict[int, IndexEntry] = {}
+        self._by_category: dict[str, set[int]] = defaultdict(set)
+        self._by_location: dict[str | None, set[int]] = defaultdict(set)
+        self._pending: list[tuple[int, IndexEntry | None]] | None = None
+        self._ready = False
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add(self, rfo_id: int, entry: IndexEntry) -> None:
+        self._discard(rfo_id)
+        category, location = entry[:2]
+        self._entries[rfo_id] = entry
+        self._by_category[category].add(rfo_id)
+        self._by_location[location].add(rfo_id)
+
+    def _discard(self, rfo_id: int) -> None:
+        entry = self._entries.pop(rfo_id, None)
+        if entry is None:
+            return
+        category, location = entry[:2]
+        for postings, term in ((self._by_category, category), (self._by_location, location)):
+            postings[term].discard(rfo_id)
+            if not postings[term]:
+                del postings[term]
+
+    def _apply(self, rfo_id: int, entry: IndexEntry | None) -> None:
+        if entry is None:
+            self._discard(rfo_id)
+        else:
+            self._add(rfo_id, entry)
+
+    def upsert(self, rfo: RFO) -> None:
+        entry = None
+        if rfo.status == "OPEN":
+            entry = _entry(
+                rfo.id,
+                rfo.category,
+                rfo.location,
+                rfo.delivery_deadline_days,
+                rfo.budget_max,
+                rfo.created_at,
+            )
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((rfo.id, entry))
+            if self._ready:
+                self._apply(rfo.id, entry)
+
+    def _load(self, session: Session) -> dict[int, IndexEntry]:
+        rows = session.exec(
+            select(
+                RFO.id,
+                RFO.category,
+                RFO.location,
+                RFO.delivery_deadline_days,
+                RFO.budget_max,
+                RFO.created_at,
+            ).where(RFO.status == "OPEN")
+        ).all()
+        return {rfo_id: _entry(rfo_id, *row) for rfo_id, *row in rows}
+
+    def rebuild(self, session: Session) -> int:
+        with self._lock:
+            self._pending = []
+        try:
+            entries = self._load(session)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        with self._lock:
+            self._entries = {}
+            self._by_category = defaultdict(set)
+            self._by_location = defaultdict(set)
+            for rfo_id, entry in entries.items():
+                self._add(rfo_id, entry)
+            for rfo_id, entry in self._pending:
+                self._apply(rfo_id, entry)
+            self._pending = None
+            self._ready = True
+            return len(self._entries)
+
+    def verify(self, session: Session) -> IndexDrift:
+        expected = self._load(session)
+        with self._lock:
+            actual = dict(self._entries)
+        drift = IndexDrift()
+        for rfo_id, entry in expected.items():
+            if rfo_id not in actual:
+                drift.missing += 1
+            elif actual[rfo_id] != entry:
+                drift.stale += 1
+        drift.extra = len(actual.keys() - expected.keys())
+        return drift
+
+    def match(
+        self,
+        categories: list[str],
+        regions: list[str],
+        limit: int,
+        offset: int = 0,
+        *,
+        lead_time_days: int | None = None,
+        min_order_value: float | None = None,
+        score: Callable[[int | None, float | None], float] | None = None,
+    ) -> tuple[list[int], int]:
+        with self._lock:
+            candidates: set[int] | None = None
+            for postings, terms in ((self._by_category, categories), (self._by_location, regions)):
+                if not terms:
+                    continue
+                matched = set().union(*(postings.get(term, ()) for term in terms))
+                candidates = matched if candidates is None else candidates & matched
+            if candidates is None:
+                candidates = self._entries.keys()
+            if lead_time_days is not None or min_order_value is not None:
+                candidates = [
+                    rfo_id
+                    for rfo_id in candidates
+                    if _fits(self._entries[rfo_id], lead_time_days, min_order_value)
+                ]
+            total = len(candidates)
+            if total <= offset:
+                return [], total
+            entries = self._entries
+            if score is None:
+                key = lambda rfo_id: entries[rfo_id][4]
+            else:
+                key = lambda rfo_id: (score(*entries[rfo_id][2:4]), entries[rfo_id][4])
+            page = heapq.nlargest(offset + limit, candidates, key=key)
+        return page[offset:], total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._by_category = defaultdict(set)
+            self._by_location = defaultdict(set)
+            self._pending = None
+            self._ready = False
+
+
+open_rfo_index = OpenRFOIndex()
+
+
+def refresh_match_index(session_factory: Callable[[], Session]) -> IndexDrift | None:
+    with session_factory() as session:
+        if not open_rfo_index.ready:
+            size = open_rfo_index.rebuild(session)
+            logger.info("match index built with %s open rfos", size)
+            return None
+        drift = open_rfo_index.verify(session)
+        if not drift.consistent:
+            logger.warning(
+                "match index drift missing=%s stale=%s extra=%s, rebuilding",
+                drift.missing,
+                drift.stale,
+                drift.extra,
+            )
+            open_rfo_index.rebuild(session)
+        return drift
+
+
+async def refresh_match_index_periodically(
+    session_factory: Callable[[], Session],
+    stop: asyncio.Event,
+    interval: float | None = None,
+) -> None:
+    interval = interval or settings.match_index_refresh_seconds
+    while not stop.is_set():
+        try:
+            await asyncio.to_thread(refresh_match_index, session_factory)
+        except SQLAlchemyError:
+            logger.exception("match index refresh failed")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
@@ -1,6 +1,131 @@
+from sqlalchemy import Float, Select, and_, case, cast, func, literal, or_
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
-from intentbid.app.db.models import RFO, VendorProfile
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import RFO, VendorProfile, VendorProfileTerm
+from intentbid.app.services.match_index import open_rfo_index
+
+PROFILE_TERM_WILDCARD = "*"
+
+
+def profile_terms(categories: list[str], regions: list[str]) -> list[tuple[str, str]]:
+    terms: list[tuple[str, str]] = []
+    for kind, values in (("category", categories), ("region", regions)):
+        for value in dict.fromkeys(values or [PROFILE_TERM_WILDCARD]):
+            terms.append((kind, value))
+    return terms
+
+
+def matching_vendor_ids(rfo: RFO) -> Select:
+    category_terms = aliased(VendorProfileTerm)
+    region_terms = aliased(VendorProfileTerm)
+    regions = [PROFILE_TERM_WILDCARD]
+    if rfo.location is not None:
+        regions.append(rfo.location)
+    query = (
+        select(category_terms.vendor_id)
+        .join(
+            region_terms,
+            and_(
+                region_terms.vendor_id == category_terms.vendor_id,
+                region_terms.kind == "region",
+                region_terms.value.in_(regions),
+            ),
+        )
+        .where(
+            category_terms.kind == "category",
+            category_terms.value.in_([rfo.category, PROFILE_TERM_WILDCARD]),
+        )
+    )
+    range_conditions = []
+    if rfo.delivery_deadline_days is not None:
+        range_conditions.append(
+            or_(
+                VendorProfile.lead_time_days.is_(None),
+                VendorProfile.lead_time_days <= rfo.delivery_deadline_days,
+            )
+        )
+    if rfo.budget_max is not None:
+        range_conditions.append(
+            or_(
+                VendorProfile.min_order_value.is_(None),
+                VendorProfile.min_order_value <= rfo.budget_max,
+            )
+        )
+    if range_conditions:
+        query = query.join(
+            VendorProfile, VendorProfile.vendor_id == category_terms.vendor_id
+        ).where(*range_conditions)
+    return query.distinct()
+
+
+def _vendor_match_conditions(profile: VendorProfile) -> list:
+    conditions = [RFO.status == "OPEN"]
+    if profile.categories:
+        conditions.append(RFO.category.in_(profile.categories))
+    if profile.regions:
+        conditions.append(RFO.location.in_(profile.regions))
+    if profile.lead_time_days is not None:
+        conditions.append(
+            or_(
+                RFO.delivery_deadline_days.is_(None),
+                RFO.delivery_deadline_days >= profile.lead_time_days,
+            )
+        )
+    if profile.min_order_value is not None:
+        conditions.append(
+            or_(RFO.budget_max.is_(None), RFO.budget_max >= profile.min_order_value)
+        )
+    return conditions
+
+
+def _vendor_match_reasons(profile: VendorProfile) -> list[str]:
+    reasons: list[str] = []
+    if profile.categories:
+        reasons.append("category_match")
+    if profile.regions:
+        reasons.append("region_match")
+    if profile.lead_time_days is not None:
+        reasons.append("lead_time_fit")
+    if profile.min_order_value is not None:
+        reasons.append("order_value_fit")
+    return reasons
+
+
+def _fit(required: float | None, available: float | None) -> float:
+    if required is None or available is None or available <= 0:
+        return 0.5
+    return 1.0 - 0.5 * min(required / available, 1.0)
+
+
+def match_score(
+    profile: VendorProfile,
+    delivery_deadline_days: int | None,
+    budget_max: float | None,
+) -> float:
+    lead_fit = _fit(profile.lead_time_days, delivery_deadline_days)
+    value_fit = _fit(profile.min_order_value, budget_max)
+    return (lead_fit + value_fit) / 2
+
+
+def _fit_expression(required: float | None, column):
+    if required is None:
+        return literal(0.5)
+    ratio = literal(float(required)) / cast(column, Float)
+    return case(
+        (column.is_(None), 0.5),
+        (column <= 0, 0.5),
+        (ratio > 1.0, 0.5),
+        else_=1.0 - 0.5 * ratio,
+    )
+
+
+def _match_score_expression(profile: VendorProfile):
+    return (
+        _fit_expression(profile.lead_time_days, RFO.delivery_deadline_days)
+        + _fit_expression(profile.min_order_value, RFO.budget_max)
+    ) / 2
 
 
 def list_vendor_matches(
@@ -8,31 +133,51 @@ def list_vendor_matches(
     vendor_id: int,
     limit: int = 20,
     offset: int = 0,
-) -> tuple[list[tuple[RFO, list[str]]], int]:
+    sort: str = "recent",
+) -> tuple[list[tuple[RFO, list[str], float]], int]:
     profile = session.exec(
         select(VendorProfile).where(VendorProfile.vendor_id == vendor_id)
     ).first()
     if not profile:
         return [], 0
+    reasons = _vendor_match_reasons(profile)
+
+    if settings.matching_backend == "memory" and open_rfo_index.ready:
+        rfo_ids, total = open_rfo_index.match(
+            profile.categories or [],
+            profile.regions or [],
+            limit=limit,
+            offset=offset,
+            lead_time_days=profile.lead_time_days,
+            min_order_value=profile.min_order_value,
+            score=(
+                (lambda deadline, budget: match_score(profile, deadline, budget))
+                if sort == "match_score"
+                else None
+            ),
+        )
+        loaded = {
+            rfo.id: rfo
+            for rfo in session.exec(select(RFO).where(RFO.id.in_(rfo_ids))).all()
+        }
+        rfos = [loaded[rfo_id] for rfo_id in rfo_ids if rfo_id in loaded]
+    else:
+        conditions = _vendor_match_conditions(profile)
+        total = session.exec(select(func.count()).select_from(RFO).where(*conditions)).one()
+        if total <= offset:
+            return [], total
+        order_by = [RFO.created_at.desc(), RFO.id.desc()]
+        if sort == "match_score":
+            order_by.insert(0, _match_score_expression(profile).desc())
+        rfos = session.exec(
+            select(RFO).where(*conditions).order_by(*order_by).offset(offset).limit(limit)
+        ).all()
 
-    rfos = session.exec(
-        select(RFO).where(RFO.status == "OPEN").order_by(RFO.created_at.desc())
-    ).all()
-
-    matches: list[tuple[RFO, list[str]]] = []
-    for rfo in rfos:
-        reasons: list[str] = []
-        if profile.categories:
-            if rfo.category in profile.categories:
-                reasons.append("category_match")
-            else:
-                continue
-        if profile.regions:
-            if rfo.location in profile.regions:
-                reasons.append("region_match")
-            else:
-                continue
-        matches.append((rfo, reasons))
-
-    total = len(matches)
-    return matches[offset : offset + limit], total
+    return [
+        (
+            rfo,
+            list(reasons),
+            round(match_score(profile, rfo.delivery_deadline_days, rfo.budget_max), 4),
+        )
+        for rfo in rfos
+    ], total
@@ -1,21 +1,34 @@
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func
+from sqlalchemy import and_, case, func
 from sqlmodel import Session, select
 
 from intentbid.app.core.config import settings
+from intentbid.app.core.pagination import keyset_before, next_page
 from intentbid.app.core.schemas import OfferCreate
+from intentbid.app.core.scoring import CompiledScorer, get_scorer, scoring_config_version
 from intentbid.app.db.models import Offer, RFO
 from intentbid.app.services.billing_service import (
-    get_active_subscription,
-    get_plan_limit,
-    is_within_offer_limit,
+    monthly_offer_usage_subquery,
+    plan_limit_subquery,
     record_usage,
 )
+from intentbid.app.services.ranking_cache import (
+    ranking_cache,
+    ranking_cache_key,
+    snapshot_offer,
+)
 from intentbid.app.services.webhook_service import enqueue_event
 
 
-def create_offer(session: Session, vendor_id: int, payload: OfferCreate) -> Offer:
+OfferScoring = tuple[CompiledScorer, str, tuple[int, str, str]]
+
+
+def _offer_scoring(rfo: RFO) -> OfferScoring:
+    return get_scorer(rfo), scoring_config_version(rfo), ranking_cache_key(rfo)
+
+
+def _build_offer(vendor_id: int, payload: OfferCreate, scoring: OfferScoring | None) -> Offer:
     offer = Offer(
         rfo_id=payload.rfo_id,
         vendor_id=vendor_id,
@@ -27,9 +40,15 @@ def create_offer(session: Session, vendor_id: int, payload: OfferCreate) -> Offe
         stock=payload.stock,
         metadata_=payload.metadata,
     )
-    session.add(offer)
-    session.commit()
-    session.refresh(offer)
+    if scoring:
+        scorer, score_version, _ = scoring
+        score, _ = scorer.score(offer)
+        offer.score = float(score)
+        offer.score_version = score_version
+    return offer
+
+
+def _stage_offer_events(session: Session, vendor_id: int, offer: Offer) -> None:
     enqueue_event(
         session,
         vendor_id=vendor_id,
@@ -39,29 +58,131 @@ def create_offer(session: Session, vendor_id: int, payload: OfferCreate) -> Offe
             "rfo_id": offer.rfo_id,
             "vendor_id": vendor_id,
         },
+        commit=False,
     )
-    record_usage(session, vendor_id=vendor_id, event_type="offer.created")
+    record_usage(session, vendor_id=vendor_id, event_type="offer.created", commit=False)
+
+
+def create_offer(session: Session, vendor_id: int, payload: OfferCreate) -> Offer:
+    rfo = session.get(RFO, payload.rfo_id)
+    scoring = _offer_scoring(rfo) if rfo else None
+    offer = _build_offer(vendor_id, payload, scoring)
+    session.add(offer)
+    session.flush()
+    _stage_offer_events(session, vendor_id, offer)
+    snapshot = snapshot_offer(offer)
+    session.commit()
+    if scoring:
+        ranking_cache.insert(snapshot.rfo_id, scoring[2], snapshot.score, snapshot)
     return offer
 
 
+def create_offers_batch(
+    session: Session,
+    vendor_id: int,
+    payloads: list[OfferCreate],
+) -> list[tuple[int | None, int, str | None]]:
+    rfo_ids = {payload.rfo_id for payload in payloads}
+    rfos = {
+        rfo.id: rfo
+        for rfo in session.exec(select(RFO).where(RFO.id.in_(rfo_ids))).all()
+    }
+    plan_limit = plan_limit_subquery(vendor_id)
+    max_offers_per_month, monthly_usage = session.exec(
+        select(
+            plan_limit,
+            case(
+                (plan_limit.is_not(None), monthly_offer_usage_subquery(vendor_id)),
+                else_=None,
+            ),
+        )
+    ).one()
+    offer_stats = {
+        rfo_id: [offers_count, last_created_at]
+        for rfo_id, offers_count, last_created_at in session.exec(
+            select(Offer.rfo_id, func.count(Offer.id), func.max(Offer.created_at))
+            .where(Offer.vendor_id == vendor_id, Offer.rfo_id.in_(rfo_ids))
+            .group_by(Offer.rfo_id)
+        ).all()
+    }
+
+    results: list[tuple[int | None, int, str | None]] = []
+    accepted: list[tuple[int, Offer]] = []
+    scorings: dict[int, OfferScoring] = {}
+    for index, payload in enumerate(payloads):
+        rfo = rfos.get(payload.rfo_id)
+        stats = offer_stats.setdefault(payload.rfo_id, [0, None])
+        if not rfo:
+            results.append((None, 404, "RFO not found"))
+            continue
+        if rfo.status != "OPEN":
+            results.append((None, 400, "RFO is closed"))
+            continue
+        if max_offers_per_month is not None and monthly_usage >= max_offers_per_month:
+            results.append((None, 429, "Plan limit exceeded"))
+            continue
+        payload_error = _payload_error(payload)
+        if payload_error:
+            results.append((None, *payload_error))
+            continue
+        if stats[0] >= settings.max_offers_per_vendor_rfo:
+            results.append((None, 429, "Offer limit reached for this RFO"))
+            continue
+        if _cooldown_active(stats[1]):
+            results.append((None, 429, "Offer cooldown active"))
+            continue
+
+        if rfo.id not in scorings:
+            scorings[rfo.id] = _offer_scoring(rfo)
+        offer = _build_offer(vendor_id, payload, scorings[rfo.id])
+        accepted.append((index, offer))
+        results.append((None, 200, None))
+        stats[0] += 1
+        stats[1] = offer.created_at
+        if monthly_usage is not None:
+            monthly_usage += 1
+
+    if not accepted:
+        return results
+
+    session.add_all([offer for _, offer in accepted])
+    session.flush()
+    cache_updates = []
+    for index, offer in accepted:
+        _stage_offer_events(session, vendor_id, offer)
+        results[index] = (offer.id, 200, None)
+        cache_updates.append((offer.rfo_id, scorings[offer.rfo_id][2], snapshot_offer(offer)))
+    session.commit()
+    for rfo_id, cache_key, snapshot in cache_updates:
+        ranking_cache.insert(rfo_id, cache_key, snapshot.score, snapshot)
+    return results
+
+
 def list_vendor_offers(
     session: Session,
     vendor_id: int,
     limit: int = 20,
     offset: int = 0,
-) -> tuple[list[tuple[Offer, RFO]], int]:
-    total = session.exec(
-        select(func.count(Offer.id)).where(Offer.vendor_id == vendor_id)
-    ).one()
-    rows = session.exec(
+    cursor: tuple[datetime, int] | None = None,
+) -> tuple[list[tuple[Offer, RFO]], int | None, str | None]:
+    query = (
         select(Offer, RFO)
         .join(RFO, RFO.id == Offer.rfo_id)
         .where(Offer.vendor_id == vendor_id)
-        .order_by(Offer.created_at.desc())
-        .offset(offset)
-        .limit(limit)
+    )
+    total = None
+    if cursor is None:
+        total = session.exec(
+            select(func.count(Offer.id)).where(Offer.vendor_id == vendor_id)
+        ).one()
+        query = query.offset(offset)
+    else:
+        query = query.where(keyset_before(Offer.created_at, Offer.id, cursor))
+    rows = session.exec(
+        query.order_by(Offer.created_at.desc(), Offer.id.desc()).limit(limit + 1)
     ).all()
-    return rows, total
+    items, next_cursor = next_page(rows, limit, lambda row: (row[0].created_at, row[0].id))
+    return items, total, next_cursor
 
 
 def validate_offer_submission(
@@ -69,42 +190,51 @@ def validate_offer_submission(
     vendor_id: int,
     payload: OfferCreate,
 ) -> tuple[bool, int | None, str | None]:
-    subscription = get_active_subscription(session, vendor_id)
-    if subscription:
-        plan = get_plan_limit(session, subscription.plan_code)
-        if plan and not is_within_offer_limit(session, vendor_id, plan.max_offers_per_month):
-            return False, 429, "Plan limit exceeded"
-
-    if payload.price_amount <= 0:
-        return False, 400, "Price must be positive"
-    if payload.delivery_eta_days <= 0:
-        return False, 400, "Delivery ETA must be positive"
-    if payload.warranty_months < 0 or payload.return_days < 0:
-        return False, 400, "Warranty and return days must be non-negative"
-
-    offers_count = session.exec(
-        select(func.count(Offer.id)).where(
-            Offer.vendor_id == vendor_id,
-            Offer.rfo_id == payload.rfo_id,
+    plan_limit = plan_limit_subquery(vendor_id)
+    vendor_offers = and_(Offer.vendor_id == vendor_id, Offer.rfo_id == payload.rfo_id)
+    limits = session.exec(
+        select(
+            plan_limit,
+            case(
+                (plan_limit.is_not(None), monthly_offer_usage_subquery(vendor_id)),
+                else_=None,
+            ),
+            select(func.count(Offer.id)).where(vendor_offers).scalar_subquery(),
+            select(func.max(Offer.created_at)).where(vendor_offers).scalar_subquery(),
         )
     ).one()
+    max_offers_per_month, monthly_usage, offers_count, last_created_at = limits
+
+    if max_offers_per_month is not None and monthly_usage >= max_offers_per_month:
+        return False, 429, "Plan limit exceeded"
+
+    payload_error = _payload_error(payload)
+    if payload_error:
+        return False, *payload_error
+
     if offers_count >= settings.max_offers_per_vendor_rfo:
         return False, 429, "Offer limit reached for this RFO"
 
-    last_offer = session.exec(
-        select(Offer)
-        .where(
-            Offer.vendor_id == vendor_id,
-            Offer.rfo_id == payload.rfo_id,
-        )
-        .order_by(Offer.created_at.desc())
-    ).first()
-    if last_offer and settings.offer_cooldown_seconds > 0:
-        last_created_at = last_offer.created_at
-        if last_created_at.tzinfo is None:
-            last_created_at = last_created_at.replace(tzinfo=timezone.utc)
-        cooldown_until = last_created_at + timedelta(seconds=settings.offer_cooldown_seconds)
-        if datetime.now(timezone.utc) < cooldown_until:
-            return False, 429, "Offer cooldown active"
+    if _cooldown_active(last_created_at):
+        return False, 429, "Offer cooldown active"
 
     return True, None, None
+
+
+def _payload_error(payload: OfferCreate) -> tuple[int, str] | None:
+    if payload.price_amount <= 0:
+        return 400, "Price must be positive"
+    if payload.delivery_eta_days <= 0:
+        return 400, "Delivery ETA must be positive"
+    if payload.warranty_months < 0 or payload.return_days < 0:
+        return 400, "Warranty and return days must be non-negative"
+    return None
+
+
+def _cooldown_active(last_created_at: datetime | None) -> bool:
+    if not last_created_at or settings.offer_cooldown_seconds <= 0:
+        return False
+    if last_created_at.tzinfo is None:
+        last_created_at = last_created_at.replace(tzinfo=timezone.utc)
+    cooldown_until = last_created_at + timedelta(seconds=settings.offer_cooldown_seconds)
+    return datetime.now(timezone.utc) < cooldown_until
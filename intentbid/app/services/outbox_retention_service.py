@@ -0,0 +1,144 @@
+import gzip
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import delete, insert, literal
+from sqlmodel import Session, select
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import EventOutbox, EventOutboxArchive
+
+logger = logging.getLogger("intentbid.outbox_retention")
+
+RETAINED_STATUSES = ("delivered", "dead", "skipped")
+ARCHIVE_MODES = ("table", "jsonl", "none")
+ARCHIVED_COLUMNS = (
+    "id",
+    "vendor_id",
+    "event_type",
+    "payload",
+    "status",
+    "attempts",
+    "last_error",
+    "delivered_at",
+    "created_at",
+)
+
+
+@dataclass
+class RetentionReport:
+    archive: str
+    cutoff: datetime
+    archived: int = 0
+    deleted: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.deleted / self.elapsed_seconds
+
+
+def _expired_event_ids(session: Session, cutoff: datetime, chunk_size: int) -> list[int]:
+    return session.exec(
+        select(EventOutbox.id)
+        .where(
+            EventOutbox.status.in_(RETAINED_STATUSES),
+            EventOutbox.created_at < cutoff,
+        )
+        .order_by(EventOutbox.id)
+        .limit(chunk_size)
+    ).all()
+
+
+def _archive_to_table(session: Session, event_ids: list[int], archived_at: datetime) -> int:
+    source = EventOutbox.__table__.c
+    target = EventOutboxArchive.__table__.c
+    statement = insert(EventOutboxArchive).from_select(
+        [target[name] for name in ARCHIVED_COLUMNS] + [target.archived_at],
+        select(
+            *(source[name] for name in ARCHIVED_COLUMNS),
+            literal(archived_at, target.archived_at.type),
+        ).where(source.id.in_(event_ids)),
+    )
+    return session.execute(statement).rowcount
+
+
+def _json_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Unsupported archive value: {value!r}")
+
+
+def _archive_to_jsonl(session: Session, event_ids: list[int], archive_file) -> int:
+    source = EventOutbox.__table__.c
+    rows = session.execute(
+        select(*(source[name] for name in ARCHIVED_COLUMNS))
+        .where(source.id.in_(event_ids))
+        .order_by(source.id)
+    ).mappings()
+    archived = 0
+    for row in rows:
+        archive_file.write(json.dumps(dict(row), default=_json_value, separators=(",", ":")))
+        archive_file.write("\n")
+        archived += 1
+    archive_file.flush()
+    return archived
+
+
+def compact_outbox(
+    session: Session,
+    *,
+    older_than: timedelta | None = None,
+    chunk_size: int | None = None,
+    archive: str = "table",
+    archive_path: str | Path | None = None,
+    max_chunks: int | None = None,
+    now: datetime | None = None,
+) -> RetentionReport:
+    if archive not in ARCHIVE_MODES:
+        raise ValueError(f"archive must be one of {', '.join(ARCHIVE_MODES)}")
+    if archive == "jsonl" and archive_path is None:
+        raise ValueError("archive_path is required for jsonl archives")
+    current_time = now or datetime.now(timezone.utc)
+    if older_than is None:
+        older_than = timedelta(days=settings.outbox_retention_days)
+    chunk_size = chunk_size or settings.outbox_retention_chunk_size
+    report = RetentionReport(archive=archive, cutoff=current_time - older_than)
+
+    archive_file = gzip.open(archive_path, "at", encoding="utf-8") if archive == "jsonl" else None
+    started = time.perf_counter()
+    try:
+        while max_chunks is None or report.chunks < max_chunks:
+            event_ids = _expired_event_ids(session, report.cutoff, chunk_size)
+            if not event_ids:
+                break
+            if archive == "table":
+                report.archived += _archive_to_table(session, event_ids, current_time)
+            elif archive == "jsonl":
+                report.archived += _archive_to_jsonl(session, event_ids, archive_file)
+            report.deleted += session.execute(
+                delete(EventOutbox).where(EventOutbox.id.in_(event_ids))
+            ).rowcount
+            session.commit()
+            report.chunks += 1
+            report.elapsed_seconds = time.perf_counter() - started
+            logger.info(
+                "outbox retention chunk=%s deleted=%s rows_per_sec=%.1f",
+                report.chunks,
+                report.deleted,
+                report.rows_per_second,
+            )
+            if len(event_ids) < chunk_size:
+                break
+    finally:
+        if archive_file is not None:
+            archive_file.close()
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
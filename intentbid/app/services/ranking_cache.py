@@ -0,0 +1,108 @@
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from intentbid.app.core.config import settings
+from intentbid.app.core.scoring import scoring_config_hash
+from intentbid.app.db.models import Offer, RFO
+
+
+def ranking_cache_key(rfo: RFO) -> tuple[int, str, str]:
+    return rfo.id, rfo.scoring_version, scoring_config_hash(rfo)
+
+
+def snapshot_offer(offer: Offer) -> Offer:
+    return Offer(**offer.model_dump())
+
+
+@dataclass
+class RankingEntry:
+    key: tuple[int, str, str]
+    created_at: float
+    ranking: list[tuple[float, int]] = field(default_factory=list)
+    offers: dict[int, Offer] = field(default_factory=dict)
+
+    def offer_ids(self, limit: int | None = None) -> list[int]:
+        ranking = self.ranking if limit is None else self.ranking[:limit]
+        return [offer_id for _, offer_id in ranking]
+
+
+class RankingCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, RankingEntry] = OrderedDict()
+        self._generations: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, rfo_id: int) -> int:
+        with self._lock:
+            return self._generations.get(rfo_id, 0)
+
+    def get(self, rfo: RFO) -> RankingEntry | None:
+        key = ranking_cache_key(rfo)
+        with self._lock:
+            entry = self._entries.get(rfo.id)
+            if entry is None:
+                return None
+            expired = time.monotonic() - entry.created_at > self._ttl_seconds
+            if entry.key != key or expired:
+                del self._entries[rfo.id]
+                return None
+            self._entries.move_to_end(rfo.id)
+            return entry
+
+    def store(
+        self,
+        rfo: RFO,
+        offer_ids: Sequence[int],
+        scores: Sequence[float],
+        generation: int,
+    ) -> RankingEntry:
+        entry = RankingEntry(key=ranking_cache_key(rfo), created_at=time.monotonic())
+        entry.ranking = sorted(zip((-score for score in scores), offer_ids))
+        with self._lock:
+            if self._generations.get(rfo.id, 0) != generation:
+                return entry
+            self._entries[rfo.id] = entry
+            self._entries.move_to_end(rfo.id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def insert(
+        self,
+        rfo_id: int,
+        key: tuple[int, str, str],
+        score: float,
+        offer: Offer,
+    ) -> None:
+        with self._lock:
+            self._generations[rfo_id] = self._generations.get(rfo_id, 0) + 1
+            entry = self._entries.get(rfo_id)
+            if entry is None:
+                return
+            if entry.key != key:
+                del self._entries[rfo_id]
+                return
+            bisect.insort(entry.ranking, (-score, offer.id))
+            entry.offers[offer.id] = offer
+
+    def invalidate(self, rfo_id: int) -> None:
+        with self._lock:
+            self._generations[rfo_id] = self._generations.get(rfo_id, 0) + 1
+            self._entries.pop(rfo_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+
+ranking_cache = RankingCache(
+    max_entries=settings.ranking_cache_max_entries,
+    ttl_seconds=settings.ranking_cache_ttl_seconds,
+)
@@ -1,7 +1,164 @@
+import heapq
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, select
 
-from intentbid.app.core.scoring import score_offer
+from intentbid.app.core.config import settings
+from intentbid.app.core.scoring import get_scorer, score_offers_batch, scoring_config_version
+from intentbid.app.core.scoring_sql import build_score_expression
 from intentbid.app.db.models import Offer, RFO
+from intentbid.app.services.ranking_cache import RankingEntry, ranking_cache, snapshot_offer
+
+
+def has_fresh_scores(rfo: RFO) -> bool:
+    return rfo.offer_score_version == scoring_config_version(rfo)
+
+
+def _stale_scores(rfo_id: int, version: str):
+    return and_(
+        Offer.rfo_id == rfo_id,
+        or_(
+            Offer.score_version.is_(None),
+            Offer.score_version < version,
+            Offer.score_version > version,
+        ),
+    )
+
+
+def _persisted_scores_current(session: Session, rfo: RFO) -> bool:
+    if not has_fresh_scores(rfo):
+        return False
+    stale = session.exec(
+        select(Offer.rfo_id).where(_stale_scores(rfo.id, rfo.offer_score_version)).limit(1)
+    ).first()
+    if stale is None:
+        return True
+    rescore_rfo_offers(session, rfo.id)
+    return has_fresh_scores(rfo)
+
+
+def _score_offer_columns(
+    session: Session,
+    rfo: RFO,
+) -> tuple[tuple[int, ...], list[float]]:
+    if _persisted_scores_current(session, rfo):
+        rows = session.exec(
+            select(Offer.id, Offer.score).where(Offer.rfo_id == rfo.id).order_by(Offer.id)
+        ).all()
+        if not rows:
+            return (), []
+        ids, scores = zip(*rows)
+        return ids, list(scores)
+
+    rows = session.exec(
+        select(
+            Offer.id,
+            Offer.price_amount,
+            Offer.delivery_eta_days,
+            Offer.warranty_months,
+            Offer.stock,
+        )
+        .where(Offer.rfo_id == rfo.id)
+        .order_by(Offer.id)
+    ).all()
+    if not rows:
+        return (), []
+
+    ids, prices, etas, warranties, stocks = zip(*rows)
+    return ids, score_offers_batch(rfo, prices, etas, warranties, stocks)
+
+
+def _fetch_offers(session: Session, offer_ids: list[int]) -> list[Offer]:
+    if not offer_ids:
+        return []
+    offers = session.exec(select(Offer).where(Offer.id.in_(offer_ids))).all()
+    offers_by_id = {offer.id: offer for offer in offers}
+    return [offers_by_id[offer_id] for offer_id in offer_ids]
+
+
+def _select_top_offers(
+    session: Session,
+    rfo: RFO,
+    top_k: int,
+) -> list[Offer]:
+    ids, scores = _score_offer_columns(session, rfo)
+    winners = heapq.nlargest(top_k, range(len(ids)), key=scores.__getitem__)
+    return _fetch_offers(session, [ids[index] for index in winners])
+
+
+def _select_top_offers_sql(
+    session: Session,
+    rfo: RFO,
+    top_k: int,
+) -> list[Offer]:
+    score = build_score_expression(rfo)
+    return list(
+        session.exec(
+            select(Offer)
+            .where(Offer.rfo_id == rfo.id)
+            .order_by(score.desc(), Offer.id)
+            .limit(top_k)
+        ).all()
+    )
+
+
+def _select_top_offers_persisted(
+    session: Session,
+    rfo: RFO,
+    top_k: int,
+) -> list[Offer]:
+    return list(
+        session.exec(
+            select(Offer)
+            .where(Offer.rfo_id == rfo.id)
+            .order_by(Offer.score.desc(), Offer.id)
+            .limit(top_k)
+        ).all()
+    )
+
+
+def _select_ranked_offers(session: Session, rfo: RFO) -> list[Offer]:
+    offers = list(
+        session.exec(
+            select(Offer).where(Offer.rfo_id == rfo.id).order_by(Offer.id)
+        ).all()
+    )
+    scores = score_offers_batch(
+        rfo,
+        [offer.price_amount for offer in offers],
+        [offer.delivery_eta_days for offer in offers],
+        [offer.warranty_months for offer in offers],
+        [offer.stock for offer in offers],
+    )
+    order = sorted(range(len(offers)), key=scores.__getitem__, reverse=True)
+    return [offers[index] for index in order]
+
+
+def _load_cached_ranking(session: Session, rfo: RFO) -> RankingEntry:
+    entry = ranking_cache.get(rfo)
+    if entry is not None:
+        return entry
+
+    generation = ranking_cache.generation(rfo.id)
+    ids, scores = _score_offer_columns(session, rfo)
+    return ranking_cache.store(rfo, ids, scores, generation)
+
+
+def _cached_offers(
+    session: Session,
+    rfo: RFO,
+    entry: RankingEntry,
+    offer_ids: list[int],
+) -> list[Offer]:
+    missing = [offer_id for offer_id in offer_ids if offer_id not in entry.offers]
+    if len(missing) > settings.ranking_cache_fetch_batch:
+        loaded = session.exec(select(Offer).where(Offer.rfo_id == rfo.id)).all()
+    else:
+        loaded = _fetch_offers(session, missing)
+    for offer in loaded:
+        entry.offers.setdefault(offer.id, snapshot_offer(offer))
+    return [entry.offers[offer_id] for offer_id in offer_ids]
 
 
 def get_best_offers(
@@ -13,10 +170,17 @@ def get_best_offers(
     if not rfo:
         return None, []
 
-    offers = session.exec(select(Offer).where(Offer.rfo_id == rfo_id)).all()
-    scored = [(offer, *score_offer(offer, rfo)) for offer in offers]
-    scored.sort(key=lambda item: item[1], reverse=True)
-    return rfo, scored[:top_k]
+    if settings.ranking_cache_enabled:
+        entry = _load_cached_ranking(session, rfo)
+        offers = _cached_offers(session, rfo, entry, entry.offer_ids(top_k))
+    elif _persisted_scores_current(session, rfo):
+        offers = _select_top_offers_persisted(session, rfo, top_k)
+    elif settings.ranking_backend == "sql":
+        offers = _select_top_offers_sql(session, rfo, top_k)
+    else:
+        offers = _select_top_offers(session, rfo, top_k)
+    scorer = get_scorer(rfo)
+    return rfo, [(offer, *scorer.score(offer)) for offer in offers]
 
 
 def get_ranked_offers(
@@ -27,7 +191,59 @@ def get_ranked_offers(
     if not rfo:
         return None, []
 
-    offers = session.exec(select(Offer).where(Offer.rfo_id == rfo_id)).all()
-    scored = [(offer, *score_offer(offer, rfo)) for offer in offers]
-    scored.sort(key=lambda item: item[1], reverse=True)
-    return rfo, scored
+    if settings.ranking_cache_enabled:
+        entry = _load_cached_ranking(session, rfo)
+        offers = _cached_offers(session, rfo, entry, entry.offer_ids())
+    else:
+        offers = _select_ranked_offers(session, rfo)
+    scorer = get_scorer(rfo)
+    return rfo, [(offer, *scorer.score(offer)) for offer in offers]
+
+
+def rescore_rfo_offers(session: Session, rfo_id: int) -> int:
+    rfo = session.get(RFO, rfo_id)
+    if not rfo:
+        return 0
+
+    rescored = 0
+    while True:
+        version = scoring_config_version(rfo)
+        rows = session.exec(
+            select(
+                Offer.id,
+                Offer.price_amount,
+                Offer.delivery_eta_days,
+                Offer.warranty_months,
+                Offer.stock,
+            )
+            .where(_stale_scores(rfo_id, version))
+            .order_by(Offer.id)
+            .limit(settings.rescore_batch_size)
+        ).all()
+        if not rows:
+            break
+
+        ids, prices, etas, warranties, stocks = zip(*rows)
+        scores = score_offers_batch(rfo, prices, etas, warranties, stocks)
+        session.execute(
+            update(Offer),
+            [
+                {"id": offer_id, "score": float(score), "score_version": version}
+                for offer_id, score in zip(ids, scores)
+            ],
+        )
+        session.commit()
+        rescored += len(rows)
+
+    if rfo.offer_score_version != version:
+        rfo.offer_score_version = version
+        session.add(rfo)
+        session.commit()
+    if rescored:
+        ranking_cache.invalidate(rfo_id)
+    return rescored
+
+
+def rescore_rfo_offers_job(bind: Engine, rfo_id: int) -> None:
+    with Session(bind) as session:
+        rescore_rfo_offers(session, rfo_id)
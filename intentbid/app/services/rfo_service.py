@@ -1,10 +1,16 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import func
+from sqlalchemy import func, text, union
 from sqlmodel import Session, select
 
-from intentbid.app.db.models import AuditLog, Offer, RFO, Vendor
-from intentbid.app.services.webhook_service import enqueue_event
+from intentbid.app.core.pagination import keyset_before, next_page
+from intentbid.app.core.scoring import scoring_config_version
+from intentbid.app.db.models import AuditLog, Offer, RFO
+from intentbid.app.services.count_cache import CountKey, rfo_count_cache, rfo_count_key
+from intentbid.app.services.match_index import open_rfo_index
+from intentbid.app.services.matching_service import matching_vendor_ids
+from intentbid.app.services.ranking_cache import ranking_cache
+from intentbid.app.services.webhook_service import enqueue_broadcast_event
 
 
 def _sync_request_fields(
@@ -35,13 +41,14 @@ def _enqueue_rfo_event(
     rfo: RFO,
     offer_id: int | None = None,
 ) -> None:
-    vendor_ids = session.exec(select(Vendor.id)).all()
     payload = {"rfo_id": rfo.id, "status": rfo.status}
     if offer_id is not None:
         payload["offer_id"] = offer_id
 
-    for vendor_id in vendor_ids:
-        enqueue_event(session, vendor_id=vendor_id, event_type=event_type, payload=payload)
+    vendor_ids = matching_vendor_ids(rfo)
+    if event_type != "rfo.created":
+        vendor_ids = union(vendor_ids, select(Offer.vendor_id).where(Offer.rfo_id == rfo.id))
+    enqueue_broadcast_event(session, event_type, payload, vendor_ids, commit=False)
 
 
 def create_rfo(
@@ -77,10 +84,14 @@ def create_rfo(
         location=location,
         expires_at=expires_at,
     )
+    rfo.offer_score_version = scoring_config_version(rfo)
     session.add(rfo)
+    session.flush()
+    _enqueue_rfo_event(session, "rfo.created", rfo)
     session.commit()
     session.refresh(rfo)
-    _enqueue_rfo_event(session, "rfo.created", rfo)
+    rfo_count_cache.clear()
+    open_rfo_index.upsert(rfo)
     return rfo
 
 
@@ -105,7 +116,9 @@ def list_rfos(
     buyer_id: int | None = None,
     limit: int = 20,
     offset: int = 0,
-) -> tuple[list[RFO], int]:
+    cursor: tuple[datetime, int] | None = None,
+    include_total: str = "exact",
+) -> tuple[list[RFO], int | None, str | None]:
     query = select(RFO)
     if buyer_id is not None:
         query = query.where(RFO.buyer_id == buyer_id)
@@ -120,11 +133,45 @@ def list_rfos(
     if deadline_max is not None:
         query = query.where(RFO.delivery_deadline_days <= deadline_max)
 
-    total = session.exec(select(func.count()).select_from(query.subquery())).one()
-    items = session.exec(
-        query.order_by(RFO.created_at.desc()).offset(offset).limit(limit)
+    total = None
+    if cursor is None:
+        key = rfo_count_key(status, category, budget_min, budget_max, deadline_max, buyer_id)
+        total = _rfo_total(session, query, key, include_total)
+        query = query.offset(offset)
+    else:
+        query = query.where(keyset_before(RFO.created_at, RFO.id, cursor))
+    rows = session.exec(
+        query.order_by(RFO.created_at.desc(), RFO.id.desc()).limit(limit + 1)
     ).all()
-    return items, total
+    items, next_cursor = next_page(rows, limit, lambda rfo: (rfo.created_at, rfo.id))
+    return items, total, next_cursor
+
+
+def _estimated_rfo_rows(session: Session) -> int | None:
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = session.execute(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": RFO.__tablename__},
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def _rfo_total(session: Session, query, key: CountKey, include_total: str) -> int | None:
+    if include_total == "false":
+        return None
+    if include_total == "estimate" and all(value is None for value in key):
+        estimate = _estimated_rfo_rows(session)
+        if estimate is not None:
+            return estimate
+    generation = rfo_count_cache.generation()
+    total = rfo_count_cache.get(key)
+    if total is None:
+        total = session.exec(select(func.count()).select_from(query.subquery())).one()
+        rfo_count_cache.store(key, total, generation)
+    return total
 
 
 def _log_rfo_action(
@@ -150,6 +197,7 @@ def _transition_rfo(
     to_status: str,
     action: str,
     reason: str | None = None,
+    event_type: str | None = None,
 ) -> tuple[RFO | None, str | None]:
     rfo = session.get(RFO, rfo_id)
     if not rfo:
@@ -162,16 +210,20 @@ def _transition_rfo(
     session.add(rfo)
     metadata = {"reason": reason} if reason else {}
     _log_rfo_action(session, rfo_id, action, metadata)
+    if event_type:
+        _enqueue_rfo_event(session, event_type, rfo)
     session.commit()
     session.refresh(rfo)
+    ranking_cache.invalidate(rfo_id)
+    rfo_count_cache.clear()
+    open_rfo_index.upsert(rfo)
     return rfo, None
 
 
 def close_rfo(session: Session, rfo_id: int, reason: str | None = None) -> tuple[RFO | None, str | None]:
-    rfo, error = _transition_rfo(session, rfo_id, {"OPEN"}, "CLOSED", "close", reason)
-    if not error and rfo:
-        _enqueue_rfo_event(session, "rfo.closed", rfo)
-    return rfo, error
+    return _transition_rfo(
+        session, rfo_id, {"OPEN"}, "CLOSED", "close", reason, event_type="rfo.closed"
+    )
 
 
 def award_rfo(
@@ -203,10 +255,12 @@ def award_rfo(
     if offer_id is not None:
         metadata["offer_id"] = offer_id
     _log_rfo_action(session, rfo_id, "award", metadata)
+    _enqueue_rfo_event(session, "rfo.awarded", rfo, offer_id=offer_id)
 
     session.commit()
     session.refresh(rfo)
-    _enqueue_rfo_event(session, "rfo.awarded", rfo, offer_id=offer_id)
+    ranking_cache.invalidate(rfo_id)
+    rfo_count_cache.clear()
     return rfo, None
 
 
@@ -230,6 +284,7 @@ def update_rfo_scoring_config(
     session.add(rfo)
     session.commit()
     session.refresh(rfo)
+    ranking_cache.invalidate(rfo_id)
     return rfo
 
 
@@ -278,4 +333,7 @@ def update_rfo(
     _log_rfo_action(session, rfo_id, "update", {"fields": sorted(updates.keys())})
     session.commit()
     session.refresh(rfo)
+    ranking_cache.invalidate(rfo_id)
+    rfo_count_cache.clear()
+    open_rfo_index.upsert(rfo)
     return rfo, None
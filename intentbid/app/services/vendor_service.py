@@ -1,9 +1,14 @@
 from datetime import datetime, timezone
 
+from sqlalchemy import delete
 from sqlmodel import Session, select
 
+from intentbid.app.core.config import settings
 from intentbid.app.core.security import generate_api_key, hash_api_key
-from intentbid.app.db.models import Vendor, VendorApiKey, VendorProfile
+from intentbid.app.db.models import Vendor, VendorApiKey, VendorProfile, VendorProfileTerm
+from intentbid.app.services.auth_cache import rejected_vendor_keys, vendor_principal_cache
+from intentbid.app.services.key_usage import key_usage_buffer
+from intentbid.app.services.matching_service import profile_terms
 
 
 def register_vendor(session: Session, name: str) -> tuple[Vendor, str]:
@@ -21,34 +26,37 @@ def register_vendor(session: Session, name: str) -> tuple[Vendor, str]:
 
 def get_vendor_by_api_key(session: Session, api_key: str) -> Vendor | None:
     api_key_hash = hash_api_key(api_key)
+    if settings.auth_cache_enabled:
+        cached = vendor_principal_cache.get(api_key_hash)
+        if cached is not None:
+            key_id, vendor = cached
+            key_usage_buffer.record(VendorApiKey, key_id)
+            return vendor
+        if api_key_hash in rejected_vendor_keys:
+            return None
+    generation = vendor_principal_cache.generation()
+    resolved = _load_vendor_by_key_hash(session, api_key_hash)
+    if resolved is None:
+        if settings.auth_cache_enabled:
+            rejected_vendor_keys.add(api_key_hash)
+        return None
+    key_id, vendor = resolved
+    key_usage_buffer.record(VendorApiKey, key_id)
+    if settings.auth_cache_enabled:
+        vendor_principal_cache.store(api_key_hash, key_id, vendor, generation)
+    return vendor
+
+
+def _load_vendor_by_key_hash(session: Session, api_key_hash: str) -> tuple[int, Vendor] | None:
     key = session.exec(
         select(VendorApiKey).where(
             VendorApiKey.hashed_key == api_key_hash,
         )
     ).first()
-    if key:
-        if key.status != "active":
-            return None
-        key.last_used_at = datetime.now(timezone.utc)
-        session.add(key)
-        session.commit()
-        return session.get(Vendor, key.vendor_id)
-
-    vendor = session.exec(
-        select(Vendor).where(Vendor.api_key_hash == api_key_hash)
-    ).first()
-    if not vendor:
+    if not key or key.status != "active":
         return None
-
-    key = VendorApiKey(
-        vendor_id=vendor.id,
-        hashed_key=api_key_hash,
-        status="active",
-        last_used_at=datetime.now(timezone.utc),
-    )
-    session.add(key)
-    session.commit()
-    return vendor
+    vendor = session.get(Vendor, key.vendor_id)
+    return (key.id, vendor) if vendor else None
 
 
 def create_vendor_key(session: Session, vendor_id: int) -> tuple[VendorApiKey, str]:
@@ -74,6 +82,7 @@ def revoke_vendor_key(session: Session, vendor_id: int, key_id: int) -> VendorAp
         session.add(key)
         session.commit()
         session.refresh(key)
+    vendor_principal_cache.invalidate(key.hashed_key)
     return key
 
 
@@ -107,6 +116,11 @@ def upsert_vendor_profile(
         profile.min_order_value = min_order_value
 
     session.add(profile)
+    session.execute(delete(VendorProfileTerm).where(VendorProfileTerm.vendor_id == vendor_id))
+    session.add_all(
+        VendorProfileTerm(vendor_id=vendor_id, kind=kind, value=value)
+        for kind, value in profile_terms(categories, regions)
+    )
     session.commit()
     session.refresh(profile)
     return profile
@@ -1,33 +1,53 @@
+import asyncio
 import hmac
 import json
+import random
 import secrets
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from typing import Iterator
+from urllib.parse import urlsplit
 
 import httpx
+from sqlalchemy import CompoundSelect, Select, insert, literal, or_, update
 from sqlmodel import Session, select
 
-from intentbid.app.db.models import EventOutbox, VendorWebhook
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import EventOutbox, Vendor, VendorWebhook
 
 
-def register_vendor_webhook(session: Session, vendor_id: int, url: str) -> VendorWebhook:
+RECEIVER_REJECTED = "rejected_by_receiver"
+NO_ACTIVE_WEBHOOK = "no_active_webhook"
+
+
+def register_vendor_webhook(
+    session: Session,
+    vendor_id: int,
+    url: str,
+    *,
+    batch_max_events: int = 1,
+) -> VendorWebhook:
     secret = secrets.token_urlsafe(32)
-    webhook = VendorWebhook(vendor_id=vendor_id, url=url, secret=secret, is_active=True)
+    webhook = VendorWebhook(
+        vendor_id=vendor_id,
+        url=url,
+        secret=secret,
+        is_active=True,
+        batch_max_events=batch_max_events,
+    )
     session.add(webhook)
     session.commit()
     session.refresh(webhook)
-    pending_events = session.exec(
-        select(EventOutbox).where(
+    session.execute(
+        update(EventOutbox)
+        .where(
             EventOutbox.vendor_id == vendor_id,
             EventOutbox.status == "pending",
             EventOutbox.created_at <= webhook.created_at,
         )
-    ).all()
-    if pending_events:
-        for event in pending_events:
-            event.status = "delivered"
-            event.delivered_at = webhook.created_at
-            session.add(event)
-        session.commit()
+        .values(status="delivered", delivered_at=webhook.created_at)
+    )
+    session.commit()
     return webhook
 
 
@@ -36,6 +56,8 @@ def enqueue_event(
     vendor_id: int,
     event_type: str,
     payload: dict,
+    *,
+    commit: bool = True,
 ) -> EventOutbox:
     event = EventOutbox(
         vendor_id=vendor_id,
@@ -46,88 +68,528 @@ def enqueue_event(
         next_attempt_at=datetime.now(timezone.utc),
     )
     session.add(event)
-    session.commit()
-    session.refresh(event)
+    if commit:
+        session.commit()
+        session.refresh(event)
     return event
 
 
+def enqueue_broadcast_event(
+    session: Session,
+    event_type: str,
+    payload: dict,
+    vendor_ids: Select | CompoundSelect | None = None,
+    *,
+    commit: bool = True,
+) -> int:
+    if vendor_ids is None:
+        vendor_ids = select(Vendor.id)
+    columns = EventOutbox.__table__.c
+    now = datetime.now(timezone.utc)
+    recipients = vendor_ids.subquery()
+    statement = insert(EventOutbox).from_select(
+        [
+            columns.vendor_id,
+            columns.event_type,
+            columns.payload,
+            columns.status,
+            columns.attempts,
+            columns.next_attempt_at,
+            columns.created_at,
+        ],
+        select(
+            recipients.c[0],
+            literal(event_type, columns.event_type.type),
+            literal(payload, columns.payload.type),
+            literal("pending", columns.status.type),
+            literal(0, columns.attempts.type),
+            literal(now, columns.next_attempt_at.type),
+            literal(now, columns.created_at.type),
+        ),
+    )
+    result = session.execute(statement)
+    if commit:
+        session.commit()
+    return result.rowcount
+
+
 def _serialize_payload(event: EventOutbox) -> str:
     envelope = {"event_type": event.event_type, "data": event.payload}
     return json.dumps(envelope, separators=(",", ":"), sort_keys=True)
 
 
+def _serialize_batch(events: list[EventOutbox]) -> str:
+    envelope = {
+        "events": [
+            {"event_id": event.id, "event_type": event.event_type, "data": event.payload}
+            for event in events
+        ]
+    }
+    return json.dumps(envelope, separators=(",", ":"), sort_keys=True)
+
+
 def _sign_payload(secret: str, payload: str) -> str:
     return hmac.new(secret.encode("utf-8"), payload.encode("utf-8"), "sha256").hexdigest()
 
 
-def dispatch_outbox(
+def _due_conditions(max_attempts: int, current_time: datetime) -> list:
+    return [
+        EventOutbox.status == "pending",
+        EventOutbox.next_attempt_at <= current_time,
+        EventOutbox.attempts < max_attempts,
+        or_(EventOutbox.locked_until.is_(None), EventOutbox.locked_until <= current_time),
+    ]
+
+
+def _due_event_batches(
     session: Session,
-    client: httpx.Client,
+    max_attempts: int,
+    current_time: datetime,
+    batch_size: int | None = None,
+) -> Iterator[list[EventOutbox]]:
+    batch_size = batch_size or settings.outbox_batch_size
+    last_id = 0
+    while True:
+        events = session.exec(
+            select(EventOutbox)
+            .where(*_due_conditions(max_attempts, current_time), EventOutbox.id > last_id)
+            .order_by(EventOutbox.id)
+            .limit(batch_size)
+        ).all()
+        if not events:
+            return
+        last_id = events[-1].id
+        yield events
+        if len(events) < batch_size:
+            return
+
+
+def claim_outbox_batch(
+    session: Session,
+    worker_id: str,
     *,
+    batch_size: int | None = None,
+    lease_seconds: int | None = None,
     max_attempts: int = 3,
     now: datetime | None = None,
-) -> int:
+) -> list[EventOutbox]:
     current_time = now or datetime.now(timezone.utc)
-    events = session.exec(
-        select(EventOutbox).where(
-            EventOutbox.status == "pending",
-            EventOutbox.attempts < max_attempts,
+    batch_size = batch_size or settings.outbox_batch_size
+    lease_seconds = lease_seconds or settings.outbox_lease_seconds
+    locked_until = current_time + timedelta(seconds=lease_seconds)
+
+    candidates = (
+        select(EventOutbox.id)
+        .where(*_due_conditions(max_attempts, current_time))
+        .order_by(EventOutbox.id)
+        .limit(batch_size)
+    )
+    if session.get_bind().dialect.name == "postgresql":
+        candidates = candidates.with_for_update(skip_locked=True)
+    claimed_ids = session.execute(
+        update(EventOutbox)
+        .where(
+            EventOutbox.id.in_(candidates.scalar_subquery()),
+            or_(EventOutbox.locked_until.is_(None), EventOutbox.locked_until <= current_time),
         )
+        .values(locked_by=worker_id, locked_until=locked_until)
+        .returning(EventOutbox.id)
+    ).scalars().all()
+    session.commit()
+    if not claimed_ids:
+        return []
+    return session.exec(
+        select(EventOutbox)
+        .where(EventOutbox.id.in_(claimed_ids), EventOutbox.locked_by == worker_id)
+        .order_by(EventOutbox.id)
     ).all()
-    delivered = 0
 
+
+def _active_webhooks_by_vendor(
+    session: Session,
+    events: list[EventOutbox],
+) -> dict[int, list[VendorWebhook]]:
+    vendor_ids = {event.vendor_id for event in events}
+    webhooks: dict[int, list[VendorWebhook]] = defaultdict(list)
+    if not vendor_ids:
+        return webhooks
+    for webhook in session.exec(
+        select(VendorWebhook)
+        .where(
+            VendorWebhook.vendor_id.in_(vendor_ids),
+            VendorWebhook.is_active.is_(True),
+        )
+        .order_by(VendorWebhook.id)
+    ).all():
+        webhooks[webhook.vendor_id].append(webhook)
+    return webhooks
+
+
+def _delivery_headers(webhook: VendorWebhook, payload: str) -> dict[str, str]:
+    return {
+        "Content-Type": "application/json",
+        "X-IntentBid-Signature": _sign_payload(webhook.secret, payload),
+    }
+
+
+def _delivery_error(response: httpx.Response) -> str | None:
+    if response.status_code >= 400:
+        return f"status_{response.status_code}"
+    return None
+
+
+def _batch_size(webhook: VendorWebhook) -> int:
+    return max(webhook.batch_max_events or 1, 1)
+
+
+def _response_errors(
+    response: httpx.Response,
+    webhook: VendorWebhook,
+    events: list[EventOutbox],
+) -> list[str | None]:
+    error = _delivery_error(response)
+    if error or _batch_size(webhook) == 1:
+        return [error] * len(events)
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    failed = set()
+    if isinstance(body, dict) and isinstance(body.get("failed_event_ids"), list):
+        failed = set(body["failed_event_ids"])
+    return [RECEIVER_REJECTED if event.id in failed else None for event in events]
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _jittered(delay_seconds: float) -> timedelta:
+    return timedelta(seconds=random.uniform(delay_seconds / 2, delay_seconds))
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    delay = settings.webhook_retry_base_seconds * 2 ** max(attempts - 1, 0)
+    return _jittered(min(delay, settings.webhook_retry_max_seconds))
+
+
+def _circuit_state(webhook: VendorWebhook, current_time: datetime) -> str:
+    if webhook.consecutive_failures < settings.webhook_circuit_failure_threshold:
+        return "closed"
+    if webhook.circuit_open_until and _as_utc(webhook.circuit_open_until) > current_time:
+        return "open"
+    return "half_open"
+
+
+def _plan_requests(
+    events: list[EventOutbox],
+    webhooks_by_vendor: dict[int, list[VendorWebhook]],
+    current_time: datetime,
+) -> tuple[
+    list[tuple[VendorWebhook, list[EventOutbox], str]],
+    list[tuple[EventOutbox, datetime]],
+    list[EventOutbox],
+]:
+    events_by_vendor: dict[int, list[EventOutbox]] = defaultdict(list)
     for event in events:
-        if event.next_attempt_at:
-            next_attempt_at = event.next_attempt_at
-            if next_attempt_at.tzinfo is None:
-                next_attempt_at = next_attempt_at.replace(tzinfo=timezone.utc)
-            if next_attempt_at > current_time:
-                continue
-        webhooks = session.exec(
-            select(VendorWebhook).where(
-                VendorWebhook.vendor_id == event.vendor_id,
-                VendorWebhook.is_active.is_(True),
-            )
-        ).all()
+        events_by_vendor[event.vendor_id].append(event)
+
+    requests: list[tuple[VendorWebhook, list[EventOutbox], str]] = []
+    deferred: list[tuple[EventOutbox, datetime]] = []
+    skipped: list[EventOutbox] = []
+    for vendor_id, vendor_events in events_by_vendor.items():
+        webhooks = webhooks_by_vendor.get(vendor_id, [])
         if not webhooks:
+            skipped.extend(vendor_events)
+            continue
+        states = [_circuit_state(webhook, current_time) for webhook in webhooks]
+        if "open" in states:
+            reopen_at = max(
+                _as_utc(webhook.circuit_open_until)
+                for webhook, state in zip(webhooks, states)
+                if state == "open"
+            )
+            deferred.extend((event, reopen_at) for event in vendor_events)
             continue
+        if "half_open" in states:
+            deferred.extend((event, current_time) for event in vendor_events[1:])
+            vendor_events = vendor_events[:1]
+
+        for webhook in webhooks:
+            size = _batch_size(webhook)
+            if size == 1:
+                requests.extend(
+                    (webhook, [event], _serialize_payload(event)) for event in vendor_events
+                )
+                continue
+            for start in range(0, len(vendor_events), size):
+                chunk = vendor_events[start : start + size]
+                requests.append((webhook, chunk, _serialize_batch(chunk)))
+    return requests, deferred, skipped
 
-        payload = _serialize_payload(event)
-        success = True
-        last_error = None
+
+def _circuit_open(webhook: VendorWebhook) -> bool:
+    return _circuit_state(webhook, datetime.now(timezone.utc)) == "open"
+
+
+def _record_request_health(webhook: VendorWebhook, errors: list[str | None]) -> None:
+    if all(error in (None, RECEIVER_REJECTED) for error in errors):
+        webhook.consecutive_failures = 0
+        webhook.circuit_open_until = None
+        return
+    webhook.consecutive_failures += 1
+    overflow = webhook.consecutive_failures - settings.webhook_circuit_failure_threshold
+    if overflow >= 0:
+        open_seconds = min(
+            settings.webhook_circuit_open_seconds * 2 ** min(overflow, 16),
+            settings.webhook_circuit_max_open_seconds,
+        )
+        webhook.circuit_open_until = datetime.now(timezone.utc) + _jittered(open_seconds)
+
+
+def _record_delivery(
+    session: Session,
+    event: EventOutbox,
+    webhooks: list[VendorWebhook],
+    errors: list[str | None],
+    max_attempts: int,
+) -> bool:
+    failures = [error for error in errors if error is not None]
+    event.attempts += 1
+    event.locked_by = None
+    event.locked_until = None
+    if not failures:
+        event.status = "delivered"
+        event.delivered_at = datetime.now(timezone.utc)
         for webhook in webhooks:
-            signature = _sign_payload(webhook.secret, payload)
+            webhook.last_delivery_at = event.delivered_at
+            session.add(webhook)
+    elif event.attempts >= max_attempts:
+        event.status = "dead"
+        event.last_error = failures[-1]
+    else:
+        event.status = "pending"
+        event.last_error = failures[-1]
+        event.next_attempt_at = datetime.now(timezone.utc) + _retry_delay(event.attempts)
+    session.add(event)
+    return not failures
+
+
+def _record_results(
+    session: Session,
+    requests: list[tuple[VendorWebhook, list[EventOutbox], str]],
+    results: list[list[str | None] | None],
+    deferred: list[tuple[EventOutbox, datetime]],
+    skipped: list[EventOutbox],
+    max_attempts: int,
+    commit_batch_size: int | None = None,
+) -> int:
+    events: dict[int, EventOutbox] = {}
+    webhooks: dict[int, list[VendorWebhook]] = defaultdict(list)
+    errors: dict[int, list[str | None]] = defaultdict(list)
+    short_circuited: dict[int, tuple[EventOutbox, datetime]] = {}
+    for (webhook, chunk, _), chunk_errors in zip(requests, results):
+        session.add(webhook)
+        if chunk_errors is None:
+            reopen_at = _as_utc(webhook.circuit_open_until)
+            for event in chunk:
+                previous = short_circuited.get(event.id)
+                if previous is None or previous[1] < reopen_at:
+                    short_circuited[event.id] = (event, reopen_at)
+            continue
+        for event, error in zip(chunk, chunk_errors):
+            events[event.id] = event
+            webhooks[event.id].append(webhook)
+            errors[event.id].append(error)
+
+    for event_id in short_circuited:
+        events.pop(event_id, None)
+    deferred = [*deferred, *short_circuited.values()]
+    for event, next_attempt_at in deferred:
+        event.next_attempt_at = next_attempt_at
+        event.locked_by = None
+        event.locked_until = None
+        session.add(event)
+    for event in skipped:
+        event.status = "skipped"
+        event.last_error = NO_ACTIVE_WEBHOOK
+        event.locked_by = None
+        event.locked_until = None
+        session.add(event)
+
+    delivered = 0
+    for index, (event_id, event) in enumerate(events.items(), start=1):
+        if _record_delivery(session, event, webhooks[event_id], errors[event_id], max_attempts):
+            delivered += 1
+        if commit_batch_size and index % commit_batch_size == 0:
+            session.commit()
+    session.commit()
+    return delivered
+
+
+def dispatch_outbox(
+    session: Session,
+    client: httpx.Client,
+    *,
+    max_attempts: int = 3,
+    now: datetime | None = None,
+) -> int:
+    current_time = now or datetime.now(timezone.utc)
+    delivered = 0
+
+    for events in _due_event_batches(session, max_attempts, current_time):
+        requests, deferred, skipped = _plan_requests(
+            events,
+            _active_webhooks_by_vendor(session, events),
+            current_time,
+        )
+        results: list[list[str | None] | None] = []
+        for webhook, chunk, payload in requests:
+            if _circuit_open(webhook):
+                results.append(None)
+                continue
             try:
                 response = client.post(
                     webhook.url,
                     content=payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-IntentBid-Signature": signature,
-                    },
-                    timeout=5.0,
+                    headers=_delivery_headers(webhook, payload),
+                    timeout=settings.webhook_timeout_seconds,
                 )
-                if response.status_code >= 400:
-                    success = False
-                    last_error = f"status_{response.status_code}"
+                errors = _response_errors(response, webhook, chunk)
             except httpx.HTTPError as exc:
-                success = False
-                last_error = str(exc)
+                errors = [str(exc)] * len(chunk)
+            _record_request_health(webhook, errors)
+            results.append(errors)
+        delivered += _record_results(
+            session,
+            requests,
+            results,
+            deferred,
+            skipped,
+            max_attempts,
+        )
 
-        event.attempts += 1
-        if success:
-            event.status = "delivered"
-            event.delivered_at = datetime.now(timezone.utc)
-            delivered += 1
-            for webhook in webhooks:
-                webhook.last_delivery_at = event.delivered_at
-                session.add(webhook)
-        else:
-            event.status = "pending"
-            event.last_error = last_error
-            backoff_seconds = min(60 * event.attempts, 300)
-            event.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=backoff_seconds)
-        session.add(event)
-        session.commit()
+    return delivered
+
+
+class WebhookClientPool:
+    def __init__(
+        self,
+        max_connections_per_host: int | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._max_connections = max_connections_per_host or settings.webhook_max_concurrency_per_host
+        self._transport = transport
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    @property
+    def hosts(self) -> list[str]:
+        return list(self._clients)
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        host = urlsplit(url).netloc
+        client = self._clients.get(host)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=settings.webhook_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+            self._clients[host] = client
+        return client
 
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+    async def __aenter__(self) -> "WebhookClientPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+async def dispatch_outbox_async(
+    session: Session,
+    client: httpx.AsyncClient | WebhookClientPool,
+    *,
+    max_attempts: int = 3,
+    now: datetime | None = None,
+    max_concurrency: int | None = None,
+    max_concurrency_per_host: int | None = None,
+    commit_batch_size: int | None = None,
+) -> int:
+    current_time = now or datetime.now(timezone.utc)
+    delivered = 0
+    for events in _due_event_batches(session, max_attempts, current_time):
+        delivered += await deliver_events_async(
+            session,
+            client,
+            events,
+            max_attempts=max_attempts,
+            max_concurrency=max_concurrency,
+            max_concurrency_per_host=max_concurrency_per_host,
+            commit_batch_size=commit_batch_size,
+        )
     return delivered
+
+
+async def deliver_events_async(
+    session: Session,
+    client: httpx.AsyncClient | WebhookClientPool,
+    events: list[EventOutbox],
+    *,
+    max_attempts: int = 3,
+    max_concurrency: int | None = None,
+    max_concurrency_per_host: int | None = None,
+    commit_batch_size: int | None = None,
+) -> int:
+    max_concurrency = max_concurrency or settings.webhook_max_concurrency
+    max_concurrency_per_host = max_concurrency_per_host or settings.webhook_max_concurrency_per_host
+    commit_batch_size = commit_batch_size or settings.webhook_commit_batch_size
+
+    requests, deferred, skipped = _plan_requests(
+        events,
+        _active_webhooks_by_vendor(session, events),
+        datetime.now(timezone.utc),
+    )
+    global_limit = asyncio.Semaphore(max_concurrency)
+    host_limits: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(max_concurrency_per_host)
+    )
+
+    async def post(
+        webhook: VendorWebhook,
+        chunk: list[EventOutbox],
+        payload: str,
+    ) -> list[str | None] | None:
+        headers = _delivery_headers(webhook, payload)
+        host_client = client.get(webhook.url) if isinstance(client, WebhookClientPool) else client
+        async with host_limits[urlsplit(webhook.url).netloc], global_limit:
+            if _circuit_open(webhook):
+                return None
+            try:
+                response = await host_client.post(webhook.url, content=payload, headers=headers)
+            except httpx.HTTPError as exc:
+                errors = [str(exc) or exc.__class__.__name__] * len(chunk)
+            else:
+                errors = _response_errors(response, webhook, chunk)
+        _record_request_health(webhook, errors)
+        return errors
+
+    results = await asyncio.gather(*(post(*request) for request in requests))
+    return _record_results(
+        session,
+        requests,
+        results,
+        deferred,
+        skipped,
+        max_attempts,
+        commit_batch_size,
+    )
@@ -0,0 +1,43 @@
+import argparse
+import logging
+from datetime import timedelta
+
+from sqlmodel import Session
+
+from intentbid.app.db.session import engine
+from intentbid.app.services.outbox_retention_service import ARCHIVE_MODES, compact_outbox
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Archive and delete delivered and dead outbox events past the retention window"
+    )
+    parser.add_argument("--older-than-days", type=float, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--archive", choices=ARCHIVE_MODES, default="table")
+    parser.add_argument("--archive-path", default=None, help="Gzip JSONL file for --archive jsonl")
+    parser.add_argument("--max-chunks", type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.archive == "jsonl" and not args.archive_path:
+        parser.error("--archive-path is required with --archive jsonl")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    older_than = None if args.older_than_days is None else timedelta(days=args.older_than_days)
+    with Session(engine) as session:
+        report = compact_outbox(
+            session,
+            older_than=older_than,
+            chunk_size=args.chunk_size,
+            archive=args.archive,
+            archive_path=args.archive_path,
+            max_chunks=args.max_chunks,
+        )
+    print(
+        f"archive={report.archive} cutoff={report.cutoff.isoformat()} archived={report.archived} "
+        f"deleted={report.deleted} chunks={report.chunks} elapsed={report.elapsed_seconds:.2f}s "
+        f"rows_per_sec={report.rows_per_second:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.session import engine
+from intentbid.app.services.webhook_service import (
+    WebhookClientPool,
+    claim_outbox_batch,
+    deliver_events_async,
+)
+
+logger = logging.getLogger("intentbid.outbox_worker")
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+async def run_worker(
+    session_factory: Callable[[], Session],
+    pool: WebhookClientPool,
+    stop: asyncio.Event,
+    *,
+    worker_id: str,
+    batch_size: int | None = None,
+    lease_seconds: int | None = None,
+    poll_interval: float | None = None,
+    exit_when_idle: bool = False,
+) -> int:
+    poll_interval = settings.outbox_poll_interval_seconds if poll_interval is None else poll_interval
+    delivered = 0
+    while not stop.is_set():
+        try:
+            with session_factory() as session:
+                events = claim_outbox_batch(
+                    session,
+                    worker_id,
+                    batch_size=batch_size,
+                    lease_seconds=lease_seconds,
+                )
+                if events:
+                    delivered += await deliver_events_async(session, pool, events)
+        except SQLAlchemyError:
+            logger.exception("outbox worker %s iteration failed", worker_id)
+        else:
+            if events:
+                continue
+            if exit_when_idle:
+                break
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+        except asyncio.TimeoutError:
+            pass
+    return delivered
+
+
+async def _serve(args: argparse.Namespace) -> int:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    worker_id = args.worker_id or default_worker_id()
+    logger.info("outbox worker %s started", worker_id)
+    async with WebhookClientPool() as pool:
+        delivered = await run_worker(
+            lambda: Session(engine),
+            pool,
+            stop,
+            worker_id=worker_id,
+            batch_size=args.batch_size,
+            lease_seconds=args.lease_seconds,
+            poll_interval=args.poll_interval,
+            exit_when_idle=args.exit_when_idle,
+        )
+    logger.info("outbox worker %s stopped after %s deliveries", worker_id, delivered)
+    return delivered
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Deliver pending outbox events to vendor webhooks")
+    parser.add_argument("--worker-id", default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--lease-seconds", type=int, default=None)
+    parser.add_argument("--poll-interval", type=float, default=None)
+    parser.add_argument(
+        "--exit-when-idle",
+        action="store_true",
+        help="Stop once no due events are left instead of polling",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    delivered = asyncio.run(_serve(args))
+    print(f"delivered={delivered}")
+
+
+if __name__ == "__main__":
+    main()
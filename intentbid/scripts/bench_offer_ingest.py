@@ -0,0 +1,80 @@
+import argparse
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+parser = argparse.ArgumentParser(description="Measure offer ingestion throughput under concurrent vendors")
+parser.add_argument("--api-url", default="http://localhost:8000")
+parser.add_argument("--vendors", type=int, default=8, help="Concurrent vendors")
+parser.add_argument("--offers", type=int, default=50, help="Offers per vendor")
+parser.add_argument(
+    "--per-rfo",
+    type=int,
+    default=5,
+    help="Offers per vendor per RFO (keep <= MAX_OFFERS_PER_VENDOR_RFO)",
+)
+args = parser.parse_args()
+
+client = httpx.Client(base_url=args.api_url, timeout=30.0)
+
+rfo_count = math.ceil(args.offers / args.per_rfo)
+rfo_ids = []
+for _ in range(rfo_count):
+    response = client.post(
+        "/v1/rfo",
+        json={
+            "category": "bench",
+            "constraints": {"budget_max": 200, "delivery_deadline_days": 7},
+            "preferences": {"w_price": 0.6, "w_delivery": 0.3, "w_warranty": 0.1},
+        },
+    )
+    response.raise_for_status()
+    rfo_ids.append(response.json()["rfo_id"])
+
+api_keys = []
+for index in range(args.vendors):
+    response = client.post("/v1/vendors/register", json={"name": f"Bench Vendor {index}"})
+    response.raise_for_status()
+    api_keys.append(response.json()["api_key"])
+
+
+def submit_offers(api_key: str) -> tuple[int, int]:
+    accepted = 0
+    rejected = 0
+    with httpx.Client(base_url=args.api_url, timeout=30.0) as vendor_client:
+        for index in range(args.offers):
+            response = vendor_client.post(
+                "/v1/offers",
+                json={
+                    "rfo_id": rfo_ids[index // args.per_rfo],
+                    "price_amount": 100 + index % 50,
+                    "currency": "USD",
+                    "delivery_eta_days": 1 + index % 7,
+                    "warranty_months": 12,
+                    "return_days": 30,
+                    "stock": True,
+                    "metadata": {"sku": f"BENCH-{index}"},
+                },
+                headers={"X-API-Key": api_key},
+            )
+            if response.status_code == 200:
+                accepted += 1
+            else:
+                rejected += 1
+    return accepted, rejected
+
+
+started = time.perf_counter()
+with ThreadPoolExecutor(max_workers=args.vendors) as executor:
+    results = list(executor.map(submit_offers, api_keys))
+elapsed = time.perf_counter() - started
+
+accepted = sum(result[0] for result in results)
+rejected = sum(result[1] for result in results)
+print(
+    f"vendors={args.vendors} accepted={accepted} rejected={rejected} "
+    f"elapsed={elapsed:.2f}s offers_per_sec={accepted / elapsed:.1f}"
+)
+client.close()
@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from intentbid.app.db.models import Vendor, VendorWebhook
+from intentbid.app.services.webhook_service import enqueue_event
+
+parser = argparse.ArgumentParser(description="Measure outbox throughput with N worker processes")
+parser.add_argument("--workers", type=int, default=4)
+parser.add_argument("--vendors", type=int, default=50)
+parser.add_argument("--events", type=int, default=5000)
+parser.add_argument("--hosts", type=int, default=4, help="Distinct stub webhook hosts")
+parser.add_argument("--port", type=int, default=8091)
+parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub response delay")
+parser.add_argument("--batch-size", type=int, default=200)
+parser.add_argument(
+    "--database-url",
+    default=None,
+    help="Defaults to a fresh SQLite file; pass a Postgres URL to exercise SKIP LOCKED",
+)
+args = parser.parse_args()
+
+RESPONSE = b"HTTP/1.1 200 OK\r\ncontent-length: 0\r\nconnection: keep-alive\r\n\r\n"
+deliveries: Counter[bytes] = Counter()
+connections: set[asyncio.StreamWriter] = set()
+handlers: set[asyncio.Task] = set()
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    handlers.add(asyncio.current_task())
+    connections.add(writer)
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            signature = b""
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+                elif name.lower() == b"x-intentbid-signature":
+                    signature = value.strip()
+            await reader.readexactly(length)
+            deliveries[signature] += 1
+            if args.latency_ms:
+                await asyncio.sleep(args.latency_ms / 1000)
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+        connections.discard(writer)
+        handlers.discard(asyncio.current_task())
+
+
+def seed(database_url: str) -> None:
+    engine = create_engine(database_url)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        vendors = [Vendor(name=f"Bench Vendor {index}", api_key_hash=f"bench-{index}") for index in range(args.vendors)]
+        session.add_all(vendors)
+        session.commit()
+        for index, vendor in enumerate(vendors):
+            host = f"127.0.0.{1 + index % args.hosts}"
+            session.add(
+                VendorWebhook(
+                    vendor_id=vendor.id,
+                    url=f"http://{host}:{args.port}/webhook",
+                    secret=f"secret-{index}",
+                    is_active=True,
+                )
+            )
+        for index in range(args.events):
+            enqueue_event(
+                session,
+                vendor_id=vendors[index % args.vendors].id,
+                event_type="offer.created",
+                payload={"offer_id": index},
+                commit=False,
+            )
+        session.commit()
+    engine.dispose()
+
+
+async def main() -> None:
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{Path(tempfile.mkdtemp()) / 'bench_outbox.db'}"
+    seed(database_url)
+    server = await asyncio.start_server(handle_connection, "0.0.0.0", args.port)
+
+    env = {**os.environ, "DATABASE_URL": database_url, "ENV": "bench"}
+    started = time.perf_counter()
+    workers = [
+        await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "intentbid.app.workers.outbox_worker",
+            "--exit-when-idle",
+            "--batch-size",
+            str(args.batch_size),
+            env=env,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        for _ in range(args.workers)
+    ]
+    await asyncio.gather(*(worker.wait() for worker in workers))
+    elapsed = time.perf_counter() - started
+
+    server.close()
+    for writer in list(connections):
+        writer.close()
+    await asyncio.gather(*handlers, return_exceptions=True)
+    await server.wait_closed()
+
+    delivered = len(deliveries)
+    duplicates = sum(count - 1 for count in deliveries.values())
+    print(
+        f"workers={args.workers} events={args.events} delivered={delivered} "
+        f"duplicates={duplicates} elapsed={elapsed:.2f}s deliveries_per_sec={delivered / elapsed:.1f}"
+    )
+
+
+asyncio.run(main())
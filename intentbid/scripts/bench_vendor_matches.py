@@ -0,0 +1,130 @@
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import RFO, Vendor
+from intentbid.app.services.match_index import open_rfo_index
+from intentbid.app.services.matching_service import list_vendor_matches
+from intentbid.app.services.vendor_service import upsert_vendor_profile
+
+parser = argparse.ArgumentParser(description="Measure /v1/vendors/me/matches query latency")
+parser.add_argument("--rfos", type=int, default=100_000, help="OPEN RFOs to seed (try 1000000)")
+parser.add_argument("--categories", type=int, default=50)
+parser.add_argument("--regions", type=int, default=20)
+parser.add_argument("--iterations", type=int, default=20)
+parser.add_argument("--limit", type=int, default=20)
+parser.add_argument(
+    "--database-url",
+    default=None,
+    help="Defaults to a fresh SQLite file; pass a Postgres URL to benchmark there",
+)
+parser.add_argument(
+    "--baseline",
+    action="store_true",
+    help="Also time the previous load-everything-and-filter-in-Python approach",
+)
+parser.add_argument(
+    "--memory",
+    action="store_true",
+    help="Also time the in-memory inverted index backend (MATCHING_BACKEND=memory)",
+)
+args = parser.parse_args()
+
+CATEGORIES = [f"category-{index}" for index in range(args.categories)]
+REGIONS = [f"region-{index}" for index in range(args.regions)]
+
+
+def seed(engine) -> int:
+    SQLModel.metadata.create_all(engine)
+    created_at = datetime.now(timezone.utc) - timedelta(days=1)
+    with Session(engine) as session:
+        for start in range(0, args.rfos, 10_000):
+            session.execute(
+                insert(RFO),
+                [
+                    {
+                        "category": CATEGORIES[index % len(CATEGORIES)],
+                        "location": REGIONS[index % len(REGIONS)],
+                        "constraints": {},
+                        "preferences": {},
+                        "weights": {},
+                        "status": "OPEN",
+                        "scoring_version": "v1",
+                        "created_at": created_at + timedelta(seconds=index),
+                    }
+                    for index in range(start, min(start + 10_000, args.rfos))
+                ],
+            )
+        vendor = Vendor(name="Bench Vendor", api_key_hash="bench-matches")
+        session.add(vendor)
+        session.commit()
+        upsert_vendor_profile(
+            session,
+            vendor.id,
+            categories=CATEGORIES[:3],
+            regions=REGIONS[:5],
+            lead_time_days=None,
+            min_order_value=None,
+        )
+        return vendor.id
+
+
+def legacy_matches(session: Session, vendor_id: int, limit: int, offset: int):
+    categories = CATEGORIES[:3]
+    regions = REGIONS[:5]
+    rfos = session.exec(
+        select(RFO).where(RFO.status == "OPEN").order_by(RFO.created_at.desc())
+    ).all()
+    matches = [rfo for rfo in rfos if rfo.category in categories and rfo.location in regions]
+    return matches[offset : offset + limit], len(matches)
+
+
+def measure(label: str, query, session: Session, vendor_id: int, offset: int) -> None:
+    timings = []
+    total = 0
+    for _ in range(args.iterations):
+        session.expunge_all()
+        started = time.perf_counter()
+        _, total = query(session, vendor_id, limit=args.limit, offset=offset)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+    print(
+        f"{label} rfos={args.rfos} offset={offset} total={total} "
+        f"p50_ms={statistics.median(timings):.2f} p95_ms={p95:.2f}"
+    )
+
+
+def main() -> None:
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{Path(tempfile.mkdtemp()) / 'bench_matches.db'}"
+    engine = create_engine(database_url)
+    started = time.perf_counter()
+    vendor_id = seed(engine)
+    print(f"seeded rfos={args.rfos} in {time.perf_counter() - started:.1f}s")
+
+    with Session(engine) as session:
+        if args.memory:
+            started = time.perf_counter()
+            size = open_rfo_index.rebuild(session)
+            print(f"index built open_rfos={size} in {time.perf_counter() - started:.2f}s")
+        for offset in (0, 1000):
+            settings.matching_backend = "sql"
+            measure("sql", list_vendor_matches, session, vendor_id, offset)
+            if args.memory:
+                settings.matching_backend = "memory"
+                measure("memory", list_vendor_matches, session, vendor_id, offset)
+            if args.baseline:
+                measure("legacy", legacy_matches, session, vendor_id, offset)
+    engine.dispose()
+
+
+main()
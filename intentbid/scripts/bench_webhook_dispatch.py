@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlmodel import Session, SQLModel, create_engine
+
+from intentbid.app.db.models import Vendor, VendorWebhook
+from intentbid.app.services.webhook_service import (
+    WebhookClientPool,
+    dispatch_outbox,
+    dispatch_outbox_async,
+    enqueue_event,
+)
+
+parser = argparse.ArgumentParser(description="Measure webhook outbox dispatch throughput")
+parser.add_argument("--vendors", type=int, default=50)
+parser.add_argument("--events", type=int, default=5000, help="Total outbox events")
+parser.add_argument("--hosts", type=int, default=4, help="Distinct stub webhook hosts")
+parser.add_argument("--port", type=int, default=8090)
+parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub response delay")
+parser.add_argument("--mode", choices=["async", "sync"], default="async")
+args = parser.parse_args()
+
+RESPONSE = b"HTTP/1.1 200 OK\r\ncontent-length: 0\r\nconnection: keep-alive\r\n\r\n"
+handlers: set[asyncio.Task] = set()
+connections: set[asyncio.StreamWriter] = set()
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    handlers.add(asyncio.current_task())
+    connections.add(writer)
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            if args.latency_ms:
+                await asyncio.sleep(args.latency_ms / 1000)
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+        connections.discard(writer)
+        handlers.discard(asyncio.current_task())
+
+
+def seed(engine) -> None:
+    with Session(engine) as session:
+        vendors = [Vendor(name=f"Bench Vendor {index}", api_key_hash=f"bench-{index}") for index in range(args.vendors)]
+        session.add_all(vendors)
+        session.commit()
+        for index, vendor in enumerate(vendors):
+            host = f"127.0.0.{1 + index % args.hosts}"
+            session.add(
+                VendorWebhook(
+                    vendor_id=vendor.id,
+                    url=f"http://{host}:{args.port}/webhook",
+                    secret=f"secret-{index}",
+                    is_active=True,
+                )
+            )
+        for index in range(args.events):
+            enqueue_event(
+                session,
+                vendor_id=vendors[index % args.vendors].id,
+                event_type="offer.created",
+                payload={"offer_id": index},
+                commit=False,
+            )
+        session.commit()
+
+
+async def main() -> None:
+    server = await asyncio.start_server(handle_connection, "0.0.0.0", args.port)
+    db_path = Path(tempfile.mkdtemp()) / "bench_webhooks.db"
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    seed(engine)
+
+    started = time.perf_counter()
+    with Session(engine) as session:
+        if args.mode == "async":
+            async with WebhookClientPool() as client:
+                delivered = await dispatch_outbox_async(session, client)
+        else:
+            with httpx.Client() as client:
+                delivered = await asyncio.to_thread(dispatch_outbox, session, client)
+    elapsed = time.perf_counter() - started
+
+    server.close()
+    for writer in list(connections):
+        writer.close()
+    await asyncio.gather(*handlers, return_exceptions=True)
+    await server.wait_closed()
+    print(
+        f"mode={args.mode} events={args.events} delivered={delivered} "
+        f"elapsed={elapsed:.2f}s deliveries_per_sec={delivered / elapsed:.1f}"
+    )
+
+
+asyncio.run(main())
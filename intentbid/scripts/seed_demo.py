@@ -6,11 +6,11 @@ from pathlib import Path
 from sqlmodel import Session, SQLModel
 
 from intentbid.app.core.schemas import OfferCreate
-from intentbid.app.db.models import RFO, VendorProfile
+from intentbid.app.db.models import RFO
 from intentbid.app.db.session import engine
 from intentbid.app.services.buyer_service import register_buyer
 from intentbid.app.services.offer_service import create_offer
-from intentbid.app.services.vendor_service import register_vendor
+from intentbid.app.services.vendor_service import register_vendor, upsert_vendor_profile
 
 random.seed(42)
 
@@ -40,14 +40,14 @@ with Session(engine) as session:
         buyers.append({"id": buyer.id, "name": name, "api_key": api_key})
 
     for vendor in vendors:
-        profile = VendorProfile(
-            vendor_id=vendor["id"],
+        upsert_vendor_profile(
+            session,
+            vendor["id"],
             categories=random.sample(CATEGORIES, k=random.randint(1, 3)),
             regions=random.sample(REGIONS, k=random.randint(1, 2)),
             lead_time_days=random.randint(2, 10),
             min_order_value=random.choice([250, 500, 1000, 1500]),
         )
-        session.add(profile)
 
     rfos = []
     for _ in range(random.randint(5, 10)):
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import httpx
 
@@ -45,6 +45,8 @@ class IntentBidClient:
         deadline_max: int | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        include_total: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {}
         if status is not None:
@@ -61,6 +63,10 @@ class IntentBidClient:
             params["limit"] = limit
         if offset is not None:
             params["offset"] = offset
+        if cursor is not None:
+            params["cursor"] = cursor
+        if include_total is not None:
+            params["include_total"] = include_total
 
         response = self._client.get("/v1/rfo", params=params or None)
         response.raise_for_status()
@@ -77,6 +83,16 @@ class IntentBidClient:
         response.raise_for_status()
         return response.json()
 
+    def submit_offers(self, offers: list[dict[str, Any]]) -> dict[str, Any]:
+        headers = self._auth_headers()
+        response = self._client.post(
+            "/v1/offers:batch",
+            json={"offers": offers},
+            headers=headers,
+        )
+        response.raise_for_status()
+        return response.json()
+
     def get_vendor_profile(self) -> dict[str, Any]:
         headers = self._auth_headers()
         response = self._client.get("/v1/vendors/me/profile", headers=headers)
@@ -94,12 +110,15 @@ class IntentBidClient:
         *,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {}
         if limit is not None:
             params["limit"] = limit
         if offset is not None:
             params["offset"] = offset
+        if cursor is not None:
+            params["cursor"] = cursor
 
         headers = self._auth_headers()
         response = self._client.get(
@@ -120,12 +139,15 @@ class IntentBidClient:
         *,
         limit: int | None = None,
         offset: int | None = None,
+        sort: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {}
         if limit is not None:
             params["limit"] = limit
         if offset is not None:
             params["offset"] = offset
+        if sort is not None:
+            params["sort"] = sort
 
         headers = self._auth_headers()
         response = self._client.get(
@@ -147,6 +169,8 @@ class IntentBidClient:
         deadline_max: int | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        include_total: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {}
         if status is not None:
@@ -163,6 +187,10 @@ class IntentBidClient:
             params["limit"] = limit
         if offset is not None:
             params["offset"] = offset
+        if cursor is not None:
+            params["cursor"] = cursor
+        if include_total is not None:
+            params["include_total"] = include_total
 
         headers = {"X-Buyer-API-Key": buyer_api_key}
         response = self._client.get("/v1/buyers/rfos", params=params or None, headers=headers)
@@ -175,6 +203,36 @@ class IntentBidClient:
         response.raise_for_status()
         return response.json()
 
+    def iter_rfos(self, *, page_size: int = 100, **filters: Any) -> Iterator[dict[str, Any]]:
+        return self._iter_items(self.list_rfos, page_size, **filters)
+
+    def iter_vendor_offers(self, *, page_size: int = 100) -> Iterator[dict[str, Any]]:
+        return self._iter_items(self.list_vendor_offers, page_size)
+
+    def iter_buyer_rfos(
+        self,
+        buyer_api_key: str,
+        *,
+        page_size: int = 100,
+        **filters: Any,
+    ) -> Iterator[dict[str, Any]]:
+        return self._iter_items(self.list_buyer_rfos, page_size, buyer_api_key, **filters)
+
+    def _iter_items(
+        self,
+        fetch: Callable[..., dict[str, Any]],
+        page_size: int,
+        *args: Any,
+        **filters: Any,
+    ) -> Iterator[dict[str, Any]]:
+        cursor = None
+        while True:
+            page = fetch(*args, limit=page_size, cursor=cursor, **filters)
+            yield from page["items"]
+            cursor = page.get("next_cursor")
+            if not cursor:
+                return
+
     def close(self) -> None:
         self._client.close()
 
@@ -4,7 +4,18 @@ from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from intentbid.app.main import app
+from intentbid.app.core.scoring import clear_scorer_cache
 from intentbid.app.db.session import get_session
+from intentbid.app.services.auth_cache import (
+    buyer_principal_cache,
+    rejected_buyer_keys,
+    rejected_vendor_keys,
+    vendor_principal_cache,
+)
+from intentbid.app.services.count_cache import rfo_count_cache
+from intentbid.app.services.key_usage import key_usage_buffer
+from intentbid.app.services.match_index import open_rfo_index
+from intentbid.app.services.ranking_cache import ranking_cache
 
 
 class CompatTestClient(TestClient):
@@ -47,6 +58,29 @@ def fixture_override_session(session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def fixture_clear_caches():
+    ranking_cache.clear()
+    clear_scorer_cache()
+    vendor_principal_cache.clear()
+    buyer_principal_cache.clear()
+    rejected_vendor_keys.clear()
+    rejected_buyer_keys.clear()
+    key_usage_buffer.clear()
+    open_rfo_index.clear()
+    rfo_count_cache.clear()
+    yield
+    ranking_cache.clear()
+    clear_scorer_cache()
+    vendor_principal_cache.clear()
+    buyer_principal_cache.clear()
+    rejected_vendor_keys.clear()
+    rejected_buyer_keys.clear()
+    key_usage_buffer.clear()
+    open_rfo_index.clear()
+    rfo_count_cache.clear()
+
+
 @pytest.fixture(name="client")
 def fixture_client(session):
     def override_get_session():
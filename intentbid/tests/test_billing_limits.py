@@ -51,3 +51,20 @@ def test_offer_limits_enforced_by_plan(client, session):
         select(UsageEvent).where(UsageEvent.vendor_id == vendor_id)
     ).all()
     assert len(events) == 1
+
+
+def test_plan_limit_uses_earliest_active_subscription(client, session):
+    api_key, vendor_id, rfo_id = _create_vendor_and_rfo(client)
+    session.add(PlanLimit(plan_code="basic", max_offers_per_month=1))
+    session.add(PlanLimit(plan_code="pro", max_offers_per_month=100))
+    session.commit()
+    session.add(Subscription(vendor_id=vendor_id, plan_code="basic", status="active"))
+    session.commit()
+    session.add(Subscription(vendor_id=vendor_id, plan_code="pro", status="active"))
+    session.commit()
+
+    first = client.post("/v1/offers", json=_offer_payload(rfo_id, 90.0), headers={"X-API-Key": api_key})
+    second = client.post("/v1/offers", json=_offer_payload(rfo_id, 95.0), headers={"X-API-Key": api_key})
+
+    assert first.status_code == 200
+    assert second.status_code == 429
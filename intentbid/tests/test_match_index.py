@@ -0,0 +1,100 @@
+from contextlib import nullcontext
+
+from sqlmodel import select
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import RFO
+from intentbid.app.services.match_index import open_rfo_index, refresh_match_index
+from intentbid.app.services.matching_service import list_vendor_matches
+from intentbid.app.services.rfo_service import close_rfo, create_rfo, reopen_rfo, update_rfo
+from intentbid.app.services.vendor_service import register_vendor, upsert_vendor_profile
+
+
+def _create(session, category, location, buyer_id=None):
+    return create_rfo(
+        session,
+        category=category,
+        constraints={"budget_max": 100},
+        preferences={},
+        buyer_id=buyer_id,
+        location=location,
+    )
+
+
+def _vendor(session, categories, regions):
+    vendor, _ = register_vendor(session, "Indexed")
+    upsert_vendor_profile(session, vendor.id, categories, regions, None, None)
+    return vendor
+
+
+def test_memory_backend_matches_sql_backend(session, monkeypatch):
+    for index in range(12):
+        _create(session, ["sneakers", "boots", "bags"][index % 3], ["EU", "US"][index % 2])
+    vendor = _vendor(session, ["sneakers", "boots"], ["EU"])
+    expected = list_vendor_matches(session, vendor.id, limit=3, offset=1)
+
+    open_rfo_index.rebuild(session)
+    monkeypatch.setattr(settings, "matching_backend", "memory")
+    matches, total = list_vendor_matches(session, vendor.id, limit=3, offset=1)
+
+    assert total == expected[1] == 4
+    assert [rfo.id for rfo, _, _ in matches] == [rfo.id for rfo, _, _ in expected[0]]
+    assert [reasons for _, reasons, _ in matches] == [["category_match", "region_match"]] * 3
+
+
+def test_memory_backend_applies_range_predicates_and_score_order(session, monkeypatch):
+    for deadline, budget in ((5, 100.0), (20, 400.0), (3, 400.0), (20, 50.0), (None, None)):
+        create_rfo(
+            session,
+            category="sneakers",
+            constraints={},
+            preferences={},
+            delivery_deadline_days=deadline,
+            budget_max=budget,
+        )
+    vendor, _ = register_vendor(session, "Ranged")
+    upsert_vendor_profile(session, vendor.id, ["sneakers"], [], 5, 100.0)
+    expected = list_vendor_matches(session, vendor.id, sort="match_score")
+
+    open_rfo_index.rebuild(session)
+    monkeypatch.setattr(settings, "matching_backend", "memory")
+    matches, total = list_vendor_matches(session, vendor.id, sort="match_score")
+
+    assert total == expected[1] == 3
+    assert [(rfo.id, score) for rfo, _, score in matches] == [
+        (rfo.id, score) for rfo, _, score in expected[0]
+    ]
+
+
+def test_index_follows_rfo_lifecycle(session):
+    open_rfo_index.rebuild(session)
+    rfo = _create(session, "sneakers", "EU", buyer_id=1)
+    assert open_rfo_index.match(["sneakers"], ["EU"], limit=10) == ([rfo.id], 1)
+
+    update_rfo(session, rfo.id, 1, {"category": "boots", "location": "US"})
+    assert open_rfo_index.match(["sneakers"], [], limit=10) == ([], 0)
+    assert open_rfo_index.match(["boots"], ["US"], limit=10) == ([rfo.id], 1)
+
+    close_rfo(session, rfo.id)
+    assert open_rfo_index.match([], [], limit=10) == ([], 0)
+
+    reopen_rfo(session, rfo.id)
+    assert open_rfo_index.match(["boots"], [], limit=10) == ([rfo.id], 1)
+    assert open_rfo_index.verify(session).consistent
+
+
+def test_refresh_rebuilds_index_after_drift(session):
+    rfo = _create(session, "sneakers", "EU")
+    assert refresh_match_index(lambda: nullcontext(session)) is None
+    assert len(open_rfo_index) == 1
+
+    stored = session.exec(select(RFO).where(RFO.id == rfo.id)).one()
+    stored.status = "CLOSED"
+    session.add(stored)
+    session.commit()
+    drift = refresh_match_index(lambda: nullcontext(session))
+
+    assert drift.extra == 1
+    assert len(open_rfo_index) == 0
+    assert open_rfo_index.verify(session).consistent
+
@@ -1,4 +1,9 @@
-from intentbid.app.db.models import Offer, RFO
+from sqlmodel import select
+
+from intentbid.app.core import scoring
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import EventOutbox, Offer, RFO, UsageEvent
+from intentbid.app.services import ranking_cache
 
 
 def _create_vendor_and_rfo(client):
@@ -92,3 +97,86 @@ def test_submit_offer_closed_rfo_returns_400(client, session):
     )
 
     assert response.status_code == 400
+
+
+def _offer_payload(rfo_id, price_amount=100.0):
+    return {
+        "rfo_id": rfo_id,
+        "price_amount": price_amount,
+        "currency": "USD",
+        "delivery_eta_days": 2,
+        "warranty_months": 12,
+        "return_days": 30,
+        "stock": True,
+        "metadata": {"sku": "ABC"},
+    }
+
+
+def test_submit_offers_batch_returns_per_item_results(client, session, monkeypatch):
+    monkeypatch.setattr(settings, "max_offers_per_vendor_rfo", 2)
+    monkeypatch.setattr(settings, "offer_cooldown_seconds", 0)
+    api_key, vendor_id, rfo_id = _create_vendor_and_rfo(client)
+
+    response = client.post(
+        "/v1/offers:batch",
+        json={
+            "offers": [
+                _offer_payload(rfo_id, 90.0),
+                _offer_payload(999),
+                _offer_payload(rfo_id, -1.0),
+                _offer_payload(rfo_id, 95.0),
+                _offer_payload(rfo_id, 97.0),
+            ]
+        },
+        headers={"X-API-Key": api_key},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["accepted"] == 2
+    assert body["rejected"] == 3
+    assert [result["status_code"] for result in body["results"]] == [200, 404, 400, 200, 429]
+    created_ids = [result["offer_id"] for result in body["results"] if result["offer_id"]]
+    offers = session.exec(select(Offer).where(Offer.vendor_id == vendor_id)).all()
+    assert sorted(offer.id for offer in offers) == sorted(created_ids)
+    outbox = session.exec(
+        select(EventOutbox).where(EventOutbox.event_type == "offer.created")
+    ).all()
+    usage = session.exec(select(UsageEvent).where(UsageEvent.vendor_id == vendor_id)).all()
+    assert sorted(event.payload["offer_id"] for event in outbox) == sorted(created_ids)
+    assert len(usage) == 2
+
+
+def test_submit_offers_batch_rejects_oversized_batch(client, monkeypatch):
+    monkeypatch.setattr(settings, "offer_batch_max_items", 1)
+    api_key, _, rfo_id = _create_vendor_and_rfo(client)
+
+    response = client.post(
+        "/v1/offers:batch",
+        json={"offers": [_offer_payload(rfo_id), _offer_payload(rfo_id)]},
+        headers={"X-API-Key": api_key},
+    )
+
+    assert response.status_code == 400
+
+
+def test_submit_offers_batch_hashes_scoring_config_once_per_rfo(client, monkeypatch):
+    monkeypatch.setattr(settings, "max_offers_per_vendor_rfo", 10)
+    api_key, _, rfo_id = _create_vendor_and_rfo(client)
+    hashed = []
+    config_hash = scoring.scoring_config_hash
+
+    def counting_hash(rfo):
+        hashed.append(rfo.id)
+        return config_hash(rfo)
+
+    monkeypatch.setattr(scoring, "scoring_config_hash", counting_hash)
+    monkeypatch.setattr(ranking_cache, "scoring_config_hash", counting_hash)
+    response = client.post(
+        "/v1/offers:batch",
+        json={"offers": [_offer_payload(rfo_id, 80.0 + index) for index in range(5)]},
+        headers={"X-API-Key": api_key},
+    )
+
+    assert response.json()["accepted"] == 5
+    assert len(hashed) <= 2
@@ -0,0 +1,78 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event as sa_event
+from sqlmodel import select
+
+from intentbid.app.db.models import EventOutbox, EventOutboxArchive, Vendor
+from intentbid.app.services.outbox_retention_service import compact_outbox
+
+
+def _seed_outbox(session, statuses, created_at):
+    vendor = Vendor(name="Retention Vendor", api_key_hash="retention")
+    session.add(vendor)
+    session.commit()
+    for index, status in enumerate(statuses):
+        session.add(
+            EventOutbox(
+                vendor_id=vendor.id,
+                event_type="offer.created",
+                payload={"offer_id": index},
+                status=status,
+                attempts=1,
+                created_at=created_at,
+            )
+        )
+    session.commit()
+    return vendor
+
+
+def test_compact_outbox_archives_old_finished_events_in_chunks(session, test_engine):
+    now = datetime.now(timezone.utc)
+    _seed_outbox(session, ["delivered"] * 4 + ["dead", "pending"], now - timedelta(days=40))
+    _seed_outbox(session, ["delivered"], now - timedelta(days=1))
+    deletes = []
+
+    def count_deletes(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE FROM event_outbox"):
+            deletes.append(statement)
+
+    sa_event.listen(test_engine, "before_cursor_execute", count_deletes)
+    try:
+        report = compact_outbox(session, older_than=timedelta(days=30), chunk_size=2, now=now)
+    finally:
+        sa_event.remove(test_engine, "before_cursor_execute", count_deletes)
+
+    assert report.deleted == 5
+    assert report.archived == 5
+    assert report.chunks == 3
+    assert len(deletes) == 3
+    assert report.rows_per_second > 0
+    remaining = session.exec(select(EventOutbox).order_by(EventOutbox.id)).all()
+    assert [event.status for event in remaining] == ["pending", "delivered"]
+    archived = session.exec(select(EventOutboxArchive).order_by(EventOutboxArchive.id)).all()
+    assert [event.status for event in archived] == ["delivered"] * 4 + ["dead"]
+    assert archived[0].payload == {"offer_id": 0}
+
+
+def test_compact_outbox_writes_gzip_jsonl_archive(session, tmp_path):
+    now = datetime.now(timezone.utc)
+    _seed_outbox(session, ["delivered", "dead"], now - timedelta(days=40))
+    archive_path = tmp_path / "outbox.jsonl.gz"
+
+    report = compact_outbox(session, archive="jsonl", archive_path=archive_path, now=now)
+
+    with gzip.open(archive_path, "rt", encoding="utf-8") as archive_file:
+        rows = [json.loads(line) for line in archive_file]
+    assert report.archived == report.deleted == 2
+    assert [row["status"] for row in rows] == ["delivered", "dead"]
+    assert rows[0]["payload"] == {"offer_id": 0}
+    assert session.exec(select(EventOutbox)).all() == []
+    assert session.exec(select(EventOutboxArchive)).all() == []
+
+
+def test_compact_outbox_rejects_unknown_archive_mode(session):
+    with pytest.raises(ValueError):
+        compact_outbox(session, archive="s3")
@@ -0,0 +1,319 @@
+import pytest
+from sqlalchemy import event
+from sqlmodel import select
+
+from intentbid.app.core.config import settings
+from intentbid.app.core.schemas import OfferCreate
+from intentbid.app.core.scoring import score_offer, scoring_config_version
+from intentbid.app.db.models import EventOutbox, Offer, RFO, UsageEvent, Vendor
+from intentbid.app.services.offer_service import create_offer
+from intentbid.app.services.ranking_service import (
+    _stale_scores,
+    get_best_offers,
+    get_ranked_offers,
+    has_fresh_scores,
+    rescore_rfo_offers,
+)
+from intentbid.app.services.rfo_service import (
+    award_rfo,
+    close_rfo,
+    create_rfo,
+    update_rfo_scoring_config,
+)
+
+
+@pytest.fixture(name="ranking_cache_enabled")
+def fixture_ranking_cache_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "ranking_cache_enabled", True)
+
+
+@pytest.fixture(name="statements")
+def fixture_statements(test_engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
+def _seed_rfo_with_offers(session, prices):
+    vendor = Vendor(name="Acme", api_key_hash="hash")
+    rfo = RFO(
+        category="sneakers",
+        constraints={"budget_max": 100, "delivery_deadline_days": 5},
+        preferences={"w_price": 0.6, "w_delivery": 0.3, "w_warranty": 0.1},
+    )
+    session.add(vendor)
+    session.add(rfo)
+    session.commit()
+
+    for index, price in enumerate(prices):
+        session.add(
+            Offer(
+                rfo_id=rfo.id,
+                vendor_id=vendor.id,
+                price_amount=price,
+                currency="USD",
+                delivery_eta_days=1 + index % 6,
+                warranty_months=(index * 7) % 30,
+                return_days=30,
+                stock=index % 9 != 0,
+                metadata_={"sku": f"SKU-{index}"},
+            )
+        )
+    session.commit()
+    return rfo.id
+
+
+def _offer_payload(rfo_id, price_amount):
+    return OfferCreate(
+        rfo_id=rfo_id,
+        price_amount=price_amount,
+        currency="USD",
+        delivery_eta_days=1,
+        warranty_months=24,
+        return_days=30,
+        stock=True,
+    )
+
+
+def test_best_offers_match_head_of_full_ranking(session):
+    prices = [50 + (index * 37) % 70 for index in range(60)]
+    rfo_id = _seed_rfo_with_offers(session, prices)
+
+    _, ranked = get_ranked_offers(session, rfo_id)
+    _, best = get_best_offers(session, rfo_id, top_k=7)
+
+    assert [offer.id for offer, _, _ in best] == [offer.id for offer, _, _ in ranked[:7]]
+    assert [score for _, score, _ in best] == [score for _, score, _ in ranked[:7]]
+    assert best[0][2]["weights"]["w_price"] == 0.6
+    assert best[0][0].metadata_["sku"].startswith("SKU-")
+
+
+def test_best_offers_ties_keep_submission_order(session):
+    rfo_id = _seed_rfo_with_offers(session, [200, 200, 200, 200])
+
+    _, best = get_best_offers(session, rfo_id, top_k=3)
+
+    assert [score for _, score, _ in best] == [0, 0, 0]
+    assert [offer.id for offer, _, _ in best] == sorted(offer.id for offer, _, _ in best)
+
+
+def test_best_offers_handles_rfo_without_offers(session):
+    rfo_id = _seed_rfo_with_offers(session, [])
+
+    rfo, best = get_best_offers(session, rfo_id, top_k=3)
+
+    assert rfo is not None
+    assert best == []
+
+
+def test_cached_ranking_matches_uncached_ranking(session, ranking_cache_enabled, monkeypatch):
+    prices = [50 + (index * 37) % 70 for index in range(40)]
+    rfo_id = _seed_rfo_with_offers(session, prices)
+
+    _, cached = get_ranked_offers(session, rfo_id)
+    _, cached_best = get_best_offers(session, rfo_id, top_k=5)
+    monkeypatch.setattr(settings, "ranking_cache_enabled", False)
+    _, uncached = get_ranked_offers(session, rfo_id)
+
+    assert [(offer.id, score) for offer, score, _ in cached] == [
+        (offer.id, score) for offer, score, _ in uncached
+    ]
+    assert [offer.id for offer, _, _ in cached_best] == [
+        offer.id for offer, _, _ in uncached[:5]
+    ]
+
+
+def test_cached_ranking_skips_offer_queries_when_polled(
+    session, ranking_cache_enabled, statements
+):
+    rfo_id = _seed_rfo_with_offers(session, [60, 70, 80])
+    get_ranked_offers(session, rfo_id)
+    session.expire_all()
+    statements.clear()
+
+    _, ranked = get_ranked_offers(session, rfo_id)
+
+    assert len(ranked) == 3
+    assert not any("FROM offer" in statement for statement in statements)
+
+
+def test_created_offer_is_inserted_into_cached_ranking(
+    session, ranking_cache_enabled, statements
+):
+    rfo_id = _seed_rfo_with_offers(session, [60, 70, 80])
+    vendor_id = session.get(Offer, 1).vendor_id
+    get_best_offers(session, rfo_id, top_k=2)
+
+    offer_id = create_offer(session, vendor_id, _offer_payload(rfo_id, 10)).id
+    session.expire_all()
+    statements.clear()
+    _, best = get_best_offers(session, rfo_id, top_k=2)
+
+    assert best[0][0].id == offer_id
+    assert not any("FROM offer" in statement for statement in statements)
+
+
+def test_scoring_update_invalidates_cached_ranking(session, ranking_cache_enabled):
+    rfo_id = _seed_rfo_with_offers(session, [60, 99, 40])
+    _, before = get_best_offers(session, rfo_id, top_k=1)
+
+    update_rfo_scoring_config(
+        session,
+        rfo_id,
+        weights={"w_price": 0.0, "w_delivery": 1.0, "w_warranty": 0.0},
+    )
+    _, after = get_best_offers(session, rfo_id, top_k=1)
+
+    assert before[0][0].metadata_["sku"] == "SKU-2"
+    assert after[0][0].metadata_["sku"] == "SKU-1"
+
+
+def test_award_invalidates_cached_ranking(session, ranking_cache_enabled):
+    rfo_id = _seed_rfo_with_offers(session, [60, 99, 40])
+    close_rfo(session, rfo_id)
+    _, before = get_ranked_offers(session, rfo_id)
+    winner_id = before[0][0].id
+
+    award_rfo(session, rfo_id, offer_id=winner_id)
+    _, after = get_ranked_offers(session, rfo_id)
+
+    assert before[0][0].is_awarded is False
+    assert after[0][0].id == winner_id
+    assert after[0][0].is_awarded is True
+
+
+def test_ranking_cache_is_disabled_by_default(session, statements):
+    rfo_id = _seed_rfo_with_offers(session, [60, 70, 80])
+    get_ranked_offers(session, rfo_id)
+    statements.clear()
+
+    get_ranked_offers(session, rfo_id)
+
+    assert not settings.ranking_cache_enabled
+    assert any("FROM offer" in statement for statement in statements)
+
+
+def test_create_offer_persists_score(session):
+    vendor = Vendor(name="Acme", api_key_hash="hash")
+    session.add(vendor)
+    session.commit()
+    rfo = create_rfo(
+        session,
+        "sneakers",
+        {"budget_max": 100, "delivery_deadline_days": 5},
+        {"w_price": 0.6, "w_delivery": 0.3, "w_warranty": 0.1},
+    )
+
+    offer = create_offer(session, vendor.id, _offer_payload(rfo.id, 80))
+
+    assert has_fresh_scores(rfo)
+    assert offer.score == score_offer(offer, rfo)[0]
+    assert offer.score_version == scoring_config_version(rfo)
+
+
+def test_create_offer_commits_offer_outbox_and_usage_once(session):
+    rfo_id = _seed_rfo_with_offers(session, [60])
+    vendor_id = session.get(Offer, 1).vendor_id
+    commits = []
+
+    def record(session_):
+        commits.append(session_)
+
+    event.listen(session, "after_commit", record)
+    offer_id = create_offer(session, vendor_id, _offer_payload(rfo_id, 10)).id
+    event.remove(session, "after_commit", record)
+
+    outbox = session.exec(select(EventOutbox).where(EventOutbox.vendor_id == vendor_id)).all()
+    usage = session.exec(select(UsageEvent).where(UsageEvent.vendor_id == vendor_id)).all()
+    assert len(commits) == 1
+    assert [event_.payload["offer_id"] for event_ in outbox] == [offer_id]
+    assert [usage_.event_type for usage_ in usage] == ["offer.created"]
+
+
+def test_rescore_rewrites_stale_scores(session, statements):
+    rfo_id = _seed_rfo_with_offers(session, [60, 99, 40, 75])
+    rfo = session.get(RFO, rfo_id)
+    assert not has_fresh_scores(rfo)
+
+    update_rfo_scoring_config(
+        session,
+        rfo_id,
+        weights={"w_price": 0.0, "w_delivery": 1.0, "w_warranty": 0.0},
+    )
+    rescored = rescore_rfo_offers(session, rfo_id)
+
+    assert rescored == 4
+    assert has_fresh_scores(rfo)
+    for offer in session.exec(select(Offer).where(Offer.rfo_id == rfo_id)).all():
+        assert offer.score == score_offer(offer, rfo)[0]
+        assert offer.score_version == rfo.offer_score_version
+    assert rescore_rfo_offers(session, rfo_id) == 0
+
+    statements.clear()
+    _, best = get_best_offers(session, rfo_id, top_k=1)
+
+    assert best[0][0].metadata_["sku"] == "SKU-1"
+    assert any("ORDER BY offer.score DESC" in statement for statement in statements)
+
+
+def test_offer_scored_with_old_config_is_rescored_on_read(session, statements):
+    rfo_id = _seed_rfo_with_offers(session, [60, 99, 40])
+    update_rfo_scoring_config(
+        session,
+        rfo_id,
+        weights={"w_price": 0.0, "w_delivery": 1.0, "w_warranty": 0.0},
+    )
+    rescore_rfo_offers(session, rfo_id)
+    rfo = session.get(RFO, rfo_id)
+    vendor_id = session.get(Offer, 1).vendor_id
+    session.add(
+        Offer(
+            rfo_id=rfo_id,
+            vendor_id=vendor_id,
+            price_amount=10,
+            currency="USD",
+            delivery_eta_days=5,
+            warranty_months=24,
+            return_days=30,
+            stock=True,
+            score=0.99,
+            score_version="v1:previous",
+            metadata_={"sku": "LATE"},
+        )
+    )
+    session.commit()
+    statements.clear()
+
+    _, best = get_best_offers(session, rfo_id, top_k=1)
+    late = session.exec(select(Offer).where(Offer.price_amount == 10)).one()
+    rescores = [statement for statement in statements if statement.startswith("UPDATE offer")]
+    statements.clear()
+    _, again = get_best_offers(session, rfo_id, top_k=1)
+
+    assert has_fresh_scores(rfo)
+    assert late.score_version == rfo.offer_score_version
+    assert len(rescores) == 1
+    assert best[0][0].metadata_["sku"] == "SKU-1"
+    assert again[0][0].metadata_["sku"] == "SKU-1"
+    assert not any(statement.startswith("UPDATE offer") for statement in statements)
+
+
+def test_stale_score_probe_uses_score_version_index(session):
+    rfo_id = _seed_rfo_with_offers(session, [60, 99, 40])
+    rfo = session.get(RFO, rfo_id)
+    stale = _stale_scores(rfo_id, scoring_config_version(rfo))
+    statement = select(Offer.rfo_id).where(stale).limit(1)
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+
+    plan = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+
+    assert any("ix_offer_rfo_id_score_version" in row[-1] for row in plan)
+    assert not any(row[-1].startswith("SCAN offer") for row in plan)
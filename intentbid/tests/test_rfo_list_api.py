@@ -1,4 +1,9 @@
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from sqlalchemy import event as sa_event
+
+from intentbid.app.services.rfo_service import list_rfos
 
 
 def _create_rfo(client, category, budget_max, deadline_days, status="OPEN"):
@@ -60,3 +65,96 @@ def test_list_rfos_supports_pagination(client):
     assert data["offset"] == 1
     assert data["total"] == 2
     assert len(data["items"]) == 1
+
+
+def test_list_rfos_cursor_pages_without_duplicates(client):
+    created = [_create_rfo(client, "sneakers", 100.0 + index, 5) for index in range(5)]
+
+    first = client.get("/v1/rfo", params={"limit": 2}).json()
+    assert first["total"] == 5
+    assert first["next_cursor"]
+
+    seen = [item["id"] for item in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get("/v1/rfo", params={"limit": 2, "cursor": cursor}).json()
+        assert page["total"] is None
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+
+    assert seen == sorted(created, reverse=True)
+
+
+def test_list_rfos_rejects_invalid_cursor(client):
+    response = client.get("/v1/rfo", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def _count_queries(test_engine, request):
+    counts = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT count("):
+            counts.append(statement)
+
+    sa_event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        response = request()
+    finally:
+        sa_event.remove(test_engine, "before_cursor_execute", record)
+    return response, len(counts)
+
+
+def test_list_rfos_caches_total_until_rfo_changes(client, test_engine):
+    rfo_id = _create_rfo(client, "sneakers", 200.0, 5)
+    params = {"status": "OPEN", "category": "sneakers"}
+
+    first, first_counts = _count_queries(test_engine, lambda: client.get("/v1/rfo", params=params))
+    second, second_counts = _count_queries(
+        test_engine, lambda: client.get("/v1/rfo", params={**params, "offset": 0})
+    )
+    assert first.json()["total"] == second.json()["total"] == 1
+    assert (first_counts, second_counts) == (1, 0)
+
+    client.post(f"/v1/rfo/{rfo_id}/close")
+    closed, closed_counts = _count_queries(test_engine, lambda: client.get("/v1/rfo", params=params))
+    assert closed.json()["total"] == 0
+    assert closed_counts == 1
+
+    _create_rfo(client, "sneakers", 150.0, 3)
+    created, _ = _count_queries(test_engine, lambda: client.get("/v1/rfo", params=params))
+    assert created.json()["total"] == 1
+
+
+def test_list_rfos_include_total_modes(client, test_engine):
+    _create_rfo(client, "sneakers", 200.0, 5)
+    _create_rfo(client, "bags", 80.0, 10)
+
+    skipped, skipped_counts = _count_queries(
+        test_engine, lambda: client.get("/v1/rfo", params={"include_total": "false"})
+    )
+    assert skipped.json()["total"] is None
+    assert len(skipped.json()["items"]) == 2
+    assert skipped_counts == 0
+
+    estimated = client.get("/v1/rfo", params={"include_total": "estimate"})
+    assert estimated.json()["total"] == 2
+
+    invalid = client.get("/v1/rfo", params={"include_total": "sometimes"})
+    assert invalid.status_code == 422
+
+
+def test_list_rfos_estimate_uses_postgres_statistics():
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value.scalar.return_value = 1234.0
+    session.exec.return_value.all.return_value = []
+
+    items, total, next_cursor = list_rfos(session, include_total="estimate")
+
+    assert (items, total, next_cursor) == ([], 1234, None)
+    statement = str(session.execute.call_args.args[0])
+    assert "pg_class" in statement
+    assert session.execute.call_args.args[1] == {"table_name": "rfo"}
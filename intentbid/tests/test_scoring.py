@@ -1,4 +1,13 @@
-from intentbid.app.core.scoring import score_offer
+from dataclasses import replace
+
+from intentbid.app.core import scoring
+from intentbid.app.core.scoring import (
+    compile_v1_scorer,
+    get_scorer,
+    register_scorer,
+    score_offer,
+    score_offers_batch,
+)
 from intentbid.app.db.models import Offer, RFO
 
 
@@ -55,3 +64,102 @@ def test_score_late_delivery_is_zero():
 
     assert score == 0
     assert "late_delivery" in explain["penalties"]
+
+
+def test_batch_scores_match_score_offer():
+    rfo = _base_rfo()
+    offers = []
+    for price in (0.0, 45.5, 99.99, 100, 150):
+        for eta in (0, 1, 3, 4):
+            for warranty in (0, 12, 36):
+                for stock in (True, False):
+                    offer = _base_offer()
+                    offer.price_amount = price
+                    offer.delivery_eta_days = eta
+                    offer.warranty_months = warranty
+                    offer.stock = stock
+                    offers.append(offer)
+
+    scores = score_offers_batch(
+        rfo,
+        [offer.price_amount for offer in offers],
+        [offer.delivery_eta_days for offer in offers],
+        [offer.warranty_months for offer in offers],
+        [offer.stock for offer in offers],
+    )
+
+    assert scores == [score_offer(offer, rfo)[0] for offer in offers]
+
+
+def test_batch_scores_without_constraints_use_weights():
+    rfo = RFO(
+        category="sneakers",
+        constraints={},
+        preferences={},
+        weights={"w_price": 0.1, "w_delivery": 0.1, "w_warranty": 0.8},
+    )
+    offer = _base_offer()
+
+    scores = score_offers_batch(rfo, [offer.price_amount], [2], [12], [True])
+
+    assert scores == [score_offer(offer, rfo)[0]]
+    assert scores[0] == 0.8 * 0.5
+
+
+def test_compiled_scorer_is_reused_until_config_changes():
+    rfo = _base_rfo()
+    rfo.id = 7
+
+    first = get_scorer(rfo)
+    assert get_scorer(rfo) is first
+    assert first.budget_max == 100
+    assert first.w_price == 0.6
+
+    rfo.weights = {"w_price": 0.2, "w_delivery": 0.2, "w_warranty": 0.6}
+    updated = get_scorer(rfo)
+
+    assert updated is not first
+    assert updated.w_warranty == 0.6
+
+
+def test_scorer_lookup_does_not_hash_config(monkeypatch):
+    rfo = _base_rfo()
+    rfo.id = 8
+
+    def fail_hash(_):
+        raise AssertionError("scorer lookup hashed the scoring config")
+
+    monkeypatch.setattr(scoring, "scoring_config_hash", fail_hash)
+
+    assert get_scorer(rfo) is get_scorer(rfo)
+    assert score_offer(_base_offer(), rfo)[0] > 0
+
+
+def test_unknown_scoring_version_falls_back_to_v1():
+    rfo = _base_rfo()
+    rfo.scoring_version = "v-unknown"
+
+    assert get_scorer(rfo).version == "v1"
+    assert score_offer(_base_offer(), rfo) == score_offer(_base_offer(), _base_rfo())
+
+
+def test_registered_scorer_is_used_for_its_version(monkeypatch):
+    monkeypatch.setattr(scoring, "SCORER_REGISTRY", dict(scoring.SCORER_REGISTRY))
+
+    def compile_warranty_only(rfo):
+        return replace(
+            compile_v1_scorer(rfo),
+            version="warranty-only",
+            w_price=0.0,
+            w_delivery=0.0,
+            w_warranty=1.0,
+        )
+
+    register_scorer("warranty-only", compile_warranty_only)
+    rfo = _base_rfo()
+    rfo.scoring_version = "warranty-only"
+
+    score, explain = score_offer(_base_offer(), rfo)
+
+    assert score == 0.5
+    assert explain["weights"] == {"w_price": 0.0, "w_delivery": 0.0, "w_warranty": 1.0}
@@ -1,3 +1,8 @@
+from sqlmodel import select
+
+from intentbid.app.db.models import Offer, RFO
+
+
 def _create_vendor_and_rfo(client):
     vendor_response = client.post("/v1/vendors/register", json={"name": "Acme"})
     vendor_payload = vendor_response.json()
@@ -56,3 +61,25 @@ def test_update_scoring_weights_changes_ranking(client):
     assert updated_payload["scoring_version"] == "v2"
     assert updated_payload["offers"][0]["offer_id"] == offer_b
     assert updated_payload["offers"][0]["explain"]["weights"]["w_delivery"] == 0.8
+
+
+def test_scoring_update_rescores_offers_in_background(client, session):
+    api_key, rfo_id = _create_vendor_and_rfo(client)
+    _create_offer(client, api_key, rfo_id, 60.0, 3, 12)
+    _create_offer(client, api_key, rfo_id, 110.0, 1, 12)
+    initial_version = session.get(RFO, rfo_id).offer_score_version
+
+    response = client.post(
+        f"/v1/rfo/{rfo_id}/scoring",
+        json={"weights": {"w_price": 0.1, "w_delivery": 0.8, "w_warranty": 0.1}},
+    )
+    assert response.status_code == 200
+
+    session.expire_all()
+    rfo = session.get(RFO, rfo_id)
+    offers = session.exec(select(Offer).where(Offer.rfo_id == rfo_id)).all()
+    assert rfo.offer_score_version not in {None, initial_version}
+    assert {offer.score_version for offer in offers} == {rfo.offer_score_version}
+
+    best = client.get(f"/v1/rfo/{rfo_id}/best?top_k=1").json()
+    assert best["top_offers"][0]["score"] == max(offer.score for offer in offers)
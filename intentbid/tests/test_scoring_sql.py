@@ -0,0 +1,123 @@
+import itertools
+import os
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from intentbid.app.core.config import settings
+from intentbid.app.core.scoring import score_offer
+from intentbid.app.core.scoring_sql import build_score_expression
+from intentbid.app.db.models import Offer, RFO, Vendor
+from intentbid.app.services.ranking_service import get_best_offers, get_ranked_offers
+
+POSTGRES_URL = os.environ.get("INTENTBID_TEST_POSTGRES_URL")
+
+RFO_CONFIGS = [
+    {
+        "constraints": {"budget_max": 100, "delivery_deadline_days": 3},
+        "preferences": {"w_price": 0.6, "w_delivery": 0.3, "w_warranty": 0.1},
+        "weights": {},
+    },
+    {
+        "constraints": {"budget_max": 120.5},
+        "preferences": {},
+        "weights": {"w_price": 0.2, "w_delivery": 0.2, "w_warranty": 0.6},
+    },
+    {
+        "constraints": {"delivery_deadline_days": 7},
+        "preferences": {},
+        "weights": {},
+    },
+    {
+        "constraints": {"budget_max": 0, "delivery_deadline_days": 0},
+        "preferences": {"w_price": 1, "w_delivery": 1, "w_warranty": 1},
+        "weights": {},
+    },
+]
+
+
+@pytest.fixture(
+    name="parity_session",
+    params=[
+        "sqlite",
+        pytest.param(
+            "postgresql",
+            marks=pytest.mark.skipif(
+                not POSTGRES_URL, reason="INTENTBID_TEST_POSTGRES_URL not set"
+            ),
+        ),
+    ],
+)
+def fixture_parity_session(request):
+    if request.param == "sqlite":
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(POSTGRES_URL)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+
+def _seed(session, config):
+    vendor = Vendor(name="Acme", api_key_hash="hash")
+    rfo = RFO(category="sneakers", **config)
+    session.add(vendor)
+    session.add(rfo)
+    session.commit()
+
+    grid = itertools.product(
+        (0.5, 33.3, 99.99, 100, 120.5, 150),
+        (1, 3, 4, 8),
+        (0, 12, 30),
+        (True, False),
+    )
+    for price, eta, warranty, stock in grid:
+        session.add(
+            Offer(
+                rfo_id=rfo.id,
+                vendor_id=vendor.id,
+                price_amount=price,
+                currency="USD",
+                delivery_eta_days=eta,
+                warranty_months=warranty,
+                return_days=30,
+                stock=stock,
+                metadata_={},
+            )
+        )
+    session.commit()
+    return rfo
+
+
+@pytest.mark.parametrize("config", RFO_CONFIGS)
+def test_sql_score_matches_python_score(parity_session, config):
+    rfo = _seed(parity_session, config)
+    score = build_score_expression(rfo)
+
+    rows = parity_session.exec(
+        select(Offer, score).where(Offer.rfo_id == rfo.id)
+    ).all()
+
+    assert rows
+    for offer, sql_score in rows:
+        assert sql_score == pytest.approx(score_offer(offer, rfo)[0], abs=1e-12)
+
+
+@pytest.mark.parametrize("config", RFO_CONFIGS)
+def test_sql_backend_best_offers_match_python_backend(parity_session, config, monkeypatch):
+    rfo = _seed(parity_session, config)
+
+    _, ranked = get_ranked_offers(parity_session, rfo.id)
+    monkeypatch.setattr(settings, "ranking_backend", "sql")
+    _, best = get_best_offers(parity_session, rfo.id, top_k=10)
+
+    assert [offer.id for offer, _, _ in best] == [offer.id for offer, _, _ in ranked[:10]]
+    assert [explain for _, _, explain in best] == [explain for _, _, explain in ranked[:10]]
@@ -190,3 +190,51 @@ def test_sdk_list_matches_sets_api_key_header():
     client = IntentBidClient(base_url="https://example.com", api_key="sk_test", transport=transport)
     response = client.list_matches()
     assert response["items"] == []
+
+
+def test_sdk_submit_offers_posts_batch():
+    def handler(request):
+        assert request.method == "POST"
+        assert request.url.path == "/v1/offers:batch"
+        assert request.headers["X-API-Key"] == "sk_test"
+        payload = httpx.Response(200, content=request.content).json()
+        assert [offer["rfo_id"] for offer in payload["offers"]] == [1, 2]
+        return httpx.Response(
+            200,
+            json={
+                "accepted": 2,
+                "rejected": 0,
+                "results": [
+                    {"index": 0, "offer_id": 10, "status_code": 200, "detail": None},
+                    {"index": 1, "offer_id": 11, "status_code": 200, "detail": None},
+                ],
+            },
+        )
+
+    transport = httpx.MockTransport(handler)
+    client = IntentBidClient(base_url="https://example.com", api_key="sk_test", transport=transport)
+    response = client.submit_offers([{"rfo_id": 1}, {"rfo_id": 2}])
+    assert response["accepted"] == 2
+
+
+def test_sdk_iter_rfos_follows_next_cursor():
+    pages = {
+        None: {"items": [{"id": 3}, {"id": 2}], "total": 3, "next_cursor": "c1"},
+        "c1": {"items": [{"id": 1}], "total": None, "next_cursor": None},
+    }
+    requested = []
+
+    def handler(request):
+        assert request.url.path == "/v1/rfo"
+        assert request.url.params["category"] == "sneakers"
+        assert request.url.params["limit"] == "2"
+        cursor = request.url.params.get("cursor")
+        requested.append(cursor)
+        return httpx.Response(200, json={"limit": 2, "offset": 0, **pages[cursor]})
+
+    transport = httpx.MockTransport(handler)
+    client = IntentBidClient(base_url="https://example.com", transport=transport)
+    items = list(client.iter_rfos(page_size=2, category="sneakers"))
+
+    assert [item["id"] for item in items] == [3, 2, 1]
+    assert requested == [None, "c1"]
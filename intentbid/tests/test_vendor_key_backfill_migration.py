@@ -0,0 +1,47 @@
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+
+from intentbid.app.core.config import settings
+
+
+def _make_alembic_config(db_url: str) -> Config:
+    config = Config("alembic.ini")
+    config.set_main_option("script_location", "intentbid/app/db/migrations")
+    config.set_main_option("sqlalchemy.url", db_url)
+    return config
+
+
+def test_backfill_moves_legacy_hashes_into_vendor_api_key(tmp_path, monkeypatch):
+    db_url = f"sqlite:///{tmp_path / 'backfill.db'}"
+    monkeypatch.setattr(settings, "database_url", db_url)
+    config = _make_alembic_config(db_url)
+    command.upgrade(config, "0019_outbox_archive")
+
+    engine = create_engine(db_url)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO vendor (id, name, api_key_hash, created_at) VALUES "
+                "(1, 'Legacy', 'legacy-hash', CURRENT_TIMESTAMP), "
+                "(2, 'Migrated', 'migrated-hash', CURRENT_TIMESTAMP)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO vendor_api_key (vendor_id, hashed_key, status, created_at, revoked_at) "
+                "VALUES (2, 'migrated-hash', 'revoked', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            )
+        )
+
+    command.upgrade(config, "0020_vendor_api_key_backfill")
+
+    with engine.connect() as connection:
+        keys = connection.execute(
+            text("SELECT vendor_id, hashed_key, status FROM vendor_api_key ORDER BY vendor_id")
+        ).all()
+    engine.dispose()
+    assert [tuple(key) for key in keys] == [
+        (1, "legacy-hash", "active"),
+        (2, "migrated-hash", "revoked"),
+    ]
@@ -1,6 +1,9 @@
+from sqlalchemy import event as sa_event
 from sqlmodel import select
 
-from intentbid.app.db.models import VendorApiKey
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import BuyerApiKey, VendorApiKey
+from intentbid.app.services.key_usage import key_usage_buffer
 
 
 def test_create_vendor_key_and_revoke(client, session):
@@ -67,6 +70,7 @@ def test_last_used_at_updates_on_auth(client, session):
     )
     assert authorized.status_code == 200
 
+    key_usage_buffer.flush(session)
     session.refresh(key)
     assert key.last_used_at is not None
 
@@ -86,3 +90,110 @@ def test_revoke_other_vendor_key_is_not_found(client):
         headers={"X-API-Key": vendor_b["api_key"]},
     )
     assert revoke_response.status_code == 404
+
+
+def _count_statements(engine, request):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = request()
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", record)
+    return response, statements
+
+
+def test_cached_vendor_auth_skips_database(client, test_engine):
+    vendor = client.post("/v1/vendors/register", json={"name": "Acme"}).json()
+    headers = {"X-API-Key": vendor["api_key"]}
+    client.get("/v1/vendors/me", headers=headers)
+
+    response, statements = _count_statements(
+        test_engine, lambda: client.get("/v1/vendors/me", headers=headers)
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"vendor_id": vendor["vendor_id"], "name": "Acme"}
+    assert statements == []
+
+
+def test_cached_buyer_auth_skips_database(client, test_engine):
+    buyer = client.post("/v1/buyers/register", json={"name": "Buyer"}).json()
+    headers = {"X-Buyer-API-Key": buyer["api_key"]}
+    client.get("/v1/buyers/me", headers=headers)
+
+    response, statements = _count_statements(
+        test_engine, lambda: client.get("/v1/buyers/me", headers=headers)
+    )
+
+    assert response.status_code == 200
+    assert statements == []
+
+
+def test_auth_cache_can_be_disabled(client, test_engine, monkeypatch):
+    monkeypatch.setattr(settings, "auth_cache_enabled", False)
+    vendor = client.post("/v1/vendors/register", json={"name": "Acme"}).json()
+    headers = {"X-API-Key": vendor["api_key"]}
+    client.get("/v1/vendors/me", headers=headers)
+
+    response, statements = _count_statements(
+        test_engine, lambda: client.get("/v1/vendors/me", headers=headers)
+    )
+
+    assert response.status_code == 200
+    assert any("vendor_api_key" in statement for statement in statements)
+
+
+def test_key_usage_is_buffered_and_flushed_in_one_update(client, session, test_engine):
+    vendor = client.post("/v1/vendors/register", json={"name": "Acme"}).json()
+    buyer = client.post("/v1/buyers/register", json={"name": "Buyer"}).json()
+    for _ in range(3):
+        client.get("/v1/vendors/me", headers={"X-API-Key": vendor["api_key"]})
+        client.get("/v1/buyers/me", headers={"X-Buyer-API-Key": buyer["api_key"]})
+
+    vendor_key = session.exec(select(VendorApiKey)).one()
+    assert vendor_key.last_used_at is None
+    assert key_usage_buffer.size == 2
+
+    flushed, statements = _count_statements(test_engine, lambda: key_usage_buffer.flush(session))
+
+    assert flushed == 2
+    assert [statement.split()[1] for statement in statements if statement.startswith("UPDATE")] == [
+        "vendor_api_key",
+        "buyer_api_key",
+    ]
+    assert key_usage_buffer.size == 0
+    session.refresh(vendor_key)
+    assert vendor_key.last_used_at is not None
+    assert session.exec(select(BuyerApiKey)).one().last_used_at is not None
+
+    metrics = client.get("/metrics").text
+    assert "api_key_usage_buffer_size 0" in metrics
+    assert "api_key_usage_flushed_keys_total" in metrics
+
+
+def test_unknown_key_is_rejected_from_negative_cache(client, test_engine):
+    headers = {"X-API-Key": "not-a-real-key"}
+    first = client.get("/v1/vendors/me", headers=headers)
+
+    response, statements = _count_statements(
+        test_engine, lambda: client.get("/v1/vendors/me", headers=headers)
+    )
+
+    assert first.status_code == 401
+    assert response.status_code == 401
+    assert statements == []
+
+
+def test_legacy_vendor_hash_without_key_row_is_not_accepted(client, session):
+    vendor = client.post("/v1/vendors/register", json={"name": "Acme"}).json()
+    key = session.exec(select(VendorApiKey)).one()
+    session.delete(key)
+    session.commit()
+
+    response = client.get("/v1/vendors/me", headers={"X-API-Key": vendor["api_key"]})
+
+    assert response.status_code == 401
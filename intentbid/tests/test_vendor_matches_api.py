@@ -1,3 +1,8 @@
+from sqlalchemy import event as sa_event
+
+from intentbid.app.db.models import RFO
+
+
 def test_vendor_matches_filters_by_category_and_region(client):
     vendor_response = client.post("/v1/vendors/register", json={"name": "Acme"})
     api_key = vendor_response.json()["api_key"]
@@ -15,7 +20,7 @@ def test_vendor_matches_filters_by_category_and_region(client):
     )
 
     base_payload = {
-        "constraints": {"budget_max": 120, "size": 42},
+        "constraints": {"budget_max": 250, "size": 42},
         "preferences": {"w_price": 0.6, "w_delivery": 0.3, "w_warranty": 0.1},
     }
 
@@ -56,3 +61,73 @@ def test_vendor_matches_filters_by_category_and_region(client):
     assert data["items"][0]["rfo"]["id"] == match_rfo
     assert "category_match" in data["items"][0]["reasons"]
     assert "region_match" in data["items"][0]["reasons"]
+
+
+def test_vendor_matches_paginates_and_counts_in_sql(client, session, test_engine):
+    api_key = client.post("/v1/vendors/register", json={"name": "Acme"}).json()["api_key"]
+    client.put(
+        "/v1/vendors/me/profile",
+        json={"categories": ["sneakers", "boots"], "regions": []},
+        headers={"X-API-Key": api_key},
+    )
+    for index in range(7):
+        session.add(RFO(category=["sneakers", "boots", "bags"][index % 3], location="EU"))
+    session.add(RFO(category="sneakers", status="CLOSED"))
+    session.commit()
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM rfo" in statement:
+            statements.append(statement)
+
+    sa_event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        response = client.get(
+            "/v1/vendors/me/matches",
+            params={"limit": 2, "offset": 3},
+            headers={"X-API-Key": api_key},
+        )
+    finally:
+        sa_event.remove(test_engine, "before_cursor_execute", record)
+
+    data = response.json()
+    assert data["total"] == 5
+    assert len(data["items"]) == 2
+    assert all(item["rfo"]["category"] in {"sneakers", "boots"} for item in data["items"])
+    assert all(item["reasons"] == ["category_match"] for item in data["items"])
+    assert any("count(" in statement.lower() for statement in statements)
+    assert any("LIMIT" in statement and "OFFSET" in statement for statement in statements)
+
+
+def test_vendor_matches_exclude_unservable_rfos_and_sort_by_match_score(client, session):
+    api_key = client.post("/v1/vendors/register", json={"name": "Acme"}).json()["api_key"]
+    client.put(
+        "/v1/vendors/me/profile",
+        json={
+            "categories": ["sneakers"],
+            "regions": [],
+            "lead_time_days": 5,
+            "min_order_value": 100.0,
+        },
+        headers={"X-API-Key": api_key},
+    )
+    tight = RFO(category="sneakers", delivery_deadline_days=5, budget_max=100.0)
+    roomy = RFO(category="sneakers", delivery_deadline_days=20, budget_max=400.0)
+    unknown = RFO(category="sneakers")
+    too_fast = RFO(category="sneakers", delivery_deadline_days=3, budget_max=400.0)
+    too_small = RFO(category="sneakers", delivery_deadline_days=20, budget_max=50.0)
+    session.add_all([tight, roomy, unknown, too_fast, too_small])
+    session.commit()
+
+    recent = client.get("/v1/vendors/me/matches", headers={"X-API-Key": api_key}).json()
+    ranked = client.get(
+        "/v1/vendors/me/matches",
+        params={"sort": "match_score"},
+        headers={"X-API-Key": api_key},
+    ).json()
+
+    assert recent["total"] == 3
+    assert {item["rfo"]["id"] for item in recent["items"]} == {tight.id, roomy.id, unknown.id}
+    assert [item["rfo"]["id"] for item in ranked["items"]] == [roomy.id, unknown.id, tight.id]
+    assert [item["match_score"] for item in ranked["items"]] == [0.875, 0.5, 0.5]
+    assert ranked["items"][0]["reasons"] == ["category_match", "lead_time_fit", "order_value_fit"]
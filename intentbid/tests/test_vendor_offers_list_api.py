@@ -47,3 +47,46 @@ def test_vendor_offers_list_returns_request_summary(client):
     assert data["items"][0]["request"]["title"] == "Bulk sneakers"
     assert data["items"][0]["status"] == "submitted"
     assert data["items"][0]["is_awarded"] is False
+
+
+def test_vendor_offers_list_follows_cursor(client):
+    api_key = client.post("/v1/vendors/register", json={"name": "Acme"}).json()["api_key"]
+    headers = {"X-API-Key": api_key}
+    offer_ids = []
+    for index in range(3):
+        rfo_id = client.post(
+            "/v1/rfo",
+            json={
+                "category": "sneakers",
+                "constraints": {"budget_max": 120, "size": 42},
+                "preferences": {"w_price": 0.6, "w_delivery": 0.3, "w_warranty": 0.1},
+                "title": f"Request {index}",
+            },
+        ).json()["rfo_id"]
+        offer_response = client.post(
+            "/v1/offers",
+            json={
+                "rfo_id": rfo_id,
+                "price_amount": 99.0,
+                "currency": "USD",
+                "delivery_eta_days": 2,
+                "warranty_months": 12,
+                "return_days": 30,
+                "stock": True,
+            },
+            headers=headers,
+        )
+        offer_ids.append(offer_response.json()["offer_id"])
+
+    first = client.get("/v1/vendors/me/offers", params={"limit": 2}, headers=headers).json()
+    second = client.get(
+        "/v1/vendors/me/offers",
+        params={"limit": 2, "cursor": first["next_cursor"]},
+        headers=headers,
+    ).json()
+
+    assert first["total"] == 3
+    assert second["total"] is None
+    assert second["next_cursor"] is None
+    ids = [item["offer_id"] for item in first["items"] + second["items"]]
+    assert ids == sorted(offer_ids, reverse=True)
@@ -1,17 +1,40 @@
+import asyncio
 import hmac
 import json
 import hashlib
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 
 import httpx
-from sqlmodel import select
-
-from intentbid.app.db.models import EventOutbox, VendorWebhook
-from intentbid.app.services.webhook_service import dispatch_outbox
+import pytest
+from sqlalchemy import event as sa_event
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+
+from intentbid.app.core.config import settings
+from intentbid.app.db.models import EventOutbox, Vendor, VendorWebhook
+from intentbid.app.services.rfo_service import create_rfo
+from intentbid.app.services.vendor_service import upsert_vendor_profile
+from intentbid.app.workers import outbox_worker
+from intentbid.app.workers.outbox_worker import run_worker
+from intentbid.app.services.webhook_service import (
+    WebhookClientPool,
+    claim_outbox_batch,
+    deliver_events_async,
+    dispatch_outbox,
+    dispatch_outbox_async,
+    enqueue_event,
+)
 
 
 def _create_vendor_and_rfo(client):
     vendor_response = client.post("/v1/vendors/register", json={"name": "Acme"})
     vendor_payload = vendor_response.json()
+    client.put(
+        "/v1/vendors/me/profile",
+        json={"categories": ["sneakers"], "regions": []},
+        headers={"X-API-Key": vendor_payload["api_key"]},
+    )
 
     rfo_payload = {
         "category": "sneakers",
@@ -151,3 +174,520 @@ def test_rfo_awarded_event_enqueued(client, session):
     assert event is not None
     assert event.payload["rfo_id"] == rfo_id
     assert event.payload["offer_id"] == offer_id
+
+
+def test_rfo_created_event_fans_out_with_single_insert(session, test_engine):
+    vendors = [Vendor(name=f"Vendor {index}", api_key_hash=f"hash-{index}") for index in range(25)]
+    session.add_all(vendors)
+    session.commit()
+    for index, vendor in enumerate(vendors[:20]):
+        categories = ["sneakers"] if index % 2 else []
+        upsert_vendor_profile(session, vendor.id, categories, [], None, None)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(test_engine, "before_cursor_execute", record)
+    rfo = create_rfo(session, "sneakers", {"budget_max": 120}, {})
+    sa_event.remove(test_engine, "before_cursor_execute", record)
+
+    outbox_inserts = [
+        statement for statement in statements if statement.startswith("INSERT INTO event_outbox")
+    ]
+    events = session.exec(
+        select(EventOutbox).where(EventOutbox.event_type == "rfo.created")
+    ).all()
+    assert len(outbox_inserts) == 1
+    assert len(events) == 20
+    assert {outbox_event.payload["rfo_id"] for outbox_event in events} == {rfo.id}
+    assert all(outbox_event.status == "pending" for outbox_event in events)
+
+
+def test_rfo_events_target_matching_profiles_and_bidders(client, session):
+    api_key, vendor_id, rfo_id = _create_vendor_and_rfo(client)
+    other = client.post("/v1/vendors/register", json={"name": "Boots Inc"}).json()
+    client.put(
+        "/v1/vendors/me/profile",
+        json={"categories": ["boots"], "regions": ["EU"]},
+        headers={"X-API-Key": other["api_key"]},
+    )
+    boots_response = client.post(
+        "/v1/rfo",
+        json={"category": "boots", "location": "US", "constraints": {}, "preferences": {}},
+    )
+    assert boots_response.status_code == 200
+    _submit_offer(client, other["api_key"], rfo_id)
+    client.post(f"/v1/rfo/{rfo_id}/close")
+
+    def event_types(target_vendor_id):
+        return sorted(
+            outbox_event.event_type
+            for outbox_event in session.exec(
+                select(EventOutbox).where(
+                    EventOutbox.vendor_id == target_vendor_id,
+                    EventOutbox.event_type.startswith("rfo."),
+                )
+            ).all()
+        )
+
+    assert event_types(vendor_id) == ["rfo.closed", "rfo.created"]
+    assert event_types(other["vendor_id"]) == ["rfo.closed"]
+
+
+def test_rfo_events_skip_vendors_excluded_by_lead_time_or_order_value(session):
+    vendors = []
+    for name, lead_time_days, min_order_value in (
+        ("Fast", 2, None),
+        ("Slow", 10, None),
+        ("Bulk", None, 5000),
+    ):
+        vendor = Vendor(name=name, api_key_hash=f"hash-{name}")
+        session.add(vendor)
+        session.commit()
+        upsert_vendor_profile(
+            session,
+            vendor.id,
+            categories=["sneakers"],
+            regions=[],
+            lead_time_days=lead_time_days,
+            min_order_value=min_order_value,
+        )
+        vendors.append(vendor.id)
+
+    create_rfo(
+        session,
+        "sneakers",
+        {"budget_max": 1000, "delivery_deadline_days": 5},
+        {},
+    )
+
+    recipients = session.exec(
+        select(EventOutbox.vendor_id).where(EventOutbox.event_type == "rfo.created")
+    ).all()
+    assert recipients == [vendors[0]]
+
+
+def _seed_webhook_events(session, vendors, events_per_vendor):
+    webhooks = []
+    for index in range(vendors):
+        vendor = Vendor(name=f"Hooked {index}", api_key_hash=f"hooked-{index}")
+        session.add(vendor)
+        session.commit()
+        webhook = VendorWebhook(
+            vendor_id=vendor.id,
+            url=f"https://hooks-{index % 2}.example.com/webhook",
+            secret=f"secret-{index}",
+            is_active=True,
+        )
+        session.add(webhook)
+        for event_index in range(events_per_vendor):
+            enqueue_event(
+                session,
+                vendor_id=vendor.id,
+                event_type="offer.created",
+                payload={"offer_id": event_index},
+                commit=False,
+            )
+        webhooks.append(webhook)
+    session.commit()
+    return webhooks
+
+
+@pytest.mark.anyio
+async def test_async_dispatch_bounds_per_host_concurrency(session):
+    _seed_webhook_events(session, vendors=4, events_per_vendor=5)
+    in_flight = defaultdict(int)
+    peak = defaultdict(int)
+
+    async def handler(request):
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    async with WebhookClientPool(transport=httpx.MockTransport(handler)) as pool:
+        delivered = await dispatch_outbox_async(
+            session,
+            pool,
+            max_concurrency=8,
+            max_concurrency_per_host=3,
+            commit_batch_size=7,
+        )
+        hosts = pool.hosts
+
+    events = session.exec(select(EventOutbox)).all()
+    assert delivered == 20
+    assert all(outbox_event.status == "delivered" for outbox_event in events)
+    assert set(peak) == {"hooks-0.example.com", "hooks-1.example.com"}
+    assert max(peak.values()) == 3
+    assert sorted(hosts) == ["hooks-0.example.com", "hooks-1.example.com"]
+
+
+@pytest.mark.anyio
+async def test_async_dispatch_reschedules_failed_deliveries(session):
+    _seed_webhook_events(session, vendors=2, events_per_vendor=1)
+
+    def handler(request):
+        if request.url.host == "hooks-1.example.com":
+            return httpx.Response(503)
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        delivered = await dispatch_outbox_async(session, client)
+
+    failed = session.exec(select(EventOutbox).where(EventOutbox.status == "pending")).one()
+    assert delivered == 1
+    assert failed.attempts == 1
+    assert failed.last_error == "status_503"
+    assert failed.next_attempt_at is not None
+
+
+def test_claim_outbox_batch_leases_disjoint_events(session):
+    _seed_webhook_events(session, vendors=2, events_per_vendor=3)
+
+    first = claim_outbox_batch(session, "worker-a", batch_size=4)
+    second = claim_outbox_batch(session, "worker-b", batch_size=4)
+    third = claim_outbox_batch(session, "worker-c", batch_size=4)
+
+    first_ids = {outbox_event.id for outbox_event in first}
+    second_ids = {outbox_event.id for outbox_event in second}
+    assert len(first_ids) == 4
+    assert len(second_ids) == 2
+    assert not first_ids & second_ids
+    assert third == []
+
+
+def test_claim_outbox_batch_reclaims_expired_leases(session):
+    _seed_webhook_events(session, vendors=1, events_per_vendor=2)
+    claim_outbox_batch(session, "worker-a", lease_seconds=30)
+
+    later = datetime.now(timezone.utc) + timedelta(seconds=31)
+    reclaimed = claim_outbox_batch(session, "worker-b", now=later)
+
+    assert [outbox_event.locked_by for outbox_event in reclaimed] == ["worker-b", "worker-b"]
+
+
+@pytest.mark.anyio
+async def test_events_without_active_webhook_are_not_reclaimed(session):
+    vendor = Vendor(name="Unhooked", api_key_hash="unhooked")
+    session.add(vendor)
+    session.commit()
+    for event_index in range(3):
+        enqueue_event(
+            session,
+            vendor_id=vendor.id,
+            event_type="offer.created",
+            payload={"offer_id": event_index},
+            commit=False,
+        )
+    session.commit()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+    claimed = claim_outbox_batch(session, "worker-a", lease_seconds=30)
+    async with httpx.AsyncClient(transport=transport) as client:
+        delivered = await deliver_events_async(session, client, claimed)
+    later = datetime.now(timezone.utc) + timedelta(seconds=31)
+    reclaimed = claim_outbox_batch(session, "worker-b", now=later)
+
+    events = session.exec(select(EventOutbox)).all()
+    assert len(claimed) == 3
+    assert delivered == 0
+    assert reclaimed == []
+    assert {outbox_event.status for outbox_event in events} == {"skipped"}
+    assert {outbox_event.last_error for outbox_event in events} == {"no_active_webhook"}
+    assert all(outbox_event.locked_until is None for outbox_event in events)
+
+
+@pytest.mark.anyio
+async def test_outbox_workers_drain_without_double_delivery(session, test_engine):
+    _seed_webhook_events(session, vendors=3, events_per_vendor=10)
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["X-IntentBid-Signature"])
+        return httpx.Response(200)
+
+    stop = asyncio.Event()
+    async with WebhookClientPool(transport=httpx.MockTransport(handler)) as pool:
+        results = await asyncio.gather(
+            *(
+                run_worker(
+                    lambda: Session(test_engine),
+                    pool,
+                    stop,
+                    worker_id=f"worker-{index}",
+                    batch_size=4,
+                    exit_when_idle=True,
+                )
+                for index in range(3)
+            )
+        )
+
+    session.expire_all()
+    events = session.exec(select(EventOutbox)).all()
+    assert sum(results) == 30
+    assert len(seen) == len(set(seen)) == 30
+    assert all(outbox_event.status == "delivered" for outbox_event in events)
+    assert all(outbox_event.locked_by is None for outbox_event in events)
+
+
+@pytest.mark.anyio
+async def test_outbox_worker_survives_transient_database_error(session, test_engine, monkeypatch):
+    _seed_webhook_events(session, vendors=1, events_per_vendor=3)
+    claim_calls = []
+
+    def flaky_claim(*args, **kwargs):
+        claim_calls.append(args)
+        if len(claim_calls) == 1:
+            raise OperationalError("SELECT 1", {}, Exception("connection dropped"))
+        return claim_outbox_batch(*args, **kwargs)
+
+    monkeypatch.setattr(outbox_worker, "claim_outbox_batch", flaky_claim)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    async with WebhookClientPool(transport=transport) as pool:
+        delivered = await run_worker(
+            lambda: Session(test_engine),
+            pool,
+            asyncio.Event(),
+            worker_id="worker-flaky",
+            poll_interval=0,
+            exit_when_idle=True,
+        )
+
+    session.expire_all()
+    events = session.exec(select(EventOutbox)).all()
+    assert delivered == 3
+    assert len(claim_calls) == 3
+    assert all(outbox_event.status == "delivered" for outbox_event in events)
+
+
+def test_dispatch_loads_only_due_events_in_keyset_batches(session, monkeypatch):
+    monkeypatch.setattr(settings, "outbox_batch_size", 2)
+    _seed_webhook_events(session, vendors=1, events_per_vendor=8)
+    future = datetime.now(timezone.utc) + timedelta(minutes=5)
+    for outbox_event in session.exec(select(EventOutbox).where(EventOutbox.id > 3)).all():
+        outbox_event.next_attempt_at = future
+        session.add(outbox_event)
+    session.commit()
+    session.expunge_all()
+    loaded = []
+
+    def record_load(target, context):
+        loaded.append(target.id)
+
+    sa_event.listen(EventOutbox, "load", record_load)
+    try:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        delivered = dispatch_outbox(session, httpx.Client(transport=transport))
+    finally:
+        sa_event.remove(EventOutbox, "load", record_load)
+
+    assert delivered == 3
+    assert sorted(set(loaded)) == [1, 2, 3]
+
+
+def test_dispatch_resolves_webhooks_once_per_batch(session, test_engine, monkeypatch):
+    monkeypatch.setattr(settings, "outbox_batch_size", 10)
+    _seed_webhook_events(session, vendors=4, events_per_vendor=5)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        delivered = dispatch_outbox(session, httpx.Client(transport=transport))
+    finally:
+        sa_event.remove(test_engine, "before_cursor_execute", record)
+
+    webhook_selects = [
+        statement
+        for statement in statements
+        if statement.startswith("SELECT") and "FROM vendor_webhook" in statement
+    ]
+    assert delivered == 20
+    assert len(webhook_selects) == 2
+
+
+def test_batched_webhook_receives_signed_event_array(client, session):
+    api_key, vendor_id, _ = _create_vendor_and_rfo(client)
+    webhook_payload = client.post(
+        "/v1/vendors/webhooks",
+        json={"url": "https://example.com/batch", "batch_max_events": 3},
+        headers={"X-API-Key": api_key},
+    ).json()
+    assert webhook_payload["batch_max_events"] == 3
+    for index in range(5):
+        enqueue_event(session, vendor_id=vendor_id, event_type="offer.created", payload={"offer_id": index})
+    bodies = []
+
+    def handler(request):
+        raw = request.content.decode("utf-8")
+        expected = hmac.new(
+            webhook_payload["secret"].encode("utf-8"),
+            raw.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        assert request.headers["X-IntentBid-Signature"] == expected
+        bodies.append(json.loads(raw))
+        return httpx.Response(200)
+
+    delivered = dispatch_outbox(session, httpx.Client(transport=httpx.MockTransport(handler)))
+
+    assert delivered == 5
+    assert [len(body["events"]) for body in bodies] == [3, 2]
+    assert [item["data"]["offer_id"] for body in bodies for item in body["events"]] == list(range(5))
+
+
+def test_batched_webhook_retries_only_failed_events(session):
+    webhook = _seed_webhook_events(session, vendors=1, events_per_vendor=4)[0]
+    webhook.batch_max_events = 10
+    session.add(webhook)
+    session.commit()
+
+    def handler(request):
+        event_ids = [item["event_id"] for item in json.loads(request.content)["events"]]
+        return httpx.Response(200, json={"failed_event_ids": event_ids[1:3]})
+
+    delivered = dispatch_outbox(session, httpx.Client(transport=httpx.MockTransport(handler)))
+
+    events = session.exec(select(EventOutbox).order_by(EventOutbox.id)).all()
+    assert delivered == 2
+    assert [outbox_event.status for outbox_event in events] == [
+        "delivered",
+        "pending",
+        "pending",
+        "delivered",
+    ]
+    assert events[1].last_error == "rejected_by_receiver"
+    assert events[1].attempts == 1
+
+
+def test_batched_webhook_honours_rejection_of_single_event_batch(session):
+    webhook = _seed_webhook_events(session, vendors=1, events_per_vendor=1)[0]
+    webhook.batch_max_events = 10
+    session.add(webhook)
+    session.commit()
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(200, json={"failed_event_ids": [body["events"][0]["event_id"]]})
+
+    delivered = dispatch_outbox(session, httpx.Client(transport=httpx.MockTransport(handler)))
+
+    event = session.exec(select(EventOutbox)).one()
+    assert delivered == 0
+    assert len(bodies[0]["events"]) == 1
+    assert event.status == "pending"
+    assert event.last_error == "rejected_by_receiver"
+    assert event.attempts == 1
+
+
+def test_circuit_opens_after_consecutive_failures_and_defers_events(session, monkeypatch):
+    monkeypatch.setattr(settings, "webhook_circuit_failure_threshold", 3)
+    monkeypatch.setattr(settings, "webhook_retry_base_seconds", 0)
+    webhook = _seed_webhook_events(session, vendors=1, events_per_vendor=4)[0]
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    transport = httpx.MockTransport(handler)
+    dispatch_outbox(session, httpx.Client(transport=transport), max_attempts=10)
+    session.refresh(webhook)
+    open_until = webhook.circuit_open_until
+    later = datetime.now(timezone.utc) + timedelta(seconds=1)
+    dispatch_outbox(session, httpx.Client(transport=transport), max_attempts=10, now=later)
+
+    events = session.exec(select(EventOutbox).order_by(EventOutbox.id)).all()
+    assert len(calls) == 3
+    assert webhook.consecutive_failures == 3
+    assert open_until > datetime.now(timezone.utc)
+    assert [outbox_event.attempts for outbox_event in events] == [1, 1, 1, 0]
+    assert all(
+        outbox_event.next_attempt_at.replace(tzinfo=timezone.utc) == open_until
+        for outbox_event in events
+    )
+
+
+@pytest.mark.anyio
+async def test_async_dispatch_stops_calling_endpoint_once_circuit_trips(session, monkeypatch):
+    monkeypatch.setattr(settings, "webhook_circuit_failure_threshold", 2)
+    webhook = _seed_webhook_events(session, vendors=1, events_per_vendor=5)[0]
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await dispatch_outbox_async(session, client, max_concurrency_per_host=1)
+
+    events = session.exec(select(EventOutbox).order_by(EventOutbox.id)).all()
+    assert len(calls) == 2
+    assert webhook.consecutive_failures == 2
+    assert [outbox_event.attempts for outbox_event in events] == [1, 1, 0, 0, 0]
+    assert all(
+        outbox_event.next_attempt_at.replace(tzinfo=timezone.utc)
+        == webhook.circuit_open_until.replace(tzinfo=timezone.utc)
+        for outbox_event in events[2:]
+    )
+
+
+def test_half_open_probe_closes_circuit_on_success(session):
+    webhook = _seed_webhook_events(session, vendors=1, events_per_vendor=3)[0]
+    webhook.consecutive_failures = settings.webhook_circuit_failure_threshold
+    webhook.circuit_open_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+    session.add(webhook)
+    session.commit()
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200)
+
+    first = dispatch_outbox(session, httpx.Client(transport=httpx.MockTransport(handler)))
+    session.refresh(webhook)
+    second = dispatch_outbox(session, httpx.Client(transport=httpx.MockTransport(handler)))
+
+    assert first == 1
+    assert webhook.consecutive_failures == 0
+    assert webhook.circuit_open_until is None
+    assert second == 2
+    assert len(calls) == 3
+
+
+def test_event_is_dead_lettered_after_max_attempts(session):
+    _seed_webhook_events(session, vendors=1, events_per_vendor=1)
+    transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+    dispatch_outbox(session, httpx.Client(transport=transport), max_attempts=1)
+
+    event = session.exec(select(EventOutbox)).one()
+    assert event.status == "dead"
+    assert event.attempts == 1
+    assert event.last_error == "status_500"
+
+
+def test_register_webhook_marks_events_queued_before_registration_delivered(client, session):
+    api_key, vendor_id, _ = _create_vendor_and_rfo(client)
+    assert session.exec(select(EventOutbox).where(EventOutbox.vendor_id == vendor_id)).all()
+
+    client.post(
+        "/v1/vendors/webhooks",
+        json={"url": "https://example.com/webhook"},
+        headers={"X-API-Key": api_key},
+    )
+
+    session.expire_all()
+    events = session.exec(select(EventOutbox).where(EventOutbox.vendor_id == vendor_id)).all()
+    assert events
+    assert {outbox_event.status for outbox_event in events} == {"delivered"}
+    assert all(outbox_event.delivered_at is not None for outbox_event in events)